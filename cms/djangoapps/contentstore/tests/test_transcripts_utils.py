@@ -6,10 +6,12 @@ import unittest
 from uuid import uuid4
 
 from django.conf import settings
+from django.core.cache.backends.locmem import LocMemCache
 from django.test.utils import override_settings
 from django.utils import translation
 from mock import Mock, patch
 from nose.plugins.skip import SkipTest
+from opaque_keys.edx.locator import CourseLocator
 
 from contentstore.tests.utils import mock_requests_get
 from xmodule.contentstore.content import StaticContent
@@ -632,6 +634,26 @@ class TestTranscript(unittest.TestCase):
         with self.assertRaises(NotImplementedError):
             transcripts_utils.Transcript.convert(self.srt_transcript, 'srt', 'sjson')
 
+    def test_convert_asset_is_cached(self):
+        asset = StaticContent(
+            StaticContent.compute_location(CourseLocator('org', 'course', 'run'), 'subs_video.srt.sjson'),
+            'subs_video.srt.sjson', 'application/json', self.sjson_transcript, content_digest='digest'
+        )
+        with patch.object(transcripts_utils, 'cache', LocMemCache('transcripts', {})):
+            with patch.object(
+                transcripts_utils.Transcript, 'convert', wraps=transcripts_utils.Transcript.convert
+            ) as mock_convert:
+                for __ in range(2):
+                    self.assertEqual(
+                        transcripts_utils.Transcript.convert_asset(asset, 'sjson', 'srt'), self.srt_transcript
+                    )
+                self.assertEqual(mock_convert.call_count, 1)
+
+                # A new version of the asset is converted again.
+                asset.content_digest = 'new_digest'
+                transcripts_utils.Transcript.convert_asset(asset, 'sjson', 'srt')
+                self.assertEqual(mock_convert.call_count, 2)
+
 
 class TestSubsFilename(unittest.TestCase):
     """
@@ -1,6 +1,9 @@
+import base64
 import json
 import logging
 import math
+import re
+from datetime import datetime
 from functools import partial
 
 from django.conf import settings
@@ -48,6 +51,11 @@ def assets_handler(request, course_key_string=None, asset_key_string=None):
             page_size: the number of items per page (defaults to 50)
             sort: the asset field to sort by (defaults to "date_added")
             direction: the sort direction (defaults to "descending")
+            asset_type: the type of assets to return (defaults to all assets)
+            cursor: the nextCursor of the previous page, to fetch the page after it without skipping
+                over all of the assets before it (page should still be the number of this page)
+            approximate_count: if "true", totalCount is only counted as far as this page, plus one if
+                there are more assets after it
     POST
         json: create (or update?) an asset. The only updating that can be done is changing the lock state.
     PUT
@@ -104,22 +112,12 @@ def _assets_json(request, course_key):
     filter_params = None
     if requested_filter:
         if requested_filter == 'OTHER':
-            all_filters = settings.FILES_AND_UPLOAD_TYPE_FILTERS
-            where = []
-            for all_filter in all_filters:
-                extension_filters = all_filters[all_filter]
-                where.extend(
-                    ["JSON.stringify(this.contentType).toUpperCase() != JSON.stringify('{}').toUpperCase()".format(
-                        extension_filter) for extension_filter in extension_filters])
-            filter_params = {
-                "$where": ' && '.join(where),
-            }
+            all_file_types = []
+            for file_types in settings.FILES_AND_UPLOAD_TYPE_FILTERS.values():
+                all_file_types.extend(file_types)
+            filter_params = {'contentType': {'$nin': _content_type_patterns(all_file_types)}}
         else:
-            where = ["JSON.stringify(this.contentType).toUpperCase() == JSON.stringify('{}').toUpperCase()".format(
-                req_filter) for req_filter in requested_file_types]
-            filter_params = {
-                "$where": ' || '.join(where),
-            }
+            filter_params = {'contentType': {'$in': _content_type_patterns(requested_file_types or [])}}
 
     sort_direction = DESCENDING
     if request.GET.get('direction', '').lower() == 'asc':
@@ -132,20 +130,29 @@ def _assets_json(request, course_key):
         requested_sort = 'displayname'
     sort = [(requested_sort, sort_direction)]
 
+    after = None
+    if request.GET.get('cursor'):
+        try:
+            after = _decode_asset_cursor(request.GET['cursor'], requested_sort)
+        except ValueError:
+            return HttpResponseBadRequest()
+
     current_page = max(requested_page, 0)
     start = current_page * requested_page_size
     options = {
         'current_page': current_page,
         'page_size': requested_page_size,
         'sort': sort,
-        'filter_params': filter_params
+        'filter_params': filter_params,
+        'after': after,
+        'approximate_count': request.GET.get('approximate_count', '').lower() == 'true',
     }
     assets, total_count = _get_assets_for_page(request, course_key, options)
     end = start + len(assets)
 
     # If the query is beyond the final page, then re-query the final page so
     # that at least one asset is returned
-    if requested_page > 0 and start >= total_count:
+    if after is None and requested_page > 0 and start >= total_count:
         options['current_page'] = current_page = int(math.floor((total_count - 1) / requested_page_size))
         start = current_page * requested_page_size
         assets, total_count = _get_assets_for_page(request, course_key, options)
@@ -179,9 +186,48 @@ def _assets_json(request, course_key):
         'totalCount': total_count,
         'assets': asset_json,
         'sort': requested_sort,
+        'nextCursor': (
+            _encode_asset_cursor(assets[-1], requested_sort) if len(assets) == requested_page_size else None
+        ),
     })
 
 
+def _content_type_patterns(content_types):
+    """
+    Returns patterns matching each of the given content types, ignoring case.
+    """
+    return [re.compile(u'^{}$'.format(re.escape(content_type)), re.IGNORECASE) for content_type in content_types]
+
+
+# The format of uploadDate values in asset cursors.
+CURSOR_DATE_FORMAT = '%Y-%m-%dT%H:%M:%S.%f'
+
+
+def _encode_asset_cursor(asset, sort_field):
+    """
+    Returns the opaque cursor for the assets which come after `asset` when sorted on `sort_field`.
+    """
+    value = asset.get(sort_field)
+    if isinstance(value, datetime):
+        value = value.strftime(CURSOR_DATE_FORMAT)
+    return base64.urlsafe_b64encode(json.dumps([value, asset['filename']]))
+
+
+def _decode_asset_cursor(cursor, sort_field):
+    """
+    Returns the (sort field value, filename) encoded in `cursor`.
+
+    Raises ValueError if the cursor is malformed.
+    """
+    try:
+        value, filename = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+        if sort_field == 'uploadDate':
+            value = datetime.strptime(value, CURSOR_DATE_FORMAT)
+    except (TypeError, UnicodeError, ValueError):
+        raise ValueError('Invalid asset cursor: {}'.format(cursor))
+    return value, filename
+
+
 def _get_assets_for_page(request, course_key, options):
     """
     Returns the list of assets for the specified page and page size.
@@ -193,7 +239,8 @@ def _get_assets_for_page(request, course_key, options):
     start = current_page * page_size
 
     return contentstore().get_all_content_for_course(
-        course_key, start=start, maxresults=page_size, sort=sort, filter_params=filter_params
+        course_key, start=start, maxresults=page_size, sort=sort, filter_params=filter_params,
+        after=options.get('after'), approximate_count=options.get('approximate_count', False)
     )
 
 
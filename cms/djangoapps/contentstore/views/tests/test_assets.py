@@ -183,6 +183,42 @@ class PaginationTestCase(AssetsTestCase):
         self.assert_correct_asset_response(
             self.url + "?page_size=3&page=1", 3, 1, 4)
 
+    def test_cursor_pagination(self):
+        """
+        Test paging through the assets with the cursor of each page
+        """
+        for index in range(5):
+            self.upload_asset("asset-{}".format(index))
+
+        for sort in ('date_added', 'display_name'):
+            url = self.url + '?page_size=2&sort={}'.format(sort)
+            resp = self.client.get(url, HTTP_ACCEPT='application/json')
+            expected = [asset['id'] for asset in json.loads(resp.content)['assets']]
+            for page in (1, 2):
+                resp = self.client.get(url + '&page={}'.format(page), HTTP_ACCEPT='application/json')
+                expected.extend(asset['id'] for asset in json.loads(resp.content)['assets'])
+
+            paged = []
+            cursor = None
+            for page in (0, 1, 2):
+                page_url = url + '&page={}&approximate_count=true'.format(page)
+                if cursor:
+                    page_url += '&cursor={}'.format(cursor)
+                json_response = json.loads(self.client.get(page_url, HTTP_ACCEPT='application/json').content)
+                self.assertEqual(json_response['start'], page * 2)
+                paged.extend(asset['id'] for asset in json_response['assets'])
+                cursor = json_response['nextCursor']
+            self.assertIsNone(cursor)
+            self.assertEqual(json_response['totalCount'], 5)
+            self.assertEqual(paged, expected)
+
+    def test_invalid_cursor(self):
+        """
+        Test that a malformed cursor is rejected
+        """
+        resp = self.client.get(self.url + '?cursor=not-a-cursor', HTTP_ACCEPT='application/json')
+        self.assertEqual(resp.status_code, 400)
+
     @mock.patch('xmodule.contentstore.mongo.MongoContentStore.get_all_content_for_course')
     def test_mocked_filtered_response(self, mock_get_all_content_for_course):
         """
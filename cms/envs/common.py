@@ -298,6 +298,10 @@ GEOIPV6_PATH = REPO_ROOT / "common/static/data/geoip/GeoIPv6.dat"
 # TODO: Move the Mako templating into a different engine in TEMPLATES below.
 import tempfile
 MAKO_MODULE_DIR = os.path.join(tempfile.gettempdir(), 'mako_cms')
+# (namespace, template name) pairs to load while the process starts. Run the
+# precompile_mako_templates management command during deployment so that these
+# are imported from MAKO_MODULE_DIR rather than compiled.
+MAKO_PRELOAD_TEMPLATES = []
 MAKO_TEMPLATES = {}
 MAKO_TEMPLATES['main'] = [
     PROJECT_ROOT / 'templates',
@@ -1,3 +1,4 @@
+import hashlib
 import logging
 
 from django.conf import settings
@@ -42,8 +43,11 @@ class MakoLoader(object):
         source, file_path = self.load_template_source(template_name, template_dirs)
 
         # In order to allow dynamic template overrides, we need to cache templates based on their absolute paths
-        # rather than relative paths, overriding templates would have same relative paths.
-        module_directory = self.module_directory.rstrip("/") + "/{dir_hash}/".format(dir_hash=hash(file_path))
+        # rather than relative paths, overriding templates would have same relative paths. The hash has to be
+        # stable across processes so that modules compiled by one worker are reused by the others.
+        module_directory = self.module_directory.rstrip("/") + "/{dir_hash}/".format(
+            dir_hash=hashlib.md5(file_path.encode('utf-8')).hexdigest()
+        )
 
         if source.startswith("## mako\n"):
             # This is a mako template
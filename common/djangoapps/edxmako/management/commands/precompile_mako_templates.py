@@ -0,0 +1,90 @@
+"""
+Management command for compiling every mako template into MAKO_MODULE_DIR.
+
+Run it during deployment, with the same settings as the workers, so that
+workers import compiled template modules instead of compiling templates on
+their first requests:
+
+    ./manage.py lms precompile_mako_templates --settings=aws
+"""
+import logging
+import os
+import time
+
+from django.core.management import BaseCommand
+
+from edxmako import LOOKUP
+from edxmako.paths import find_templates
+from openedx.core.djangoapps.theming.helpers import get_themes
+
+log = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """
+    Compile the mako templates of every lookup namespace and every theme.
+    """
+
+    help = 'Compile mako templates for all lookup namespaces and themes into MAKO_MODULE_DIR.'
+
+    requires_system_checks = False
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--namespaces',
+            nargs='+',
+            default=None,
+            help="Lookup namespaces to compile (default: all of them).",
+        )
+        parser.add_argument(
+            '--patterns',
+            nargs='+',
+            default=['*.html'],
+            help="Glob patterns of the template files to compile.",
+        )
+
+    def handle(self, *args, **options):
+        namespaces = options['namespaces'] or sorted(LOOKUP)
+        themes = get_themes()
+
+        start = time.time()
+        compiled = failed = 0
+        for namespace in namespaces:
+            lookup = LOOKUP[namespace]
+            theme_base_dirs = [
+                os.path.normpath(theme.themes_base_dir) for theme in themes
+                if os.path.normpath(theme.themes_base_dir) in lookup.directories
+            ]
+            for uri in self.template_uris(lookup, options['patterns'], themes, theme_base_dirs):
+                try:
+                    lookup.compile_template(uri)
+                except Exception:  # pylint: disable=broad-except
+                    # Not everything matching the patterns is a mako template, e.g. underscore templates.
+                    log.debug("Could not compile %s:%s", namespace, uri, exc_info=True)
+                    failed += 1
+                else:
+                    compiled += 1
+
+        self.stdout.write(
+            "Compiled {compiled} templates ({failed} skipped) in {seconds:.1f} seconds\n".format(
+                compiled=compiled, failed=failed, seconds=time.time() - start,
+            )
+        )
+
+    @staticmethod
+    def template_uris(lookup, patterns, themes, theme_base_dirs):
+        """
+        Yield the uris of the templates in `lookup`, using the themed uris that
+        `DynamicTemplateLookup.get_template` requests for the templates in themes.
+        """
+        for directory in lookup.directories:
+            if directory not in theme_base_dirs:
+                for uri in find_templates(directory, patterns):
+                    yield uri
+
+        for theme in themes:
+            if os.path.normpath(theme.themes_base_dir) not in theme_base_dirs:
+                continue
+            for template_dir in theme.template_dirs:
+                for uri in find_templates(template_dir, patterns):
+                    yield str(theme.template_path / uri)
@@ -3,14 +3,17 @@ Set up lookup paths for mako templates.
 """
 
 import contextlib
+import fnmatch
 import hashlib
 import os
+import time
 
 import pkg_resources
 from django.conf import settings
 from mako.exceptions import TopLevelLookupException
 from mako.lookup import TemplateLookup
 
+from openedx.core.djangoapps import monitoring_utils
 from openedx.core.djangoapps.theming.helpers import get_template as themed_template
 from openedx.core.djangoapps.theming.helpers import get_template_path_with_theme, strip_site_theme_templates_path
 
@@ -76,6 +79,36 @@ class DynamicTemplateLookup(TemplateLookup):
 
         return template
 
+    def _load(self, filename, uri):
+        """
+        Load (compiling if needed) the template at `filename`, reporting how long
+        it took so that cold template loads show up in request metrics.
+        """
+        start = time.time()
+        template = super(DynamicTemplateLookup, self)._load(filename, uri)
+        monitoring_utils.accumulate('mako.template_load_seconds', time.time() - start)
+        monitoring_utils.increment('mako.templates_loaded')
+        return template
+
+    def compile_template(self, uri):
+        """
+        Compile the template at `uri`, relative to the lookup directories, into
+        the module directory without applying any theme or microsite overrides.
+        """
+        return super(DynamicTemplateLookup, self).get_template(uri)
+
+
+def find_templates(directory, patterns):
+    """
+    Yield the path, relative to `directory`, of every file below it whose name
+    matches one of the glob `patterns`.
+    """
+    for root, dirs, files in os.walk(directory):
+        dirs.sort()
+        for filename in sorted(files):
+            if any(fnmatch.fnmatch(filename, pattern) for pattern in patterns):
+                yield os.path.relpath(os.path.join(root, filename), directory)
+
 
 def clear_lookups(namespace):
     """
@@ -1,9 +1,14 @@
 """
 Initialize the mako template lookup
 """
+import logging
+import time
+
 from django.conf import settings
 
-from . import add_lookup, clear_lookups
+from . import add_lookup, clear_lookups, lookup_template
+
+log = logging.getLogger(__name__)
 
 
 def run():
@@ -18,3 +23,24 @@ def run():
         clear_lookups(namespace)
         for directory in directories:
             add_lookup(namespace, directory)
+
+    preload_templates()
+
+
+def preload_templates():
+    """
+    Load the templates named in settings.MAKO_PRELOAD_TEMPLATES, so that they are
+    imported from the module directory (as written by the precompile_mako_templates
+    command) while the worker starts rather than on its first requests.
+    """
+    templates = getattr(settings, 'MAKO_PRELOAD_TEMPLATES', [])
+    if not templates:
+        return
+
+    start = time.time()
+    for namespace, name in templates:
+        try:
+            lookup_template(namespace, name)
+        except Exception:  # pylint: disable=broad-except
+            log.exception("Could not preload mako template %s:%s", namespace, name)
+    log.info("Preloaded %d mako templates in %.3f seconds", len(templates), time.time() - start)
@@ -1,7 +1,11 @@
+import os
+import shutil
+import tempfile
 import unittest
 
 import ddt
 from django.conf import settings
+from django.core.management import call_command
 from django.core.urlresolvers import reverse
 from django.http import HttpResponse
 from django.test import TestCase
@@ -76,6 +80,44 @@ class AddLookupTests(TestCase):
         self.assertTrue(dirs[0].endswith('management'))
 
 
+class PrecompileMakoTemplatesTests(TestCase):
+    """
+    Test the `precompile_mako_templates` management command.
+    """
+    def setUp(self):
+        super(PrecompileMakoTemplatesTests, self).setUp()
+        self.template_dir = tempfile.mkdtemp()
+        self.module_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.template_dir)
+        self.addCleanup(shutil.rmtree, self.module_dir)
+        os.mkdir(os.path.join(self.template_dir, 'nested'))
+        for name in ('page.html', os.path.join('nested', 'widget.html'), 'notes.txt'):
+            with open(os.path.join(self.template_dir, name), 'w') as template:
+                template.write('<p>${1 + 1}</p>')
+
+    def compiled_modules(self):
+        """
+        Return the names of the compiled template modules in the module directory.
+        """
+        return sorted(
+            name for __, __, files in os.walk(self.module_dir) for name in files if name.endswith('.py')
+        )
+
+    @patch.dict(LOOKUP)
+    def test_compiles_templates(self):
+        with override_settings(MAKO_MODULE_DIR=self.module_dir):
+            add_lookup('precompile', self.template_dir)
+        call_command('precompile_mako_templates', namespaces=['precompile'])
+        self.assertEqual(self.compiled_modules(), ['page.html.py', 'widget.html.py'])
+
+    @patch.dict(LOOKUP)
+    def test_compiles_matching_patterns(self):
+        with override_settings(MAKO_MODULE_DIR=self.module_dir):
+            add_lookup('precompile', self.template_dir)
+        call_command('precompile_mako_templates', namespaces=['precompile'], patterns=['*.txt'])
+        self.assertEqual(self.compiled_modules(), ['notes.txt.py'])
+
+
 class MakoRequestContextTest(TestCase):
     """
     Test MakoMiddleware.
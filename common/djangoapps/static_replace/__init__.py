@@ -1,5 +1,6 @@
 import logging
 import re
+import weakref
 
 from django.contrib.staticfiles.storage import staticfiles_storage
 from django.contrib.staticfiles import finders
@@ -15,6 +16,16 @@ from opaque_keys.edx.locator import AssetLocator
 log = logging.getLogger(__name__)
 XBLOCK_STATIC_RESOURCE_PREFIX = '/static/xblock'
 
+# Compiled `_url_replace_regex` patterns, keyed on prefix.  The prefixes vary
+# only with STATIC_URL and the course data directories, so this stays small.
+URL_REPLACE_REGEX_CACHE_SIZE = 500
+_url_replace_regex_cache = {}
+
+# Results of `staticfiles_storage.exists`, per storage instance.  Static files
+# only change on deploy, so these are kept for the life of the process.
+STATICFILES_EXISTS_CACHE_SIZE = 10000
+_staticfiles_exists_cache = weakref.WeakKeyDictionary()
+
 
 def _url_replace_regex(prefix):
     """
@@ -32,6 +43,41 @@ def _url_replace_regex(prefix):
         """.format(prefix=prefix)
 
 
+def _compiled_url_replace_regex(prefix):
+    """
+    Return `_url_replace_regex(prefix)` compiled, reusing earlier compilations.
+    """
+    regex = _url_replace_regex_cache.get(prefix)
+    if regex is None:
+        if len(_url_replace_regex_cache) >= URL_REPLACE_REGEX_CACHE_SIZE:
+            _url_replace_regex_cache.clear()
+        regex = _url_replace_regex_cache[prefix] = re.compile(_url_replace_regex(prefix))
+    return regex
+
+
+def staticfiles_exists(path):
+    """
+    Return whether `path` exists in staticfiles_storage.
+
+    Answers are remembered for the life of the process, except in DEBUG mode
+    where static files may change underneath a running server.
+    """
+    if settings.DEBUG:
+        return staticfiles_storage.exists(path)
+
+    try:
+        known = _staticfiles_exists_cache.setdefault(staticfiles_storage, {})
+    except TypeError:
+        # Storages which can't be weakly referenced are never cached.
+        return staticfiles_storage.exists(path)
+
+    if path not in known:
+        if len(known) >= STATICFILES_EXISTS_CACHE_SIZE:
+            known.clear()
+        known[path] = staticfiles_storage.exists(path)
+    return known[path]
+
+
 def try_staticfiles_lookup(path):
     """
     Try to lookup a path in staticfiles_storage.  If it fails, return
@@ -73,7 +119,9 @@ def replace_jump_to_id_urls(text, course_id, jump_to_id_base_url):
         rest = match.group('rest')
         return "".join([quote, jump_to_id_base_url + rest, quote])
 
-    return re.sub(_url_replace_regex('/jump_to_id/'), replace_jump_to_id_url, text)
+    if '/jump_to_id/' not in text:
+        return text
+    return _compiled_url_replace_regex('/jump_to_id/').sub(replace_jump_to_id_url, text)
 
 
 def replace_course_urls(text, course_key):
@@ -86,6 +134,9 @@ def replace_course_urls(text, course_key):
     returns: text with the links replaced
     """
 
+    if '/course/' not in text:
+        return text
+
     course_id = course_key.to_deprecated_string()
 
     def replace_course_url(match):
@@ -93,7 +144,7 @@ def replace_course_urls(text, course_key):
         rest = match.group('rest')
         return "".join([quote, '/courses/' + course_id + '/', rest, quote])
 
-    return re.sub(_url_replace_regex('/course/'), replace_course_url, text)
+    return _compiled_url_replace_regex('/course/').sub(replace_course_url, text)
 
 
 def process_static_urls(text, replacement_function, data_dir=None):
@@ -123,14 +174,14 @@ def process_static_urls(text, replacement_function, data_dir=None):
 
         return replacement_function(original, prefix, quote, rest)
 
-    return re.sub(
-        _url_replace_regex(u'(?:{static_url}|/static/)(?!{data_dir})'.format(
-            static_url=settings.STATIC_URL,
-            data_dir=data_dir
-        )),
-        wrap_part_extraction,
-        text
-    )
+    static_prefix = u'(?:{static_url}|/static/)'.format(static_url=settings.STATIC_URL)
+    if not re.search(static_prefix, text):
+        return text
+
+    return _compiled_url_replace_regex(u'{static_prefix}(?!{data_dir})'.format(
+        static_prefix=static_prefix,
+        data_dir=data_dir
+    )).sub(wrap_part_extraction, text)
 
 
 def make_static_urls_absolute(request, html):
@@ -162,6 +213,19 @@ def replace_static_urls(text, data_directory=None, course_id=None, static_asset_
     course_id: The course identifier used to distinguish static content for this course in studio
     static_asset_path: Path for static assets, which overrides data_directory and course_namespace, if nonempty
     """
+    # The asset configuration is read at most once per call, not once per url.
+    asset_config = {}
+
+    def canonicalized_asset_path(rest):
+        """
+        Return the contentstore url for the course asset `rest`.
+        """
+        if not asset_config:
+            asset_config['base_url'] = AssetBaseUrlConfig.get_base_url()
+            asset_config['excluded_exts'] = AssetExcludedExtensionsConfig.get_excluded_extensions()
+        return StaticContent.get_canonicalized_asset_path(
+            course_id, rest, asset_config['base_url'], asset_config['excluded_exts']
+        )
 
     def replace_static_url(original, prefix, quote, rest):
         """
@@ -181,7 +245,7 @@ def replace_static_urls(text, data_directory=None, course_id=None, static_asset_
 
             exists_in_staticfiles_storage = False
             try:
-                exists_in_staticfiles_storage = staticfiles_storage.exists(rest)
+                exists_in_staticfiles_storage = staticfiles_exists(rest)
             except Exception as err:
                 log.warning("staticfiles_storage couldn't find path {0}: {1}".format(
                     rest, str(err)))
@@ -191,9 +255,7 @@ def replace_static_urls(text, data_directory=None, course_id=None, static_asset_
             else:
                 # if not, then assume it's courseware specific content and then look in the
                 # Mongo-backed database
-                base_url = AssetBaseUrlConfig.get_base_url()
-                excluded_exts = AssetExcludedExtensionsConfig.get_excluded_extensions()
-                url = StaticContent.get_canonicalized_asset_path(course_id, rest, base_url, excluded_exts)
+                url = canonicalized_asset_path(rest)
 
                 if AssetLocator.CANONICAL_NAMESPACE in url:
                     url = url.replace('block@', 'block/', 1)
@@ -203,7 +265,7 @@ def replace_static_urls(text, data_directory=None, course_id=None, static_asset_
             course_path = "/".join((static_asset_path or data_directory, rest))
 
             try:
-                if staticfiles_storage.exists(rest):
+                if staticfiles_exists(rest):
                     url = staticfiles_storage.url(rest)
                 else:
                     url = staticfiles_storage.url(course_path)
@@ -216,3 +278,17 @@ def replace_static_urls(text, data_directory=None, course_id=None, static_asset_
         return "".join([quote, url, quote])
 
     return process_static_urls(text, replace_static_url, data_dir=static_asset_path or data_directory)
+
+
+def replace_urls(text, course_id, jump_to_id_base_url, data_directory=None, static_asset_path=''):
+    """
+    Apply replace_static_urls, replace_course_urls and replace_jump_to_id_urls
+    to `text`, in that order, skipping any rewrite whose prefix does not occur.
+
+    The three rewrites are still separate passes: a url produced by one may be
+    rewritten by the next, and a single combined scan would not match the same
+    spans when quoted urls overlap, so its output could differ.
+    """
+    text = replace_static_urls(text, data_directory, course_id, static_asset_path=static_asset_path)
+    text = replace_course_urls(text, course_id)
+    return replace_jump_to_id_urls(text, course_id, jump_to_id_base_url)
@@ -19,7 +19,10 @@ from static_replace import (
     make_static_urls_absolute,
     process_static_urls,
     replace_course_urls,
-    replace_static_urls
+    replace_jump_to_id_urls,
+    replace_static_urls,
+    replace_urls,
+    staticfiles_exists
 )
 from xmodule.assetstore.assetmgr import AssetManager
 from xmodule.contentstore.content import StaticContent
@@ -152,6 +155,48 @@ def test_data_dir_fallback(mock_storage, mock_modulestore, mock_settings):
     assert_equals('"/static/data_dir/file.png"', replace_static_urls(STATIC_SOURCE, DATA_DIRECTORY))
 
 
+@patch('static_replace.staticfiles_storage', autospec=True)
+def test_staticfiles_exists_is_cached(mock_storage):
+    mock_storage.exists.return_value = True
+
+    assert_true(staticfiles_exists('file.png'))
+    assert_true(staticfiles_exists('file.png'))
+    mock_storage.exists.assert_called_once_with('file.png')
+
+
+@override_settings(DEBUG=True)
+@patch('static_replace.staticfiles_storage', autospec=True)
+def test_staticfiles_exists_not_cached_in_debug(mock_storage):
+    mock_storage.exists.return_value = True
+
+    assert_true(staticfiles_exists('file.png'))
+    mock_storage.exists.return_value = False
+    assert_false(staticfiles_exists('file.png'))
+
+
+@patch('static_replace.staticfiles_storage', autospec=True)
+def test_replace_urls(mock_storage):
+    mock_storage.exists.return_value = False
+    mock_storage.url.side_effect = lambda path: '/static/' + path
+    text = '"/static/file.png" "/course/file.png" "/jump_to_id/block" "/other/file.png"'
+
+    expected = replace_jump_to_id_urls(
+        replace_course_urls(replace_static_urls(text, DATA_DIRECTORY), COURSE_KEY),
+        COURSE_KEY,
+        '/jump_to_id_base/'
+    )
+    assert_equals(
+        '"/static/data_dir/file.png" "/courses/org/course/run/file.png" "/jump_to_id_base/block" "/other/file.png"',
+        expected
+    )
+    assert_equals(expected, replace_urls(text, COURSE_KEY, '/jump_to_id_base/', data_directory=DATA_DIRECTORY))
+
+
+def test_replace_urls_without_urls():
+    text = '<p>No links to rewrite here.</p>'
+    assert_equals(text, replace_urls(text, COURSE_KEY, '/jump_to_id_base/', data_directory=DATA_DIRECTORY))
+
+
 def test_raw_static_check():
     """
     Make sure replace_static_urls leaves alone things that end in '.raw'
@@ -6,6 +6,7 @@ import urlparse
 from datetime import datetime
 
 from django.conf import settings
+from django.core.cache import cache
 from django.core.urlresolvers import NoReverseMatch, reverse
 from django.utils import http
 from oauth2_provider.models import AccessToken as dot_access_token
@@ -192,6 +193,48 @@ def check_verify_status_by_course(user, course_enrollments):
     return status_by_course
 
 
+class DashboardCourseDataCache(object):
+    """
+    A cache of the data shown on the course cards of a user's dashboard.
+
+    The data is cached for settings.DASHBOARD_COURSE_DATA_CACHE_TIMEOUT seconds;
+    0 disables the cache.  It is invalidated when one of the user's enrollments,
+    certificates or photo verifications is saved or deleted.
+    """
+    CACHE_NAMESPACE = u"student.helpers.DashboardCourseDataCache"
+
+    @classmethod
+    def get_or_load(cls, user_id, version, load):
+        """
+        Returns the cached data of the user, or the data returned by load(),
+        caching it.  version identifies what the data was loaded from, e.g.
+        the user's enrollments; data cached for another version isn't used.
+        """
+        timeout = getattr(settings, 'DASHBOARD_COURSE_DATA_CACHE_TIMEOUT', 0)
+        if not timeout:
+            return load()
+
+        cached = cache.get(cls._cache_key(user_id))
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        data = load()
+        cache.set(cls._cache_key(user_id), (version, data), timeout)
+        return data
+
+    @classmethod
+    def invalidate(cls, user_id):
+        """
+        Removes the data of the user from the cache.
+        """
+        if getattr(settings, 'DASHBOARD_COURSE_DATA_CACHE_TIMEOUT', 0):
+            cache.delete(cls._cache_key(user_id))
+
+    @classmethod
+    def _cache_key(cls, user_id):
+        return u"{}.{}".format(cls.CACHE_NAMESPACE, user_id)
+
+
 def auth_pipeline_urls(auth_entry, redirect_url=None):
     """Retrieve URLs for each enabled third-party auth provider.
 
@@ -1546,11 +1546,13 @@ class CourseEnrollment(models.Model):
 
         return status_hash
 
-    def is_paid_course(self):
+    def is_paid_course(self, modes_dict=None):
         """
         Returns True, if course is paid
+
+        modes_dict, the course modes of the course, avoids a query when given.
         """
-        paid_course = CourseMode.is_white_label(self.course_id)
+        paid_course = CourseMode.is_white_label(self.course_id, modes_dict=modes_dict)
         if paid_course or CourseMode.is_professional_slug(self.mode):
             return True
 
@@ -1826,6 +1828,39 @@ class CourseEnrollment(models.Model):
             enrollment_state = CourseEnrollmentState(record.mode, record.is_active)
             cls._update_enrollment(cache, record.user.id, course_key, enrollment_state)
 
+    @classmethod
+    def enrollment_states_for_users(cls, users, course_key):
+        """
+        Returns the CourseEnrollmentStates of the given users for the given
+        course, as a dict of {user_id: CourseEnrollmentState}.
+
+        The states that aren't cached for the request are fetched with a
+        single query and cached, for later retrieval by
+        enrollment_mode_for_user.
+        """
+        cache = cls._get_mode_active_request_cache()
+        enrollment_states = {}
+        uncached_user_ids = []
+        for user in users:
+            enrollment_state = cache.get((user.id, course_key))
+            if user.is_anonymous():
+                enrollment_states[user.id] = CourseEnrollmentState(None, None)
+            elif enrollment_state:
+                enrollment_states[user.id] = enrollment_state
+            else:
+                uncached_user_ids.append(user.id)
+
+        if uncached_user_ids:
+            records = cls.objects.filter(
+                user_id__in=uncached_user_ids, course_id=course_key
+            ).values_list('user_id', 'mode', 'is_active')
+            for user_id, mode, is_active in records:
+                enrollment_states[user_id] = CourseEnrollmentState(mode, is_active)
+            for user_id in uncached_user_ids:
+                enrollment_state = enrollment_states.setdefault(user_id, CourseEnrollmentState(None, None))
+                cls._update_enrollment(cache, user_id, course_key, enrollment_state)
+        return enrollment_states
+
     @classmethod
     def _get_mode_active_request_cache(cls):
         """
@@ -1997,6 +2032,24 @@ class CourseAccessRole(models.Model):
         return "[CourseAccessRole] user: {}   role: {}   org: {}   course: {}".format(self.user.username, self.role, self.org, self.course_id)
 
 
+@receiver(models.signals.post_save, sender=CourseAccessRole)
+@receiver(models.signals.post_delete, sender=CourseAccessRole)
+def invalidate_role_cache(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """Invalidate the cached roles of the user of a CourseAccessRole. """
+    from student.roles import RoleCache  # Imported here, as student.roles imports this module.
+    RoleCache.invalidate(instance.user_id)
+
+
+@receiver(models.signals.post_save, sender=CourseEnrollment)
+@receiver(models.signals.post_delete, sender=CourseEnrollment)
+@receiver(models.signals.post_save, sender=GeneratedCertificate)
+@receiver(models.signals.post_delete, sender=GeneratedCertificate)
+def invalidate_dashboard_course_data_cache(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """Invalidate the cached dashboard data of the user of an enrollment or certificate. """
+    from student.helpers import DashboardCourseDataCache  # Imported here, as student.helpers imports lms models.
+    DashboardCourseDataCache.invalidate(instance.user_id)
+
+
 #### Helper methods for use from python manage.py shell and other classes.
 
 
@@ -7,10 +7,12 @@ import logging
 from abc import ABCMeta, abstractmethod
 from collections import defaultdict
 
+from django.conf import settings
 from django.contrib.auth.models import User
+from django.core.cache import cache
 
 from openedx.core.djangoapps.xmodule_django.models import CourseKeyField
-from request_cache import get_cache
+from request_cache import get_cache, get_request
 from student.models import CourseAccessRole
 
 log = logging.getLogger(__name__)
@@ -59,14 +61,52 @@ class BulkRoleCache(object):
 class RoleCache(object):
     """
     A cache of the CourseAccessRoles held by a particular user
+
+    All of the user's roles are loaded in one query, and shared by the RoleCaches
+    of the user for the rest of the request.  If settings.COURSE_ACCESS_ROLE_CACHE_TIMEOUT
+    is set, they are also cached for that many seconds.  Both caches are invalidated
+    when one of the user's CourseAccessRoles is saved or deleted.
     """
+    CACHE_NAMESPACE = u"student.roles.RoleCache"
+
     def __init__(self, user):
         try:
             self._roles = BulkRoleCache.get_user_roles(user)
         except KeyError:
-            self._roles = set(
-                CourseAccessRole.objects.filter(user=user).all()
-            )
+            self._roles = self._get_roles(user.id)
+
+    @classmethod
+    def _get_roles(cls, user_id):
+        """
+        Returns the set of the user's CourseAccessRoles, from the caches if possible.
+        """
+        # Outside of a request, the request cache is never cleared.
+        request_roles = get_cache(cls.CACHE_NAMESPACE) if get_request() is not None else {}
+        if user_id in request_roles:
+            return request_roles[user_id]
+
+        timeout = getattr(settings, 'COURSE_ACCESS_ROLE_CACHE_TIMEOUT', 0)
+        roles = cache.get(cls._cache_key(user_id)) if timeout else None
+        if roles is None:
+            roles = set(CourseAccessRole.objects.filter(user_id=user_id))
+            if timeout:
+                cache.set(cls._cache_key(user_id), roles, timeout)
+
+        request_roles[user_id] = roles
+        return roles
+
+    @classmethod
+    def invalidate(cls, user_id):
+        """
+        Removes the user's roles from the caches.
+        """
+        get_cache(cls.CACHE_NAMESPACE).pop(user_id, None)
+        if getattr(settings, 'COURSE_ACCESS_ROLE_CACHE_TIMEOUT', 0):
+            cache.delete(cls._cache_key(user_id))
+
+    @classmethod
+    def _cache_key(cls, user_id):
+        return u'{}.{}'.format(cls.CACHE_NAMESPACE, user_id)
 
     def has_role(self, role, course_id, org):
         """
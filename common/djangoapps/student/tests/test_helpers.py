@@ -9,11 +9,15 @@ from django.core.urlresolvers import reverse
 from django.test import TestCase
 from django.test.client import RequestFactory
 from django.test.utils import override_settings
-from mock import patch
+from mock import Mock, patch
+from opaque_keys.edx.keys import CourseKey
 from testfixtures import LogCapture
 
-from student.helpers import get_next_url_for_login_page
+from student.helpers import DashboardCourseDataCache, get_next_url_for_login_page
+from student.models import CourseEnrollment
+from student.tests.factories import UserFactory
 from openedx.core.djangoapps.site_configuration.tests.test_util import with_site_configuration_context
+from openedx.core.djangolib.testing.utils import CacheIsolationTestCase
 
 LOGGER_NAME = "student.helpers"
 
@@ -110,3 +114,35 @@ class TestLoginHelper(TestCase):
 
         with with_site_configuration_context(configuration=dict(THIRD_PARTY_AUTH_HINT=tpa_hint)):
             validate_login()
+
+
+class DashboardCourseDataCacheTest(CacheIsolationTestCase):
+    """Test the caching of the course card data of the dashboard."""
+    ENABLED_CACHES = ['default']
+    COURSE_KEY = CourseKey.from_string('edX/toy/2012_Fall')
+
+    def setUp(self):
+        super(DashboardCourseDataCacheTest, self).setUp()
+        self.user = UserFactory()
+        self.load = Mock(return_value={'cert_statuses': {}})
+
+    def test_disabled_by_default(self):
+        DashboardCourseDataCache.get_or_load(self.user.id, 1, self.load)
+        DashboardCourseDataCache.get_or_load(self.user.id, 1, self.load)
+        self.assertEqual(self.load.call_count, 2)
+
+    @override_settings(DASHBOARD_COURSE_DATA_CACHE_TIMEOUT=60)
+    def test_cached_per_version(self):
+        self.assertEqual(DashboardCourseDataCache.get_or_load(self.user.id, 1, self.load), {'cert_statuses': {}})
+        DashboardCourseDataCache.get_or_load(self.user.id, 1, self.load)
+        self.assertEqual(self.load.call_count, 1)
+
+        DashboardCourseDataCache.get_or_load(self.user.id, 2, self.load)
+        self.assertEqual(self.load.call_count, 2)
+
+    @override_settings(DASHBOARD_COURSE_DATA_CACHE_TIMEOUT=60)
+    def test_invalidated_by_enrollment(self):
+        DashboardCourseDataCache.get_or_load(self.user.id, 1, self.load)
+        CourseEnrollment.enroll(self.user, self.COURSE_KEY)
+        DashboardCourseDataCache.get_or_load(self.user.id, 1, self.load)
+        self.assertEqual(self.load.call_count, 2)
@@ -2,10 +2,16 @@
 Tests of student.roles
 """
 import ddt
+from django.contrib.auth.models import User
 from django.test import TestCase
+from django.test.client import RequestFactory
+from django.test.utils import override_settings
+from mock import Mock, patch
 from opaque_keys.edx.keys import CourseKey
 
 from courseware.tests.factories import InstructorFactory, StaffFactory, UserFactory
+from openedx.core.djangolib.testing.utils import CacheIsolationTestCase
+from request_cache.middleware import RequestCache
 from student.roles import (
     CourseBetaTesterRole,
     CourseInstructorRole,
@@ -198,3 +204,43 @@ class RoleCacheTestCase(TestCase):
     def test_empty_cache(self, role, target):
         cache = RoleCache(self.user)
         self.assertFalse(cache.has_role(*target))
+
+
+class RoleCacheCachingTestCase(CacheIsolationTestCase):
+    """
+    Tests of the caching of the roles that RoleCache loads.
+    """
+    ENABLED_CACHES = ['default']
+    COURSE_KEY = CourseKey.from_string('edX/toy/2012_Fall')
+
+    def setUp(self):
+        super(RoleCacheCachingTestCase, self).setUp()
+        self.user = UserFactory()
+        RequestCache.clear_request_cache()
+
+    @patch('student.roles.get_request', Mock(return_value=RequestFactory().get('/')))
+    def test_roles_shared_in_request(self):
+        self.assertFalse(RoleCache(self.user).has_role('staff', self.COURSE_KEY, 'edX'))
+
+        # Another object for the same user reads the roles loaded for the request.
+        other_user = User.objects.get(id=self.user.id)
+        with self.assertNumQueries(0):
+            self.assertFalse(RoleCache(other_user).has_role('staff', self.COURSE_KEY, 'edX'))
+
+        CourseStaffRole(self.COURSE_KEY).add_users(self.user)
+        self.assertTrue(RoleCache(other_user).has_role('staff', self.COURSE_KEY, 'edX'))
+
+    def test_roles_not_shared_outside_request(self):
+        RoleCache(self.user)
+        with self.assertNumQueries(1):
+            RoleCache(self.user)
+
+    @override_settings(COURSE_ACCESS_ROLE_CACHE_TIMEOUT=60)
+    def test_roles_cached_across_requests(self):
+        CourseStaffRole(self.COURSE_KEY).add_users(self.user)
+        self.assertTrue(RoleCache(self.user).has_role('staff', self.COURSE_KEY, 'edX'))
+        with self.assertNumQueries(0):
+            self.assertTrue(RoleCache(self.user).has_role('staff', self.COURSE_KEY, 'edX'))
+
+        CourseStaffRole(self.COURSE_KEY).remove_users(self.user)
+        self.assertFalse(RoleCache(self.user).has_role('staff', self.COURSE_KEY, 'edX'))
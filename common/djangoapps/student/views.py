@@ -93,6 +93,7 @@ from student.cookies import delete_logged_in_cookies, set_logged_in_cookies, set
 from student.forms import AccountCreationForm, PasswordResetFormNoActive, get_registration_extension_form
 from student.helpers import (
     DISABLE_UNENROLL_CERT_STATES,
+    DashboardCourseDataCache,
     auth_pipeline_urls,
     check_verify_status_by_course,
     destroy_oauth_tokens,
@@ -739,42 +740,15 @@ def dashboard(request):
     meter = ProgramProgressMeter(request.site, user, enrollments=course_enrollments)
     inverted_programs = meter.invert_programs()
 
-    # Construct a dictionary of course mode information
-    # used to render the course list.  We re-use the course modes dict
-    # we loaded earlier to avoid hitting the database.
-    course_mode_info = {
-        enrollment.course_id: complete_course_mode_info(
-            enrollment.course_id, enrollment,
-            modes=course_modes_by_course[enrollment.course_id]
-        )
-        for enrollment in course_enrollments
-    }
-
-    # Determine the per-course verification status
-    # This is a dictionary in which the keys are course locators
-    # and the values are one of:
-    #
-    # VERIFY_STATUS_NEED_TO_VERIFY
-    # VERIFY_STATUS_SUBMITTED
-    # VERIFY_STATUS_APPROVED
-    # VERIFY_STATUS_MISSED_DEADLINE
-    #
-    # Each of which correspond to a particular message to display
-    # next to the course on the dashboard.
-    #
-    # If a course is not included in this dictionary,
-    # there is no verification messaging to display.
-    verify_status_by_course = check_verify_status_by_course(user, course_enrollments)
-    cert_statuses = {
-        enrollment.course_id: cert_info(request.user, enrollment.course_overview, enrollment.mode)
-        for enrollment in course_enrollments
-    }
-
-    # only show email settings for Mongo course and when bulk email is turned on
-    show_email_settings_for = frozenset(
-        enrollment.course_id for enrollment in course_enrollments if (
-            BulkEmailFlag.feature_enabled(enrollment.course_id)
-        )
+    # The data of the course cards, which changes with the enrollments, certificates
+    # and verifications of the user, or the site (e.g. certificate links).
+    course_card_data = DashboardCourseDataCache.get_or_load(
+        user.id,
+        (
+            request.site.id,
+            [(enrollment.course_id, enrollment.mode, enrollment.is_active) for enrollment in course_enrollments],
+        ),
+        lambda: _dashboard_course_card_data(user, course_enrollments, course_modes_by_course),
     )
 
     # Verification Attempts
@@ -786,21 +760,15 @@ def dashboard(request):
     statuses = ["approved", "denied", "pending", "must_reverify"]
     reverifications = reverification_info(statuses)
 
+    redeemed_registration_codes = defaultdict(list)
+    for registration_code in CourseRegistrationCode.objects.filter(
+            course_id__in=enrolled_course_ids,
+            registrationcoderedemption__redeemed_by=request.user
+    ).select_related('invoice_item__invoice'):
+        redeemed_registration_codes[registration_code.course_id].append(registration_code)
     block_courses = frozenset(
         enrollment.course_id for enrollment in course_enrollments
-        if is_course_blocked(
-            request,
-            CourseRegistrationCode.objects.filter(
-                course_id=enrollment.course_id,
-                registrationcoderedemption__redeemed_by=request.user
-            ),
-            enrollment.course_id
-        )
-    )
-
-    enrolled_courses_either_paid = frozenset(
-        enrollment.course_id for enrollment in course_enrollments
-        if enrollment.is_paid_course()
+        if is_course_blocked(request, redeemed_registration_codes[enrollment.course_id], enrollment.course_id)
     )
 
     # If there are *any* denied reverifications that have not been toggled off,
@@ -843,13 +811,8 @@ def dashboard(request):
         'staff_access': staff_access,
         'errored_courses': errored_courses,
         'show_courseware_links_for': show_courseware_links_for,
-        'all_course_modes': course_mode_info,
-        'cert_statuses': cert_statuses,
-        'credit_statuses': _credit_statuses(user, course_enrollments),
-        'show_email_settings_for': show_email_settings_for,
         'reverifications': reverifications,
         'verification_status': verification_status,
-        'verification_status_by_course': verify_status_by_course,
         'verification_errors': verification_errors,
         'block_courses': block_courses,
         'denied_banner': denied_banner,
@@ -857,7 +820,6 @@ def dashboard(request):
         'user': user,
         'logout_url': reverse('logout'),
         'platform_name': platform_name,
-        'enrolled_courses_either_paid': enrolled_courses_either_paid,
         'provider_states': [],
         'order_history_list': order_history_list,
         'courses_requirements_not_met': courses_requirements_not_met,
@@ -869,6 +831,8 @@ def dashboard(request):
         'display_sidebar_on_dashboard': display_sidebar_on_dashboard,
     }
 
+    context.update(course_card_data)
+
     ecommerce_service = EcommerceService()
     if ecommerce_service.is_enabled(request.user):
         context.update({
@@ -881,6 +845,74 @@ def dashboard(request):
     return response
 
 
+def _dashboard_course_card_data(user, course_enrollments, course_modes_by_course):
+    """
+    Returns the per-course data of the course cards of the dashboard, as a dict of
+    dashboard template variables.  Each kind of data is loaded with one query across
+    all of the user's enrollments.
+
+    Arguments:
+        user (User): The currently logged-in user.
+        course_enrollments (list[CourseEnrollment]): The enrollments shown on the dashboard.
+        course_modes_by_course (dict): The unexpired course modes of each enrolled course, by slug.
+    """
+    enrolled_course_ids = [enrollment.course_id for enrollment in course_enrollments]
+
+    # Construct a dictionary of course mode information
+    # used to render the course list.  We re-use the course modes dict
+    # we loaded earlier to avoid hitting the database.
+    course_mode_info = {
+        enrollment.course_id: complete_course_mode_info(
+            enrollment.course_id, enrollment,
+            modes=course_modes_by_course[enrollment.course_id]
+        )
+        for enrollment in course_enrollments
+    }
+
+    # Determine the per-course verification status
+    # This is a dictionary in which the keys are course locators
+    # and the values are one of:
+    #
+    # VERIFY_STATUS_NEED_TO_VERIFY
+    # VERIFY_STATUS_SUBMITTED
+    # VERIFY_STATUS_APPROVED
+    # VERIFY_STATUS_MISSED_DEADLINE
+    #
+    # Each of which correspond to a particular message to display
+    # next to the course on the dashboard.
+    #
+    # If a course is not included in this dictionary,
+    # there is no verification messaging to display.
+    verify_status_by_course = check_verify_status_by_course(user, course_enrollments)
+
+    GeneratedCertificate.prefetch_for_student(user, enrolled_course_ids)
+    cert_statuses = {
+        enrollment.course_id: cert_info(user, enrollment.course_overview, enrollment.mode)
+        for enrollment in course_enrollments
+    }
+
+    # only show email settings for Mongo course and when bulk email is turned on
+    show_email_settings_for = frozenset(BulkEmailFlag.courses_with_feature_enabled(enrolled_course_ids))
+
+    # is_paid_course looks at the selectable modes of the course, which exclude credit.
+    enrolled_courses_either_paid = frozenset(
+        enrollment.course_id for enrollment in course_enrollments
+        if enrollment.is_paid_course(modes_dict={
+            slug: mode for slug, mode in course_modes_by_course[enrollment.course_id].iteritems()
+            if slug not in CourseMode.CREDIT_MODES
+        })
+    )
+
+    return {
+        'all_course_modes': course_mode_info,
+        'cert_statuses': cert_statuses,
+        'credit_statuses': _credit_statuses(user, course_enrollments),
+        'show_email_settings_for': show_email_settings_for,
+        'verification_status_by_course': verify_status_by_course,
+        'enrolled_courses_either_paid': enrolled_courses_either_paid,
+    }
+
+
 @login_required
 def course_run_refund_status(request, course_id):
     """
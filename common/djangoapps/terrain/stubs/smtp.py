@@ -0,0 +1,105 @@
+"""
+Stub SMTP server, a local sink for the email sent by tests.
+
+Messages are accepted and recorded, not delivered:
+
+    server = StubSmtpService()
+    with override_settings(
+        EMAIL_BACKEND='django.core.mail.backends.smtp.EmailBackend',
+        EMAIL_HOST='127.0.0.1',
+        EMAIL_PORT=server.port,
+    ):
+        ...
+    server.messages  # dicts with the 'peer', 'mailfrom', 'rcpttos' and 'data' of each message
+
+The recipients listed in `config['rejected_addresses']` (a list, or a
+comma-separated string when set from the command line) are refused with
+a 554 error.
+"""
+import asyncore
+import logging
+import smtpd
+import threading
+
+LOGGER = logging.getLogger(__name__)
+
+
+class StubSmtpService(smtpd.SMTPServer, object):
+    """
+    Stub SMTP service implementation.
+    """
+
+    def __init__(self, port_num=0):
+        """
+        Configure the server to listen on localhost.
+        Default is to choose an arbitrary open port.
+        """
+        smtpd.SMTPServer.__init__(self, ('127.0.0.1', port_num), None)
+
+        # Create a dict to store configuration values set by the client
+        self.config = dict()
+
+        # The messages received, and the number of connections accepted
+        self.messages = []
+        self.connection_count = 0
+        self._channels = []
+
+        # Start the server in a separate thread
+        self._running = True
+        self._server_thread = threading.Thread(target=self._serve)
+        self._server_thread.daemon = True
+        self._server_thread.start()
+
+        # Log the port we're using to help identify port conflict errors
+        LOGGER.debug('Starting service on port {0}'.format(self.port))
+
+    def _serve(self):
+        """
+        Handle the connections until the server is shut down.
+        """
+        while self._running:
+            asyncore.loop(timeout=0.1, count=1)
+
+    def handle_accept(self):
+        """
+        Accept a connection, counting it.
+        """
+        pair = self.accept()
+        if pair is not None:
+            conn, addr = pair
+            self.connection_count += 1
+            self._channels.append(smtpd.SMTPChannel(self, conn, addr))
+
+    def process_message(self, peer, mailfrom, rcpttos, data):
+        """
+        Record the message, or refuse it if one of its recipients is rejected.
+        """
+        rejected_addresses = self.config.get('rejected_addresses', [])
+        if isinstance(rejected_addresses, basestring):
+            rejected_addresses = rejected_addresses.split(',')
+        if any(address in rejected_addresses for address in rcpttos):
+            return '554 Message rejected'
+
+        self.messages.append({
+            'peer': peer,
+            'mailfrom': mailfrom,
+            'rcpttos': rcpttos,
+            'data': data,
+        })
+
+    def shutdown(self):
+        """
+        Stop the server and free up the port
+        """
+        self._running = False
+        self._server_thread.join()
+        for channel in self._channels:
+            channel.close()
+        self.close()
+
+    @property
+    def port(self):
+        """
+        Return the port that the service is listening on.
+        """
+        return self.socket.getsockname()[1]
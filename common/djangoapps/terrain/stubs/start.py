@@ -10,6 +10,7 @@ from .comments import StubCommentsService
 from .ecommerce import StubEcommerceService
 from .edxnotes import StubEdxNotesService
 from .lti import StubLtiService
+from .smtp import StubSmtpService
 from .video_source import VideoSourceHttpService
 from .xqueue import StubXQueueService
 from .youtube import StubYouTubeService
@@ -25,6 +26,7 @@ SERVICES = {
     'edxnotes': StubEdxNotesService,
     'ecommerce': StubEcommerceService,
     'catalog': StubCatalogService,
+    'smtp': StubSmtpService,
 }
 
 # Log to stdout, including debug messages
@@ -0,0 +1,179 @@
+"""
+Event tracker backend that sends events to another backend from a
+background thread, in batches.
+
+Wrap a backend whose `send` is slow (e.g. a database insert) so that the
+request threads only append events to a bounded in-process queue::
+
+  TRACKING_BACKENDS = {
+      'sql': {
+          'ENGINE': 'track.backends.buffered.BufferedBackend',
+          'OPTIONS': {
+              'backend': {
+                  'ENGINE': 'track.backends.django.DjangoBackend',
+              },
+              'max_queue_size': 10000,
+              'batch_size': 100,
+              'flush_interval': 1.0,
+              'overflow': 'drop',
+          }
+      }
+  }
+
+Events still in the queue when the process exits are sent at exit, but
+they are lost if the process is killed.
+"""
+
+from __future__ import absolute_import
+
+import atexit
+import logging
+import os
+import threading
+import time
+from Queue import Empty, Full, Queue
+
+from django.db import close_old_connections
+from dogapi import dog_stats_api
+
+from track.backends import BaseBackend
+
+log = logging.getLogger(__name__)
+
+# What to do with an event when the queue is full.
+OVERFLOW_DROP = 'drop'  # Drop the event.
+OVERFLOW_BLOCK = 'block'  # Wait up to `put_timeout` seconds for room, then drop the event.
+OVERFLOW_SEND = 'send'  # Send the event to the backend from the request thread.
+OVERFLOW_POLICIES = (OVERFLOW_DROP, OVERFLOW_BLOCK, OVERFLOW_SEND)
+
+
+class BufferedBackend(BaseBackend):
+    """
+    Event tracker backend that queues events for a background thread,
+    which sends them to the wrapped backend's `send_many`.
+    """
+
+    def __init__(self, backend, max_queue_size=10000, batch_size=100, flush_interval=1.0,
+                 overflow=OVERFLOW_DROP, put_timeout=0.1, **kwargs):
+        """
+        :Parameters:
+
+          - `backend`: configuration of the wrapped backend, a dict with
+            its 'ENGINE' and optional 'OPTIONS'
+          - `max_queue_size`: number of events to queue before applying
+            the `overflow` policy
+          - `batch_size`: maximum number of events sent at once
+          - `flush_interval`: maximum number of seconds an event waits for
+            its batch to fill up
+          - `overflow`: one of OVERFLOW_POLICIES
+          - `put_timeout`: seconds to wait for room with OVERFLOW_BLOCK
+
+        """
+        super(BufferedBackend, self).__init__(**kwargs)
+
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError('Invalid overflow policy %s' % overflow)
+
+        # Imported here, as the tracker imports the backends.
+        from track.tracker import _instantiate_backend_from_name  # pylint: disable=protected-access
+        self.backend = _instantiate_backend_from_name(backend['ENGINE'], backend.get('OPTIONS', {}))
+
+        self.max_queue_size = max_queue_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.overflow = overflow
+        self.put_timeout = put_timeout
+
+        self._lock = threading.Lock()
+        self._pid = None
+        self._queue = None
+        self._thread = None
+
+        atexit.register(self.flush)
+
+    def send(self, event):
+        """Queue the event, applying the overflow policy if the queue is full."""
+        event_queue = self._get_queue()
+        try:
+            if self.overflow == OVERFLOW_BLOCK:
+                event_queue.put(event, timeout=self.put_timeout)
+            else:
+                event_queue.put_nowait(event)
+        except Full:
+            if self.overflow == OVERFLOW_SEND:
+                dog_stats_api.increment('track.buffered.overflow_sent')
+                self.backend.send(event)
+            else:
+                dog_stats_api.increment('track.buffered.dropped')
+                log.warning('Event tracking queue is full, dropping event %s', event.get('event_type'))
+
+    def flush(self):
+        """
+        Send the queued events from the calling thread, and wait for the
+        background thread to finish sending its current batch.
+        """
+        event_queue = self._queue
+        if event_queue is None or self._pid != os.getpid():
+            return
+
+        batch = []
+        while True:
+            try:
+                batch.append(event_queue.get_nowait())
+            except Empty:
+                break
+            if len(batch) >= self.batch_size:
+                self._send_batch(event_queue, batch)
+                batch = []
+        if batch:
+            self._send_batch(event_queue, batch)
+        event_queue.join()
+
+    def _get_queue(self):
+        """
+        Returns the queue of this process, starting its background thread
+        if needed; the thread of a parent process doesn't survive a fork.
+        """
+        if self._pid != os.getpid():
+            with self._lock:
+                if self._pid != os.getpid():
+                    self._queue = Queue(maxsize=self.max_queue_size)
+                    self._thread = threading.Thread(
+                        target=self._run, args=(self._queue,), name='track-buffered-backend'
+                    )
+                    self._thread.daemon = True
+                    self._thread.start()
+                    self._pid = os.getpid()
+        return self._queue
+
+    def _run(self, event_queue):
+        """Send the events of event_queue in batches, forever."""
+        while True:
+            batch = [event_queue.get()]
+            deadline = time.time() + self.flush_interval
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(event_queue.get(timeout=remaining))
+                except Empty:
+                    break
+            # This thread holds its database connections across batches,
+            # let django close the ones that are no longer usable.
+            close_old_connections()
+            self._send_batch(event_queue, batch)
+
+    def _send_batch(self, event_queue, batch):
+        """Send batch, events that were taken from event_queue, to the wrapped backend."""
+        dog_stats_api.gauge('track.buffered.queue_depth', event_queue.qsize())
+        dog_stats_api.histogram('track.buffered.batch_size', len(batch))
+        try:
+            with dog_stats_api.timer('track.buffered.flush'):
+                self.backend.send_many(batch)
+        except Exception:  # pylint: disable=broad-except
+            dog_stats_api.increment('track.buffered.errors')
+            log.exception('Error sending %d events to event tracking backend', len(batch))
+        finally:
+            for __ in batch:
+                event_queue.task_done()
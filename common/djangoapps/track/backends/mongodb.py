@@ -96,3 +96,15 @@ class MongoBackend(BaseBackend):
             # during the next event.
             msg = 'Error inserting to MongoDB event tracker backend'
             log.exception(msg)
+
+    def send_many(self, events):
+        """Insert the events in to the Mongo collection with a single request"""
+        try:
+            # insert_many adds an _id to the documents, don't change the events
+            # other backends may still be sending.
+            self.collection.insert_many([dict(event) for event in events], ordered=False)
+        except (PyMongoError, BSONError):
+            # As in send, the events are lost; with an unordered insert,
+            # only the ones that failed.
+            msg = 'Error inserting to MongoDB event tracker backend'
+            log.exception(msg)
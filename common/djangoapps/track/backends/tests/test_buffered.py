@@ -0,0 +1,67 @@
+"""Tests for the buffered event tracker backend."""
+
+from __future__ import absolute_import
+
+from django.test import TestCase
+from mock import patch
+
+from track.backends import BaseBackend
+from track.backends.buffered import OVERFLOW_SEND, BufferedBackend
+
+
+class RecordingBackend(BaseBackend):
+    """Backend that records the batches of events it is sent."""
+    def __init__(self, **options):
+        super(RecordingBackend, self).__init__(**options)
+        self.events = []
+        self.batches = []
+
+    def send(self, event):
+        self.events.append(event)
+
+    def send_many(self, events):
+        self.batches.append(events)
+        self.events.extend(events)
+
+
+RECORDING_BACKEND = {'ENGINE': 'track.backends.tests.test_buffered.RecordingBackend'}
+
+
+class TestBufferedBackend(TestCase):
+    """Tests of queueing events and sending them in batches."""
+
+    def test_send_in_batches(self):
+        backend = BufferedBackend(backend=RECORDING_BACKEND, batch_size=3)
+        events = [{'event_type': 'test', 'number': number} for number in range(10)]
+        for event in events:
+            backend.send(event)
+        backend.flush()
+
+        self.assertEqual(sorted(backend.backend.events), sorted(events))
+        self.assertTrue(all(len(batch) <= 3 for batch in backend.backend.batches))
+
+    @patch.object(BufferedBackend, '_run')
+    def test_queue_full_drops(self, __):
+        # Without a running background thread, the queue fills up.
+        backend = BufferedBackend(backend=RECORDING_BACKEND, max_queue_size=2)
+        with patch('track.backends.buffered.dog_stats_api') as mock_stats:
+            for number in range(3):
+                backend.send({'event_type': 'test', 'number': number})
+        mock_stats.increment.assert_called_once_with('track.buffered.dropped')
+
+        backend.flush()
+        self.assertEqual([event['number'] for event in backend.backend.events], [0, 1])
+
+    @patch.object(BufferedBackend, '_run')
+    def test_queue_full_sends(self, __):
+        backend = BufferedBackend(backend=RECORDING_BACKEND, max_queue_size=2, overflow=OVERFLOW_SEND)
+        for number in range(3):
+            backend.send({'event_type': 'test', 'number': number})
+        self.assertEqual([event['number'] for event in backend.backend.events], [2])
+
+        backend.flush()
+        self.assertEqual(len(backend.backend.events), 3)
+
+    def test_invalid_overflow(self):
+        with self.assertRaises(ValueError):
+            BufferedBackend(backend=RECORDING_BACKEND, overflow='ignore')
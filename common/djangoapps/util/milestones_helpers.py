@@ -345,6 +345,29 @@ def get_course_content_milestones(course_id, content_id, relationship, user_id=N
     if user_id is None:
         return milestones_api.get_course_content_milestones(course_id, content_id, relationship)
 
+    return [
+        m for m in _get_user_course_content_milestones(course_id, relationship, user_id)
+        if m['content_id'] == unicode(content_id)
+    ]
+
+
+def get_course_content_ids_with_milestones(course_id, relationship, user_id):
+    """
+    Returns the set of the ids of the course content that has milestones
+    with the given relationship for the user, using the same request cache
+    as get_course_content_milestones.
+    """
+    if not settings.FEATURES.get('MILESTONES_APP'):
+        return set()
+
+    return {m['content_id'] for m in _get_user_course_content_milestones(course_id, relationship, user_id)}
+
+
+def _get_user_course_content_milestones(course_id, relationship, user_id):
+    """
+    Returns all of the user's course content milestones with the given
+    relationship, from the request cache.
+    """
     request_cache_dict = request_cache.get_cache(REQUEST_CACHE_NAME)
     if user_id not in request_cache_dict:
         request_cache_dict[user_id] = {}
@@ -356,7 +379,7 @@ def get_course_content_milestones(course_id, content_id, relationship, user_id=N
             user={"id": user_id}
         )
 
-    return [m for m in request_cache_dict[user_id][relationship] if m['content_id'] == unicode(content_id)]
+    return request_cache_dict[user_id][relationship]
 
 
 def remove_course_content_user_milestones(course_key, content_key, user, relationship):
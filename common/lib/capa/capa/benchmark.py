@@ -0,0 +1,229 @@
+#!/usr/bin/env python
+"""
+Commandline tool for benchmarking the capa hot paths.
+
+Measures, for every problem XML file found under the given paths (by default
+the course fixtures in common/test/data):
+
+  * parse: constructing a `LoncapaProblem` from the XML text
+  * render: `LoncapaProblem.get_html`
+  * grade: `evaluate_answers` for each response, grouped by response tag
+
+plus `calc.evaluator` throughput on a fixed set of expressions, and writes the
+results as JSON so that runs can be compared for regressions:
+
+    python -m capa.benchmark --iterations 20 --output capa-benchmark.json
+"""
+from __future__ import division
+
+import argparse
+import gettext
+import json
+import logging
+import os
+import platform
+import sys
+import time
+from collections import defaultdict
+from functools import partial
+
+from lxml import etree
+from mako.lookup import TemplateLookup
+from path import Path as path
+
+from calc import evaluator
+from capa.capa_problem import LoncapaProblem, LoncapaSystem
+from capa.correctmap import CorrectMap
+
+logging.basicConfig(format="%(levelname)s %(message)s")
+log = logging.getLogger('capa.benchmark')
+
+DEFAULT_DATA_DIR = path(__file__).abspath().dirname().dirname().dirname().dirname() / 'test' / 'data'
+
+# (variables, expression) pairs typical of numerical and formula responses.
+EVALUATOR_EXPRESSIONS = [
+    ({}, '1 + 2 * 3'),
+    ({}, '2.5e-3 * 10^2 / (4 - 1)'),
+    ({}, 'sqrt(2) * sin(pi/4) + cos(0)'),
+    ({'x': 2.0, 'y': 3.0}, 'x^2 + 2*x*y + y^2'),
+    ({'m': 1.5, 'v': 4.0}, '1/2 * m * v^2'),
+    ({'R': 8.314, 'T': 298.0, 'n': 2.0, 'V': 0.05}, 'n*R*T/V'),
+    ({}, '5k + 30m'),
+    ({}, '(1 + 2j) * (3 - 4j)'),
+]
+
+
+class BenchmarkModule(object):
+    """The parts of a capa module used by responses while grading, with tracking disabled."""
+    class _Location(object):
+        def to_deprecated_string(self):
+            return 'i4x://edX/benchmark/problem/benchmark'
+
+    class _Runtime(object):
+        def track_function(self, event_type, event):  # pylint: disable=unused-argument
+            pass
+
+    location = _Location()
+    runtime = _Runtime()
+
+    def correctness_available(self):
+        return True
+
+
+def benchmark_system():
+    """A LoncapaSystem which renders the real capa templates and cannot run external graders."""
+    lookup = TemplateLookup(
+        directories=[path(__file__).dirname() / 'templates'],
+        default_filters=['decode.utf8']
+    )
+    return LoncapaSystem(
+        ajax_url='/benchmark-ajax-url',
+        anonymous_student_id='benchmark',
+        cache=None,
+        can_execute_unsafe_code=lambda: False,
+        get_python_lib_zip=lambda: None,
+        DEBUG=False,
+        filestore=None,
+        i18n=gettext.NullTranslations(),
+        node_path=os.environ.get("NODE_PATH", "/usr/local/lib/node_modules"),
+        render_template=lambda template, context: lookup.get_template(template).render_unicode(**context),
+        seed=1,
+        STATIC_URL='/static/',
+        xqueue=None,
+    )
+
+
+def find_problem_files(paths):
+    """Return the sorted XML files under `paths` whose root element is <problem>."""
+    found = set()
+    for root in paths:
+        root = path(root)
+        candidates = [root] if root.isfile() else root.walkfiles('*.xml')
+        for candidate in candidates:
+            try:
+                if etree.parse(candidate).getroot().tag == 'problem':
+                    found.add(candidate)
+            except etree.XMLSyntaxError:
+                continue
+    return sorted(found)
+
+
+def timed(func, iterations):
+    """Call `func` `iterations` times and return (total seconds, last result)."""
+    result = None
+    start = time.time()
+    for __ in xrange(iterations):
+        result = func()
+    return time.time() - start, result
+
+
+def summarize(total, count):
+    """Return the JSON summary for `count` operations taking `total` seconds."""
+    return {
+        'count': count,
+        'total_seconds': round(total, 6),
+        'mean_ms': round(1000 * total / count, 4) if count else None,
+        'per_second': round(count / total, 2) if total else None,
+    }
+
+
+def benchmark_problems(problem_files, iterations):
+    """
+    Benchmark parsing, rendering and grading of `problem_files`.
+
+    Returns (per-problem results, grading totals keyed by response tag).
+    """
+    system = benchmark_system()
+    module = BenchmarkModule()
+    results = []
+    grading = defaultdict(lambda: [0.0, 0])
+
+    for problem_file in problem_files:
+        problem_text = problem_file.text(encoding='utf8')
+        make_problem = partial(LoncapaProblem, problem_text, 'benchmark', system, module, seed=1)
+        try:
+            parse_time, problem = timed(make_problem, iterations)
+            render_time, __ = timed(problem.get_html, iterations)
+        except Exception:  # pylint: disable=broad-except
+            log.exception("Could not load %s", problem_file)
+            continue
+
+        answers = dict((answer_id, u'') for answer_id in problem.get_answer_ids())
+        answers.update(
+            (answer_id, answer) for answer_id, answer in problem.get_question_answers().items()
+            if answer_id in answers
+        )
+        responses = defaultdict(lambda: [0.0, 0])
+        for responder in problem.responders.values():
+            tag = responder.tags[0]
+            try:
+                grade_time, __ = timed(partial(responder.evaluate_answers, answers, CorrectMap()), iterations)
+            except Exception:  # pylint: disable=broad-except
+                log.warning("Could not grade %s in %s", tag, problem_file, exc_info=True)
+                continue
+            grading[tag][0] += grade_time
+            grading[tag][1] += iterations
+            responses[tag][0] += grade_time
+            responses[tag][1] += iterations
+
+        results.append({
+            'file': str(problem_file),
+            'parse': summarize(parse_time, iterations),
+            'render': summarize(render_time, iterations),
+            'grade': dict((tag, summarize(total, count)) for tag, (total, count) in responses.items()),
+        })
+    return results, grading
+
+
+def benchmark_evaluator(iterations):
+    """Benchmark `calc.evaluator` on EVALUATOR_EXPRESSIONS."""
+    def evaluate_all():
+        for variables, expression in EVALUATOR_EXPRESSIONS:
+            evaluator(variables, {}, expression)
+    total, __ = timed(evaluate_all, iterations)
+    return summarize(total, iterations * len(EVALUATOR_EXPRESSIONS))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark capa problem parsing, rendering and grading')
+    parser.add_argument("paths", nargs="*", default=[DEFAULT_DATA_DIR],
+                        help="problem XML files or directories to search (default: common/test/data)")
+    parser.add_argument("--iterations", type=int, default=10,
+                        help="number of times each operation is repeated")
+    parser.add_argument("--output", type=argparse.FileType('w'), default=sys.stdout,
+                        help="file to write the JSON results to (default: stdout)")
+    parser.add_argument("--log-level", required=False, default="WARN",
+                        choices=['info', 'debug', 'warn', 'error',
+                                 'INFO', 'DEBUG', 'WARN', 'ERROR'])
+
+    args = parser.parse_args()
+    log.setLevel(args.log_level.upper())
+
+    problem_files = find_problem_files(args.paths)
+    log.info("Benchmarking %d problems", len(problem_files))
+    problems, grading = benchmark_problems(problem_files, args.iterations)
+
+    report = {
+        'timestamp': time.time(),
+        'python': platform.python_version(),
+        'iterations': args.iterations,
+        'totals': {
+            'parse': summarize(
+                sum(problem['parse']['total_seconds'] for problem in problems),
+                args.iterations * len(problems)
+            ),
+            'render': summarize(
+                sum(problem['render']['total_seconds'] for problem in problems),
+                args.iterations * len(problems)
+            ),
+            'grade': dict((tag, summarize(total, count)) for tag, (total, count) in grading.items()),
+            'evaluator': benchmark_evaluator(args.iterations),
+        },
+        'problems': problems,
+    }
+    json.dump(report, args.output, indent=2, sort_keys=True)
+    args.output.write('\n')
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -50,6 +50,7 @@ from . import correctmap
 from .registry import TagRegistry
 from .util import (
     compare_with_tolerance,
+    compile_answer_regexp,
     contextualize_text,
     convert_files_to_filenames,
     default_tolerance,
@@ -614,6 +615,11 @@ class LoncapaResponse(object):
 
 
 #-----------------------------------------------------------------------------
+
+# The checkboxgroup choices of a <choiceresponse>, indexed once per response.
+ChoiceIndex = namedtuple('ChoiceIndex', ['choices', 'by_name', 'compound_hints'])
+
+
 @registry.register
 class ChoiceResponse(LoncapaResponse):
     """
@@ -668,6 +674,7 @@ class ChoiceResponse(LoncapaResponse):
     allowed_inputfields = ['checkboxgroup', 'radiogroup']
     correct_choices = None
     multi_device_support = True
+    _choice_index = None
 
     def setup_response(self):
         self.assign_choice_names()
@@ -701,6 +708,23 @@ class ChoiceResponse(LoncapaResponse):
             if not choice.get('id'):
                 choice.set("id", chr(ord("A") + index))
 
+    def get_choice_index(self):
+        """
+        Return a ChoiceIndex of the checkboxgroup choices and compound hints of this
+        response. The XML lookups are done once, after the choice names are assigned.
+        """
+        if self._choice_index is None:
+            choices = self.xml.xpath('//checkboxgroup[@id=$id]/choice', id=self.answer_id)
+            by_name = {}
+            for choice in choices:
+                by_name.setdefault(choice.get('name'), choice)
+            self._choice_index = ChoiceIndex(
+                choices=choices,
+                by_name=by_name,
+                compound_hints=self.xml.xpath('//checkboxgroup[@id=$id]/compoundhint', id=self.answer_id),
+            )
+        return self._choice_index
+
     def grade_via_every_decision_counts(self, **kwargs):
         """
         Calculates partial credit on the Every Decision Counts scheme.
@@ -874,7 +898,7 @@ class ChoiceResponse(LoncapaResponse):
             return
 
         # Look at all the choices - each can generate some hint text
-        choices = self.xml.xpath('//checkboxgroup[@id=$id]/choice', id=self.answer_id)
+        choices = self.get_choice_index().choices
         hint_log = []
         label = None
         label_count = 0
@@ -928,18 +952,17 @@ class ChoiceResponse(LoncapaResponse):
         """
         compound_hint_matched = False
         if self.answer_id in student_answers:
+            choice_index = self.get_choice_index()
             # First create a set of the student's selected ids
             student_set = set()
             names = []
             for student_answer in student_answers[self.answer_id]:
-                choice_list = self.xml.xpath('//checkboxgroup[@id=$id]/choice[@name=$name]',
-                                             id=self.answer_id, name=student_answer)
-                if choice_list:
-                    choice = choice_list[0]
+                choice = choice_index.by_name.get(student_answer)
+                if choice is not None:
                     student_set.add(choice.get('id').upper())
                     names.append(student_answer)
 
-            for compound_hint in self.xml.xpath('//checkboxgroup[@id=$id]/compoundhint', id=self.answer_id):
+            for compound_hint in choice_index.compound_hints:
                 # Selector words are space separated and not case-sensitive
                 selectors = compound_hint.get('value').upper().split()
                 selector_set = set(selectors)
@@ -948,8 +971,7 @@ class ChoiceResponse(LoncapaResponse):
                     # This is the atypical case where the hint text is in an inner div with its own style.
                     hint_text = compound_hint.text.strip()
                     # Compute the choice names just for logging
-                    choices = self.xml.xpath('//checkboxgroup[@id=$id]/choice', id=self.answer_id)
-                    choice_all = [choice.get('name') for choice in choices]
+                    choice_all = [choice.get('name') for choice in choice_index.choices]
                     hint_log = [{'text': hint_text, 'trigger': [{'choice': name, 'selected': True} for name in names]}]
                     new_cmap[self.answer_id]['msg'] += self.make_hint_div(
                         compound_hint,
@@ -992,6 +1014,7 @@ class MultipleChoiceResponse(LoncapaResponse):
     allowed_inputfields = ['choicegroup']
     correct_choices = None
     multi_device_support = True
+    _choices_by_name = None
 
     def setup_response(self):
         """
@@ -1049,8 +1072,7 @@ class MultipleChoiceResponse(LoncapaResponse):
 
             # Find the named choice used by the student. Silently ignore a non-matching
             # choice name.
-            choice = self.xml.find('./choicegroup[@id="{0}"]/choice[@name="{1}"]'.format(self.answer_id,
-                                                                                         student_answer))
+            choice = self.get_choices_by_name().get(student_answer)
             if choice is not None:
                 hint_node = choice.find('./choicehint')
                 new_cmap[self.answer_id]['msg'] += self.make_hint_div(
@@ -1092,6 +1114,19 @@ class MultipleChoiceResponse(LoncapaResponse):
                 # else:
                 choice.set("name", name)
 
+    def get_choices_by_name(self):
+        """
+        Return a dict of choice name to <choice> element for this response's choicegroup.
+
+        Built on first use rather than in setup_response, because shuffling and
+        answer pools rearrange the choices in late_transforms.
+        """
+        if self._choices_by_name is None:
+            self._choices_by_name = {}
+            for choice in self.xml.findall('./choicegroup[@id="{0}"]/choice'.format(self.answer_id)):
+                self._choices_by_name.setdefault(choice.get('name'), choice)
+        return self._choices_by_name
+
     def late_transforms(self, problem):
         """
         Rearrangements run late in the __init__ process.
@@ -1824,6 +1859,12 @@ class NumericalResponse(LoncapaResponse):
 
 #-----------------------------------------------------------------------------
 
+# The extended hint nodes of a <stringresponse>, collected once per response.
+StringHintPlan = namedtuple(
+    'StringHintPlan',
+    ['expected', 'correcthint', 'additional_answers', 'stringequalhints', 'regexphints']
+)
+
 
 @registry.register
 class StringResponse(LoncapaResponse):
@@ -1866,6 +1907,7 @@ class StringResponse(LoncapaResponse):
     max_inputfields = 1
     correct_answer = []
     multi_device_support = True
+    _hint_plan = None
 
     def setup_response_backward(self):
         self.correct_answer = [
@@ -1924,16 +1966,12 @@ class StringResponse(LoncapaResponse):
         """
         if self.answer_id in student_answers:
             student_answer = student_answers[self.answer_id]
-            # Note the atypical case of using self.id instead of self.answer_id
-            responses = self.xml.xpath('//stringresponse[@id=$id]', id=self.id)
-            if responses:
-                response = responses[0]
-
+            plan = self.get_hint_plan()
+            if plan is not None:
                 # First call the existing check_string to see if this is a right answer by that test.
                 # It handles the various "ci" "regexp" cases internally.
-                expected = response.get('answer').strip()
-                if self.check_string([expected], student_answer):
-                    hint_node = response.find('./correcthint')
+                if self.check_string([plan.expected], student_answer):
+                    hint_node = plan.correcthint
                     if hint_node is not None:
                         new_cmap[self.answer_id]['msg'] += self.make_hint_div(
                             hint_node,
@@ -1944,9 +1982,8 @@ class StringResponse(LoncapaResponse):
                     return
 
                 # Then look for additional answer with an answer= attribute
-                for node in response.findall('./additional_answer'):
+                for node, hint_node in plan.additional_answers:
                     if self.match_hint_node(node, student_answer, self.regexp, self.case_insensitive):
-                        hint_node = node.find('./correcthint')
                         new_cmap[self.answer_id]['msg'] += self.make_hint_div(
                             hint_node,
                             True,
@@ -1956,7 +1993,7 @@ class StringResponse(LoncapaResponse):
                         return
 
                 # stringequalhint and regexphint represent wrong answers
-                for hint_node in response.findall('./stringequalhint'):
+                for hint_node in plan.stringequalhints:
                     if self.match_hint_node(hint_node, student_answer, False, self.case_insensitive):
                         new_cmap[self.answer_id]['msg'] += self.make_hint_div(
                             hint_node,
@@ -1966,7 +2003,7 @@ class StringResponse(LoncapaResponse):
                         )
                         return
 
-                for hint_node in response.findall('./regexphint'):
+                for hint_node in plan.regexphints:
                     if self.match_hint_node(hint_node, student_answer, True, self.case_insensitive):
                         new_cmap[self.answer_id]['msg'] += self.make_hint_div(
                             hint_node,
@@ -1976,6 +2013,28 @@ class StringResponse(LoncapaResponse):
                         )
                         return
 
+    def get_hint_plan(self):
+        """
+        Return a StringHintPlan of the extended hint nodes for this response, or None
+        if the response element cannot be found. The XML lookups are done only once.
+        """
+        if self._hint_plan is None:
+            # Note the atypical case of using self.id instead of self.answer_id
+            responses = self.xml.xpath('//stringresponse[@id=$id]', id=self.id)
+            if not responses:
+                return None
+            response = responses[0]
+            self._hint_plan = StringHintPlan(
+                expected=response.get('answer').strip(),
+                correcthint=response.find('./correcthint'),
+                additional_answers=[
+                    (node, node.find('./correcthint')) for node in response.findall('./additional_answer')
+                ],
+                stringequalhints=response.findall('./stringequalhint'),
+                regexphints=response.findall('./regexphint'),
+            )
+        return self._hint_plan
+
     def match_hint_node(self, node, given, regex_mode, ci_mode):
         """
         Given an xml extended hint node such as additional_answer or regexphint,
@@ -1988,13 +2047,10 @@ class StringResponse(LoncapaResponse):
             return False
 
         if regex_mode:
-            flags = 0
-            if ci_mode:
-                flags = re.IGNORECASE
             try:
                 # We follow the check_string convention/exception, adding ^ and $
-                regex = re.compile('^' + answer + '$', flags=flags | re.UNICODE)
-                return re.search(regex, given)
+                regex = compile_answer_regexp(answer, ci_mode)
+                return regex.search(given)
             except Exception:  # pylint: disable=broad-except
                 return False
 
@@ -2033,10 +2089,9 @@ class StringResponse(LoncapaResponse):
         # end of backward compatibility
 
         if self.regexp:  # regexp match
-            flags = re.IGNORECASE if self.case_insensitive else 0
             try:
-                regexp = re.compile('^' + '|'.join(expected) + '$', flags=flags | re.UNICODE)
-                result = re.search(regexp, given)
+                regexp = compile_answer_regexp('|'.join(expected), self.case_insensitive)
+                result = regexp.search(given)
             except Exception as err:
                 msg = u'[courseware.capa.responsetypes.stringresponse] {error}: {message}'.format(
                     error=_('error'),
@@ -0,0 +1,41 @@
+"""
+Tests for the capa benchmark tool.
+"""
+import os
+import unittest
+
+from capa.benchmark import benchmark_evaluator, benchmark_problems, find_problem_files
+
+TEST_FILES_DIR = os.path.join(os.path.dirname(__file__), 'test_files')
+
+
+class BenchmarkTest(unittest.TestCase):
+    """Smoke tests for capa.benchmark"""
+
+    def test_find_problem_files(self):
+        problem_files = find_problem_files([TEST_FILES_DIR])
+        self.assertIn('extended_hints_text_input.xml', [problem_file.basename() for problem_file in problem_files])
+        self.assertNotIn('snuggletex_correct.html', [problem_file.basename() for problem_file in problem_files])
+
+    def test_benchmark_problems(self):
+        problem_file = os.path.join(TEST_FILES_DIR, 'extended_hints_text_input.xml')
+        results, grading = benchmark_problems(find_problem_files([problem_file]), 2)
+
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0]['parse']['count'], 2)
+        self.assertEqual(results[0]['render']['count'], 2)
+        self.assertIn('stringresponse', results[0]['grade'])
+        self.assertIn('stringresponse', grading)
+
+    def test_benchmark_problems_grade_count(self):
+        # The problem has 7 stringresponses, each graded twice.
+        problem_file = os.path.join(TEST_FILES_DIR, 'extended_hints_text_input.xml')
+        results, grading = benchmark_problems(find_problem_files([problem_file]), 2)
+
+        self.assertEqual(results[0]['grade']['stringresponse']['count'], 14)
+        self.assertEqual(grading['stringresponse'][1], 14)
+
+    def test_benchmark_evaluator(self):
+        summary = benchmark_evaluator(2)
+        self.assertGreater(summary['count'], 0)
+        self.assertGreaterEqual(summary['total_seconds'], 0)
@@ -5,7 +5,13 @@ import unittest
 from lxml import etree
 
 from capa.tests.helpers import test_capa_system
-from capa.util import compare_with_tolerance, sanitize_html, get_inner_html_from_xpath, remove_markup
+from capa.util import (
+    compare_with_tolerance,
+    compile_answer_regexp,
+    sanitize_html,
+    get_inner_html_from_xpath,
+    remove_markup
+)
 
 
 class UtilTest(unittest.TestCase):
@@ -106,6 +112,20 @@ class UtilTest(unittest.TestCase):
         result = compare_with_tolerance(111.0, complex(100.0, 0), '10%', True)
         self.assertTrue(result)
 
+    def test_compile_answer_regexp(self):
+        """
+        Test that answer regexps match whole answers and are compiled only once.
+        """
+        regexp = compile_answer_regexp('ab+c')
+        self.assertTrue(regexp.search('abbc'))
+        self.assertFalse(regexp.search('xabbc'))
+        self.assertFalse(regexp.search('ABC'))
+        self.assertIs(compile_answer_regexp('ab+c'), regexp)
+
+        ci_regexp = compile_answer_regexp('ab+c', case_insensitive=True)
+        self.assertIsNot(ci_regexp, regexp)
+        self.assertTrue(ci_regexp.search('ABC'))
+
     def test_sanitize_html(self):
         """
         Test for html sanitization with bleach.
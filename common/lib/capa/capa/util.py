@@ -17,6 +17,11 @@ from openedx.core.djangolib.markup import HTML
 # Utility functions used in CAPA responsetypes
 default_tolerance = '0.001%'
 
+# Answer regexps are compiled once per process and shared by every response that
+# uses them, since the same problem definitions are re-parsed on each request.
+ANSWER_REGEXP_CACHE_SIZE = 1000
+_answer_regexp_cache = {}
+
 
 def compare_with_tolerance(student_complex, instructor_complex, tolerance=default_tolerance, relative_tolerance=False):
     """
@@ -94,6 +99,27 @@ def compare_with_tolerance(student_complex, instructor_complex, tolerance=defaul
         return abs(student_complex - instructor_complex) <= tolerance
 
 
+def compile_answer_regexp(pattern, case_insensitive=False):
+    """
+    Return a compiled regular expression which matches the whole of a student answer
+    against `pattern`, as used by StringResponse answers and hints.
+
+    Compiled expressions are memoized per process. Invalid patterns raise the same
+    exceptions as `re.compile` and are not cached.
+    """
+    flags = re.UNICODE
+    if case_insensitive:
+        flags |= re.IGNORECASE
+    key = (pattern, flags)
+    regexp = _answer_regexp_cache.get(key)
+    if regexp is None:
+        regexp = re.compile('^' + pattern + '$', flags=flags)
+        if len(_answer_regexp_cache) >= ANSWER_REGEXP_CACHE_SIZE:
+            _answer_regexp_cache.clear()
+        _answer_regexp_cache[key] = regexp
+    return regexp
+
+
 def contextualize_text(text, context):  # private
     """
     Takes a string with variables. E.g. $a+$b.
@@ -8,6 +8,11 @@ from pyparsing import Literal, OneOrMore, ParseException, StringEnd
 
 ARROWS = ('<->', '->')
 
+# Expressions are decomposed once per process, since the instructor's answer is
+# the same on every submission.
+EXPRESSION_CACHE_SIZE = 1000
+_expression_parts_cache = {}
+
 ## Defines a simple pyparsing tokenizer for chemical equations
 elements = ['Ac', 'Ag', 'Al', 'Am', 'Ar', 'As', 'At', 'Au', 'B', 'Ba', 'Be',
             'Bh', 'Bi', 'Bk', 'Br', 'C', 'Ca', 'Cd', 'Ce', 'Cf', 'Cl', 'Cm',
@@ -247,6 +252,52 @@ def _get_final_tree(s):
     return final
 
 
+def _get_expression_parts(s):
+    '''
+    Return (multimolecules, factors, phases) of expression s: tuples of its
+    multimolecules without factors and phases, and of their factors and phases,
+    all in the sorted order of the multimolecules.
+
+    Results are memoized. Raises pyparsing.ParseException if s is invalid.
+    '''
+    if s in _expression_parts_cache:
+        return _expression_parts_cache[s]
+
+    # strip phases and factors
+    # collect factors in list
+    cleaned_mm_list = []
+    factors = []
+    phases = []
+    for el in _get_final_tree(s).subtrees(filter=lambda t: t.node == 'multimolecule'):
+        count_subtree = [t for t in el.subtrees() if t.node == 'count']
+        group_subtree = [t for t in el.subtrees() if t.node == 'group']
+        phase_subtree = [t for t in el.subtrees() if t.node == 'phase']
+        if count_subtree:
+            if len(count_subtree[0]) > 1:
+                factors.append(
+                    int(count_subtree[0][0][0]) /
+                    int(count_subtree[0][2][0]))
+            else:
+                factors.append(int(count_subtree[0][0][0]))
+        else:
+            factors.append(1.0)
+        if phase_subtree:
+            phases.append(phase_subtree[0][0])
+        else:
+            phases.append(' ')
+        cleaned_mm_list.append(
+            Tree('multimolecule', [Tree('molecule', group_subtree)]))
+
+    # order of factors and phases must mirror the order of multimolecules,
+    # use 'decorate, sort, undecorate' pattern
+    parts = tuple(zip(*sorted(zip(cleaned_mm_list, factors, phases))))
+
+    if len(_expression_parts_cache) >= EXPRESSION_CACHE_SIZE:
+        _expression_parts_cache.clear()
+    _expression_parts_cache[s] = parts
+    return parts
+
+
 def _check_equality(tuple1, tuple2):
     ''' return True if tuples of multimolecules are equal '''
     list1 = list(tuple1)
@@ -292,44 +343,9 @@ def divide_chemical_expression(s1, s2, ignore_state=False):
 
     '''
 
-    # parsed final trees
     treedic = {}
-    treedic['1'] = _get_final_tree(s1)
-    treedic['2'] = _get_final_tree(s2)
-
-    # strip phases and factors
-    # collect factors in list
-    for i in ('1', '2'):
-        treedic[i + ' cleaned_mm_list'] = []
-        treedic[i + ' factors'] = []
-        treedic[i + ' phases'] = []
-        for el in treedic[i].subtrees(filter=lambda t: t.node == 'multimolecule'):
-            count_subtree = [t for t in el.subtrees() if t.node == 'count']
-            group_subtree = [t for t in el.subtrees() if t.node == 'group']
-            phase_subtree = [t for t in el.subtrees() if t.node == 'phase']
-            if count_subtree:
-                if len(count_subtree[0]) > 1:
-                    treedic[i + ' factors'].append(
-                        int(count_subtree[0][0][0]) /
-                        int(count_subtree[0][2][0]))
-                else:
-                    treedic[i + ' factors'].append(int(count_subtree[0][0][0]))
-            else:
-                treedic[i + ' factors'].append(1.0)
-            if phase_subtree:
-                treedic[i + ' phases'].append(phase_subtree[0][0])
-            else:
-                treedic[i + ' phases'].append(' ')
-            treedic[i + ' cleaned_mm_list'].append(
-                Tree('multimolecule', [Tree('molecule', group_subtree)]))
-
-    # order of factors and phases must mirror the order of multimolecules,
-    # use 'decorate, sort, undecorate' pattern
-    treedic['1 cleaned_mm_list'], treedic['1 factors'], treedic['1 phases'] = zip(
-        *sorted(zip(treedic['1 cleaned_mm_list'], treedic['1 factors'], treedic['1 phases'])))
-
-    treedic['2 cleaned_mm_list'], treedic['2 factors'], treedic['2 phases'] = zip(
-        *sorted(zip(treedic['2 cleaned_mm_list'], treedic['2 factors'], treedic['2 phases'])))
+    treedic['1 cleaned_mm_list'], treedic['1 factors'], treedic['1 phases'] = _get_expression_parts(s1)
+    treedic['2 cleaned_mm_list'], treedic['2 factors'], treedic['2 phases'] = _get_expression_parts(s2)
 
     # check if expressions are correct without factors
     if not _check_equality(treedic['1 cleaned_mm_list'], treedic['2 cleaned_mm_list']):
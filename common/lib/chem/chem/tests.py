@@ -2,6 +2,7 @@ import codecs
 import unittest
 from fractions import Fraction
 
+import chem.chemcalc
 import chem.miller
 
 from .chemcalc import chemical_equations_equal, compare_chemical_expression, divide_chemical_expression, render_to_html
@@ -213,6 +214,22 @@ class Test_Divide_Expressions(unittest.TestCase):
         self.assertFalse(divide_chemical_expression(
             "6/2CO2 + H2O", "2H2O+9/6CO2"), 2)
 
+    def test_divide_parses_expression_once(self):
+        calls = []
+        get_final_tree = chem.chemcalc._get_final_tree
+
+        def counting_get_final_tree(s):
+            calls.append(s)
+            return get_final_tree(s)
+
+        chem.chemcalc._get_final_tree = counting_get_final_tree
+        try:
+            self.assertEqual(divide_chemical_expression("4NaCl + H2O", "2NaCl(aq)+1/2H2O", ignore_state=True), 2)
+            self.assertEqual(divide_chemical_expression("4NaCl + H2O", "NaCl+1/4H2O", ignore_state=True), 4)
+        finally:
+            chem.chemcalc._get_final_tree = get_final_tree
+        self.assertEqual(calls.count("4NaCl + H2O"), 1)
+
 
 class Test_Render_Equations(unittest.TestCase):
     """
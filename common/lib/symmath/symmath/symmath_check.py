@@ -15,6 +15,30 @@ from .formula import *
 
 log = logging.getLogger(__name__)
 
+# Expected answers are the same for every submission to a problem, so they are
+# parsed once per process. Only immutable sympy expressions are kept.
+EXPECTED_CACHE_SIZE = 500
+_expected_cache = {}
+
+
+def sympify_expected(expect, **kwargs):
+    """
+    Return my_sympify(expect, **kwargs), reusing the result if the same expected
+    answer has been parsed with the same options before.
+    """
+    if kwargs.get('symtab'):
+        return my_sympify(expect, **kwargs)
+
+    key = (expect,) + tuple(sorted(kwargs.items()))
+    sexpr = _expected_cache.get(key)
+    if sexpr is None:
+        sexpr = my_sympify(expect, **kwargs)
+        if isinstance(sexpr, sympy.Basic):
+            if len(_expected_cache) >= EXPECTED_CACHE_SIZE:
+                _expected_cache.clear()
+            _expected_cache[key] = sexpr
+    return sexpr
+
 #-----------------------------------------------------------------------------
 # check function interface
 #
@@ -96,7 +120,8 @@ def check(expect, given, numerical=False, matrix=False, normphase=False, abcsym=
         return {'ok': False, 'msg': 'Error %s<br/> in evaluating your expression "%s"' % (err, given)}
 
     try:
-        xexpect = my_sympify(expect, normphase, matrix, do_qubit=do_qubit, abcsym=abcsym, symtab=symtab)
+        xexpect = sympify_expected(expect, normphase=normphase, matrix=matrix, do_qubit=do_qubit, abcsym=abcsym,
+                                   symtab=symtab)
     except Exception, err:
         return {'ok': False, 'msg': 'Error %s<br/> in evaluating OUR expression "%s"' % (err, expect)}
 
@@ -207,7 +232,7 @@ def symmath_check(expect, ans, dynamath=None, options=None, debug=None, xml=None
 
     # parse expected answer
     try:
-        fexpect = my_sympify(str(expect), matrix=do_matrix, do_qubit=do_qubit)
+        fexpect = sympify_expected(str(expect), matrix=do_matrix, do_qubit=do_qubit)
     except Exception, err:
         msg += '<p>Error %s in parsing OUR expected answer "%s"</p>' % (err, expect)
         return {'ok': False, 'msg': make_error_message(msg)}
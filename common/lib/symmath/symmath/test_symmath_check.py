@@ -1,6 +1,9 @@
 from unittest import TestCase
 
-from .symmath_check import symmath_check
+from mock import patch
+
+from . import symmath_check as symmath_check_module
+from .symmath_check import symmath_check, sympify_expected
 
 
 class SymmathCheckTest(TestCase):
@@ -70,6 +73,20 @@ class SymmathCheckTest(TestCase):
         self.assertTrue('ok' in result and not result['ok'])
         self.assertNotIn('fail', result['msg'])
 
+    def test_expected_answer_parsed_once(self):
+        with patch.object(symmath_check_module, 'my_sympify', wraps=symmath_check_module.my_sympify) as sympify:
+            for ans in ("7*y+x", "x+y+6*y", "x+2*y"):
+                symmath_check("x+7*y", ans)
+        expected_parses = [call for call in sympify.call_args_list if call[0][0] == "x+7*y"]
+        self.assertEqual(len(expected_parses), 1)
+
+    def test_sympify_expected_with_symtab(self):
+        # Symbol tables are not hashable and may change, so those answers are not cached.
+        symtab = {'x': 2}
+        self.assertEqual(sympify_expected("x+1", symtab=symtab), 3)
+        symtab['x'] = 3
+        self.assertEqual(sympify_expected("x+1", symtab=symtab), 4)
+
     def _symmath_check_numbers(self, number_list):
 
         for n in number_list:
@@ -7,6 +7,7 @@ from xblock.fields import Scope, String
 
 from xmodule.raw_module import RawDescriptor
 from xmodule.x_module import XModule
+from xmodule.xml_module import parse_xml_data
 
 log = logging.getLogger(__name__)
 
@@ -63,7 +64,7 @@ class AnnotatableModule(AnnotatableFields, XModule):
     def __init__(self, *args, **kwargs):
         super(AnnotatableModule, self).__init__(*args, **kwargs)
 
-        xmltree = etree.fromstring(self.data)
+        xmltree = parse_xml_data(self.data)
 
         self.instructions = self._extract_instructions(xmltree)
         self.content = etree.tostring(xmltree, encoding='unicode')
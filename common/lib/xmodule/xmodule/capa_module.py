@@ -13,6 +13,7 @@ from xmodule.exceptions import NotFoundError, ProcessingError
 from xmodule.raw_module import RawDescriptor
 from xmodule.util.misc import escape_html_characters
 from xmodule.x_module import DEPRECATION_VSCOMPAT_EVENT, XModule, module_attr
+from xmodule.xml_module import parse_xml_data
 
 from .capa_base import CapaFields, CapaMixin, ComplexEncoder
 from .progress import Progress
@@ -219,7 +220,7 @@ class CapaDescriptor(CapaFields, RawDescriptor):
     def problem_types(self):
         """ Low-level problem type introspection for content libraries filtering by problem type """
         try:
-            tree = etree.XML(self.data)
+            tree = parse_xml_data(self.data, read_only=True)
         except etree.XMLSyntaxError:
             log.error('Error parsing problem types from xml for capa module {}'.format(self.display_name))
             return None  # short-term fix to prevent errors (TNL-5057). Will be more properly addressed in TNL-4525.
@@ -204,9 +204,12 @@ class MongoContentStore(ContentStore):
     def get_all_content_thumbnails_for_course(self, course_key):
         return self._get_all_content_for_course(course_key, get_thumbnails=True)[0]
 
-    def get_all_content_for_course(self, course_key, start=0, maxresults=-1, sort=None, filter_params=None):
+    def get_all_content_for_course(
+        self, course_key, start=0, maxresults=-1, sort=None, filter_params=None, after=None, approximate_count=False
+    ):
         return self._get_all_content_for_course(
-            course_key, start=start, maxresults=maxresults, get_thumbnails=False, sort=sort, filter_params=filter_params
+            course_key, start=start, maxresults=maxresults, get_thumbnails=False, sort=sort,
+            filter_params=filter_params, after=after, approximate_count=approximate_count
         )
 
     def remove_redundant_content_for_courses(self):
@@ -236,7 +239,9 @@ class MongoContentStore(ContentStore):
                                     start=0,
                                     maxresults=-1,
                                     sort=None,
-                                    filter_params=None):
+                                    filter_params=None,
+                                    after=None,
+                                    approximate_count=False):
         '''
         Returns a list of all static assets for a course. The return format is a list of asset data dictionary elements.
 
@@ -246,20 +251,46 @@ class MongoContentStore(ContentStore):
             uploadDate (datetime.datetime): The date and time that the file was uploadDate
             contentType: The mimetype string of the asset
             md5: An md5 hash of the asset content
+
+        If `after` is given, it is the (sort field value, filename) of the last asset
+        of the previous page, and the results start just after that asset instead of
+        skipping `start` assets, so that deep pages cost no more than the first one.
+        `sort` must then be a single (field, direction) pair; ties are broken on filename.
+        Raises ValueError if `after` is given without `sort`.
+
+        If `approximate_count` is True, the total is not counted: the count returned is
+        `start` plus the assets returned, plus one if there are more after them.
         '''
-        query = query_for_course(course_key, "asset" if not get_thumbnails else "thumbnail")
+        course_query = query_for_course(course_key, "asset" if not get_thumbnails else "thumbnail")
+        if filter_params:
+            course_query.update(filter_params)
+        if after is not None and not sort:
+            raise ValueError("Paging after an asset requires a sort order.")
+        if sort:
+            # Break ties on the unique filename so that the order, and so every cursor, is stable.
+            sort = list(sort) + [('filename', sort[-1][1])]
+        query = course_query
+        if after is not None:
+            query = {'$and': [course_query, keyset_query(sort, after)]}
+
         find_args = {"sort": sort}
         if maxresults > 0:
             find_args.update({
-                "skip": start,
-                "limit": maxresults,
+                "skip": start if after is None else 0,
+                "limit": maxresults + 1 if approximate_count else maxresults,
             })
-        if filter_params:
-            query.update(filter_params)
 
         items = self.fs_files.find(query, **find_args)
-        count = items.count()
-        assets = list(items)
+        if approximate_count:
+            assets = list(items)
+            has_more = maxresults > 0 and len(assets) > maxresults
+            if has_more:
+                assets = assets[:maxresults]
+            count = start + len(assets) + (1 if has_more else 0)
+        else:
+            # The total counts the assets of the whole course, not only those after the cursor.
+            count = self.fs_files.find(course_query).count() if after is not None else items.count()
+            assets = list(items)
 
         # We're constructing the asset key immediately after retrieval from the database so that
         # callers are insulated from knowing how our identifiers are stored.
@@ -501,6 +532,35 @@ class MongoContentStore(ContentStore):
             sparse=True,
             background=True
         )
+        # Indexes for the keyset pagination of `_get_all_content_for_course`, which sorts on
+        # `uploadDate` or `displayname` and breaks ties on `filename`.
+        for prefix in ('_id', 'content_son'):
+            for sort_field in ('uploadDate', 'displayname'):
+                create_collection_index(
+                    self.fs_files,
+                    [
+                        ('{}.org'.format(prefix), pymongo.ASCENDING),
+                        ('{}.course'.format(prefix), pymongo.ASCENDING),
+                        (sort_field, pymongo.ASCENDING),
+                        ('filename', pymongo.ASCENDING)
+                    ],
+                    sparse=True,
+                    background=True
+                )
+
+
+def keyset_query(sort, after):
+    """
+    Construct the query for the items sorted by `sort`, a list of (field, direction)
+    pairs ending with the tie-breaking field, which come after the item whose values
+    for those fields are `after`.
+    """
+    clauses = []
+    for index, (field, direction) in enumerate(sort):
+        clause = SON((previous_field, value) for (previous_field, __), value in zip(sort[:index], after))
+        clause[field] = {'$gt' if direction == pymongo.ASCENDING else '$lt': after[index]}
+        clauses.append(clause)
+    return {'$or': clauses}
 
 
 def query_for_course(course_key, category=None):
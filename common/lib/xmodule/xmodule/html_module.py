@@ -69,13 +69,21 @@ class HtmlBlock(object):
         scope=Scope.settings
     )
 
-    @XBlock.supports("multi_device")
+    @XBlock.supports("multi_device", "render_cache")
     def student_view(self, _context):
         """
         Return a fragment that contains the html for the student view
         """
         return Fragment(self.get_html())
 
+    def has_support(self, view, functionality):
+        """
+        The student view can't be shared between learners once it has their id substituted in.
+        """
+        if functionality == "render_cache" and "%%USER_ID%%" in self.data:
+            return False
+        return super(HtmlBlock, self).has_support(view, functionality)
+
     def get_html(self):
         """ Returns html required for rendering XModule. """
 
@@ -7,6 +7,7 @@ import unittest
 import mimetypes
 from tempfile import mkdtemp
 import path
+import pymongo
 import shutil
 
 from opaque_keys.edx.locator import CourseLocator, AssetLocator
@@ -165,6 +166,62 @@ class TestContentstore(unittest.TestCase):
         self.assertEqual(count, 0)
         self.assertEqual(course_assets, [])
 
+    @ddt.data(True, False)
+    def test_get_all_content_after(self, deprecated):
+        """
+        Test paging through get_all_content_for_course with keyset cursors
+        """
+        self.set_up_assets(deprecated)
+        sort = [('displayname', pymongo.DESCENDING)]
+        all_assets, __ = self.contentstore.get_all_content_for_course(self.course1_key, sort=sort)
+
+        paged_assets = []
+        after = None
+        while True:
+            page, count = self.contentstore.get_all_content_for_course(
+                self.course1_key, start=len(paged_assets), maxresults=2, sort=sort, after=after
+            )
+            self.assertEqual(count, len(self.course1_files))
+            if not page:
+                break
+            paged_assets.extend(page)
+            after = (page[-1]['displayname'], page[-1]['filename'])
+
+        self.assertEqual(
+            [asset['filename'] for asset in paged_assets],
+            [asset['filename'] for asset in all_assets]
+        )
+        self.assertEqual(
+            [asset['displayname'] for asset in paged_assets],
+            sorted(self.course1_files, reverse=True)
+        )
+
+    def test_get_all_content_after_without_sort(self):
+        """
+        Test that paging with a keyset cursor requires a sort order
+        """
+        self.set_up_assets(False)
+        with self.assertRaises(ValueError):
+            self.contentstore.get_all_content_for_course(self.course1_key, maxresults=2, after=(u'a', u'a'))
+
+    @ddt.data(True, False)
+    def test_get_all_content_approximate_count(self, deprecated):
+        """
+        Test that an approximate count only counts as far as the page returned
+        """
+        self.set_up_assets(deprecated)
+        assets, count = self.contentstore.get_all_content_for_course(
+            self.course1_key, maxresults=1, approximate_count=True
+        )
+        self.assertEqual(len(assets), 1)
+        self.assertEqual(count, 2)
+
+        assets, count = self.contentstore.get_all_content_for_course(
+            self.course1_key, start=2, maxresults=2, approximate_count=True
+        )
+        self.assertEqual(len(assets), 1)
+        self.assertEqual(count, 3)
+
     @ddt.data(True, False)
     def test_attrs(self, deprecated):
         """
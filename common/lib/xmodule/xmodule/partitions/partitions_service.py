@@ -37,6 +37,43 @@ def get_all_partitions_for_course(course, active_only=False):
     return all_partitions
 
 
+def get_groups_for_users(course_key, user_partitions, users, assign=True):
+    """
+    Returns the groups from the given user partitions to which the given users
+    are assigned, as a dict of {partition_id: {user_id: Group}}. Users who are
+    not in a group of a partition are absent from its dict.
+
+    The partitions of a scheme that implements `get_groups_for_users` are
+    resolved together, with a few queries for all the users; the others
+    are resolved one user at a time with `get_group_for_user`.
+
+    Args:
+        course_key: the course of the partitions.
+        user_partitions: the UserPartitions to resolve.
+        users: the users whose groups should be returned.
+        assign: whether to assign the users who aren't in a group yet, if
+            the scheme of the partition assigns users.
+    """
+    partitions_by_scheme = {}
+    for user_partition in user_partitions:
+        partitions_by_scheme.setdefault(user_partition.scheme, []).append(user_partition)
+
+    groups = {}
+    for scheme, scheme_partitions in partitions_by_scheme.iteritems():
+        if hasattr(scheme, 'get_groups_for_users'):
+            groups.update(scheme.get_groups_for_users(course_key, users, scheme_partitions, assign=assign))
+            continue
+        # Not every scheme takes the assign argument, and assigning is their default.
+        kwargs = {} if assign else {'assign': False}
+        for user_partition in scheme_partitions:
+            partition_groups = groups[user_partition.id] = {}
+            for user in users:
+                group = scheme.get_group_for_user(course_key, user, user_partition, **kwargs)
+                if group is not None:
+                    partition_groups[user.id] = group
+    return groups
+
+
 def _get_dynamic_partitions(course):
     """
     Return the dynamic user partitions for this course.
@@ -5,7 +5,7 @@ from lxml import etree
 from xblock.fields import Scope, String
 
 from xmodule.editing_module import XMLEditingDescriptor
-from xmodule.xml_module import XmlDescriptor
+from xmodule.xml_module import XmlDescriptor, parse_xml_data
 
 log = logging.getLogger(__name__)
 
@@ -25,7 +25,7 @@ class RawDescriptor(XmlDescriptor, XMLEditingDescriptor):
 
     def definition_to_xml(self, resource_fs):
         try:
-            return etree.fromstring(self.data)
+            return parse_xml_data(self.data)
         except etree.XMLSyntaxError as err:
             # Can't recover here, so just add some info and
             # re-raise
@@ -58,5 +58,5 @@ class EmptyDataRawDescriptor(XmlDescriptor, XMLEditingDescriptor):
 
     def definition_to_xml(self, resource_fs):
         if self.data:
-            return etree.fromstring(self.data)
+            return parse_xml_data(self.data)
         return etree.Element(self.category)
@@ -298,12 +298,26 @@ class SequenceModule(SequenceFields, ProctoringFields, XModule):
         sequential.  If banner_text is given, it is added to the
         content.
         """
-        display_items = self.get_display_items()
-        self._update_position(context, len(display_items))
-
         fragment = Fragment()
+        navigation = context.get('sequence_navigation')
+        current_item = None
+        if navigation:
+            self._update_position(context, len(navigation))
+            current_item = self._get_child_module(navigation[self.position - 1]['id'])
+
+        if current_item is not None:
+            items = self._render_student_view_for_active_item(context, navigation, current_item, fragment)
+        else:
+            # The navigation doesn't match this sequence's children, render every unit.
+            navigation = None
+            display_items = self.get_display_items()
+            self._update_position(context, len(display_items))
+            items = self._render_student_view_for_items(context, display_items, fragment)
+            if 1 <= self.position <= len(display_items):
+                current_item = display_items[self.position - 1]
+
         params = {
-            'items': self._render_student_view_for_items(context, display_items, fragment),
+            'items': items,
             'element_id': self.location.html_id(),
             'item_id': self.location.to_deprecated_string(),
             'position': self.position,
@@ -315,8 +329,12 @@ class SequenceModule(SequenceFields, ProctoringFields, XModule):
         }
         fragment.add_content(self.system.render_template("seq_module.html", params))
 
-        self._capture_full_seq_item_metrics(display_items)
-        self._capture_current_unit_metrics(display_items)
+        if navigation:
+            if newrelic:
+                newrelic.agent.add_custom_parameter('seq.num_units', len(navigation))
+        else:
+            self._capture_full_seq_item_metrics(display_items)
+        self._capture_current_unit_metrics(current_item)
 
         return fragment
 
@@ -368,6 +386,54 @@ class SequenceModule(SequenceFields, ProctoringFields, XModule):
 
         return contents
 
+    def _get_child_module(self, usage_id):
+        """
+        Returns the child module with the given (deprecated string) usage id,
+        instantiating only that child, or None if there is no such visible child.
+        """
+        for child in self.descriptor.get_children():
+            if child.scope_ids.usage_id.to_deprecated_string() == usage_id:
+                return self.system.get_module(child)
+        return None
+
+    def _render_student_view_for_active_item(self, context, navigation, active_item, fragment):
+        """
+        Like `_render_student_view_for_items`, but only renders active_item, the
+        child at the current position. The tabs are built from `navigation`, a
+        list of dicts with the 'id', 'display_name', 'page_title', 'type',
+        'bookmarked' and 'url' of every unit, as precomputed by the LMS from the
+        course blocks, and the content of the other tabs loads their 'url'.
+        """
+        active_id = navigation[self.position - 1]['id']
+        context["username"] = self.runtime.service(self, "user").get_current_user().opt_attrs['edx-platform.username']
+        display_names = [
+            self.get_parent().display_name_with_default,
+            self.display_name_with_default
+        ]
+        contents = []
+        for item in navigation:
+            if item['id'] == active_id:
+                context["bookmarked"] = item['bookmarked']
+                rendered_item = active_item.render(STUDENT_VIEW, context)
+                fragment.add_frag_resources(rendered_item)
+                content = rendered_item.content
+            else:
+                content = self.system.render_template(
+                    "seq_unit_link.html", {'url': item['url'], 'title': item['display_name']}
+                )
+
+            iteminfo = {
+                'content': content,
+                'page_title': item['page_title'],
+                'type': item['type'],
+                'id': item['id'],
+                'bookmarked': item['bookmarked'],
+                'path': " > ".join(display_names + [item['display_name']]),
+            }
+            contents.append(iteminfo)
+
+        return contents
+
     def _locations_in_subtree(self, node):
         """
         The usage keys for all descendants of an XBlock/XModule as a flat list.
@@ -418,18 +484,18 @@ class SequenceModule(SequenceFields, ProctoringFields, XModule):
         for block_type, count in block_counts.items():
             newrelic.agent.add_custom_parameter('seq.block_counts.{}'.format(block_type), count)
 
-    def _capture_current_unit_metrics(self, display_items):
+    def _capture_current_unit_metrics(self, current):
         """
         Capture information about the current selected Unit within the Sequence.
+        `current` is None if the saved position is out of bounds.
         """
         if not newrelic:
             return
         # Positions are stored with indexing starting at 1. If we get into a
         # weird state where the saved position is out of bounds (e.g. the
         # content was changed), avoid going into any details about this unit.
-        if 1 <= self.position <= len(display_items):
+        if current is not None:
             # Basic info about the Unit...
-            current = display_items[self.position - 1]
             newrelic.agent.add_custom_parameter('seq.current.block_id', unicode(current.location))
             newrelic.agent.add_custom_parameter('seq.current.display_name', current.display_name or '')
 
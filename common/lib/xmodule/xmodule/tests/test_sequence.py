@@ -134,6 +134,49 @@ class SequenceBlockTestCase(XModuleXmlImportTest):
         for child in self.sequence_3_1.children:
             self.assertIn("'page_title': '{}'".format(child.name), html)
 
+    def _sequence_navigation(self, sequence):
+        """
+        Returns a precomputed sequence navigation for the children of the given sequence.
+        """
+        return [
+            {
+                'id': child.to_deprecated_string(),
+                'display_name': child.name,
+                'page_title': child.name,
+                'type': 'other',
+                'bookmarked': False,
+                'url': '/unit/{}'.format(position),
+            }
+            for position, child in enumerate(sequence.children, start=1)
+        ]
+
+    def test_sequence_navigation_renders_active_unit_only(self):
+        navigation = self._sequence_navigation(self.sequence_3_1)
+        with patch.object(SequenceModule, 'get_display_items') as mock_get_display_items:
+            html = self._get_rendered_student_view(
+                self.sequence_3_1,
+                requested_child='last',
+                extra_context=dict(sequence_navigation=navigation),
+            )
+        self.assertFalse(mock_get_display_items.called)
+        self._assert_view_at_position(html, expected_position=3)
+        self.assertIn("'url': '/unit/1'", html)
+        self.assertIn("'url': '/unit/2'", html)
+        self.assertNotIn("'url': '/unit/3'", html)
+        bookmarks_service = self.sequence_3_1.xmodule_runtime._services['bookmarks']  # pylint: disable=protected-access
+        self.assertFalse(bookmarks_service.is_bookmarked.called)
+
+    def test_sequence_navigation_mismatch(self):
+        navigation = self._sequence_navigation(self.sequence_3_1)
+        navigation[0]['id'] = 'i4x://org/course/vertical/deleted'
+        html = self._get_rendered_student_view(
+            self.sequence_3_1,
+            requested_child='first',
+            extra_context=dict(sequence_navigation=navigation),
+        )
+        self._assert_view_at_position(html, expected_position=1)
+        self.assertNotIn("'url': '/unit/2'", html)
+
     def test_hidden_content_before_due(self):
         html = self._get_rendered_student_view(self.sequence_4_1)
         self.assertIn("seq_module.html", html)
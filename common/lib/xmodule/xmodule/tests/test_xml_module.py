@@ -3,7 +3,8 @@
 
 import unittest
 
-from mock import Mock
+from lxml import etree
+from mock import Mock, patch
 from nose.tools import assert_equals, assert_not_equals, assert_true, assert_false, assert_in, assert_not_in  # pylint: disable=no-name-in-module
 from opaque_keys.edx.locator import BlockUsageLocator, CourseLocator
 
@@ -14,7 +15,7 @@ from xblock.runtime import KvsFieldData, DictKeyValueStore
 from xmodule.fields import Date, Timedelta, RelativeTime
 from xmodule.modulestore.inheritance import InheritanceKeyValueStore, InheritanceMixin, InheritingFieldData
 from xmodule.modulestore.split_mongo.split_mongo_kvs import SplitMongoKVS
-from xmodule.xml_module import XmlDescriptor, serialize_field, deserialize_field
+from xmodule.xml_module import XmlDescriptor, serialize_field, deserialize_field, parse_xml_data
 from xmodule.course_module import CourseDescriptor
 from xmodule.seq_module import SequenceDescriptor
 from xmodule.x_module import XModuleMixin
@@ -388,6 +389,38 @@ class TestSerialize(unittest.TestCase):
                       serialize_field("1 day 12 hours 59 minutes 59 seconds"))
 
 
+class TestParseXmlData(unittest.TestCase):
+    """ Tests the cache of parsed descriptor XML data. """
+    DATA = u'<problem display_name="Caf\xe9"><p>Text</p></problem>'
+
+    def test_parse(self):
+        root = parse_xml_data(self.DATA)
+        self.assertEqual(root.tag, 'problem')
+        self.assertEqual(root.get('display_name'), u'Caf\xe9')
+        self.assertEqual(etree.tostring(root, encoding='unicode'), self.DATA)
+
+    def test_parsed_once(self):
+        with patch('xmodule.xml_module.etree.fromstring', wraps=etree.fromstring) as fromstring:
+            parse_xml_data(self.DATA + u' ')
+            parse_xml_data(self.DATA + u' ')
+        self.assertEqual(fromstring.call_count, 1)
+
+    def test_copies_are_independent(self):
+        first = parse_xml_data(self.DATA)
+        first.set('display_name', 'changed')
+        first.remove(first[0])
+        second = parse_xml_data(self.DATA)
+        self.assertEqual(second.get('display_name'), u'Caf\xe9')
+        self.assertEqual(len(second), 1)
+
+    def test_read_only_is_shared(self):
+        self.assertIs(parse_xml_data(self.DATA, read_only=True), parse_xml_data(self.DATA, read_only=True))
+
+    def test_invalid_xml(self):
+        with self.assertRaises(etree.XMLSyntaxError):
+            parse_xml_data(u'<problem>')
+
+
 class TestDeserialize(unittest.TestCase):
     def assertDeserializeEqual(self, expected, arg):
         """
@@ -10,6 +10,7 @@ from xmodule.annotator_mixin import get_instructions
 from xmodule.annotator_token import retrieve_token
 from xmodule.raw_module import RawDescriptor
 from xmodule.x_module import XModule
+from xmodule.xml_module import parse_xml_data
 
 # Make '_' a no-op so we can scrape strings. Using lambda instead of
 #  `django.utils.translation.ugettext_noop` because Django cannot be imported in this file
@@ -100,7 +101,7 @@ class TextAnnotationModule(AnnotatableFields, XModule):
     def __init__(self, *args, **kwargs):
         super(TextAnnotationModule, self).__init__(*args, **kwargs)
 
-        xmltree = etree.fromstring(self.data)
+        xmltree = parse_xml_data(self.data)
 
         self.instructions = self._extract_instructions(xmltree)
         self.content = etree.tostring(xmltree, encoding='unicode')
@@ -3,8 +3,10 @@ Utility functions for transcripts.
 ++++++++++++++++++++++++++++++++++
 """
 from django.conf import settings
+from django.core.cache import cache
 import os
 import copy
+import hashlib
 import json
 import requests
 import logging
@@ -21,6 +23,10 @@ from .bumper_utils import get_bumper_settings
 
 log = logging.getLogger(__name__)
 
+# Conversions are cached against the digest of the asset they were converted from,
+# so they never need to expire: a new upload is looked up under a new key.
+TRANSCRIPT_CONVERSION_CACHE_TIMEOUT = 60 * 60 * 24 * 7
+
 
 class TranscriptException(Exception):  # pylint: disable=missing-docstring
     pass
@@ -511,6 +517,30 @@ class Transcript(object):
             elif output_format == 'srt':
                 return generate_srt_from_sjson(json.loads(content), speed=1.0)
 
+    @staticmethod
+    def convert_asset(asset, input_format, output_format):
+        """
+        Convert the transcript stored in the `asset` StaticContent from `input_format`
+        to `output_format`, as `convert` does.
+
+        Each conversion of a version of an asset is only done once, and then cached.
+        """
+        if input_format == output_format:
+            return asset.data
+
+        version = asset.content_digest or (asset.last_modified_at and asset.last_modified_at.isoformat())
+        if not version:
+            return Transcript.convert(asset.data, input_format, output_format)
+
+        cache_key = 'video_transcripts.converted.{}'.format(hashlib.md5(u'{}:{}:{}:{}'.format(
+            asset.location, version, input_format, output_format
+        ).encode('utf-8')).hexdigest())
+        content = cache.get(cache_key)
+        if content is None:
+            content = Transcript.convert(asset.data, input_format, output_format)
+            cache.set(cache_key, content, TRANSCRIPT_CONVERSION_CACHE_TIMEOUT)
+        return content
+
     @staticmethod
     def asset(location, subs_id, lang='en', filename=None):
         """
@@ -640,13 +670,13 @@ class VideoTranscriptsMixin(object):
                 log.debug("No subtitles for 'en' language")
                 raise ValueError
 
-            data = Transcript.asset(self.location, transcript_name, lang).data
+            asset = Transcript.asset(self.location, transcript_name, lang)
             filename = u'{}.{}'.format(transcript_name, transcript_format)
-            content = Transcript.convert(data, 'sjson', transcript_format)
+            content = Transcript.convert_asset(asset, 'sjson', transcript_format)
         else:
-            data = Transcript.asset(self.location, None, None, other_lang[lang]).data
+            asset = Transcript.asset(self.location, None, None, other_lang[lang])
             filename = u'{}.{}'.format(os.path.splitext(other_lang[lang])[0], transcript_format)
-            content = Transcript.convert(data, 'srt', transcript_format)
+            content = Transcript.convert_asset(asset, 'srt', transcript_format)
 
         if not content:
             log.debug('no subtitles produced in get_transcript')
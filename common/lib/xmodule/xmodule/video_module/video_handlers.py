@@ -30,6 +30,10 @@ from .transcripts_utils import (
 
 log = logging.getLogger(__name__)
 
+# How long browsers may reuse a transcript before asking for it again.  Kept short
+# because the handler urls stay the same when a transcript is replaced.
+TRANSCRIPT_MAX_AGE = 5 * 60
+
 
 # Disable no-member warning:
 # pylint: disable=no-member
@@ -253,6 +257,8 @@ class VideoStudentViewHandlers(object):
             else:
                 response = Response(transcript, headerlist=[('Content-Language', language)])
                 response.content_type = Transcript.mime_types['sjson']
+                response.cache_control.private = True
+                response.cache_control.max_age = TRANSCRIPT_MAX_AGE
 
         elif dispatch == 'download':
             lang = request.GET.get('lang', None)
@@ -273,6 +279,8 @@ class VideoStudentViewHandlers(object):
                     charset='utf8'
                 )
                 response.content_type = transcript_mime_type
+                response.cache_control.private = True
+                response.cache_control.max_age = TRANSCRIPT_MAX_AGE
 
         elif dispatch.startswith('available_translations'):
 
@@ -38,7 +38,7 @@ from xmodule.raw_module import EmptyDataRawDescriptor
 from xmodule.validation import StudioValidation, StudioValidationMessage
 from xmodule.video_module import manage_video_subtitles_save
 from xmodule.x_module import XModule, module_attr
-from xmodule.xml_module import deserialize_field, is_pointer_tag, name_to_pathname
+from xmodule.xml_module import deserialize_field, is_pointer_tag, name_to_pathname, parse_xml_data
 
 from .bumper_utils import bumperize
 from .transcripts_utils import Transcript, VideoTranscriptsMixin, get_html5_ids
@@ -420,7 +420,7 @@ class VideoDescriptor(VideoFields, VideoTranscriptsMixin, VideoStudioViewHandler
         super(VideoDescriptor, self).__init__(*args, **kwargs)
         # For backwards compatibility -- if we've got XML data, parse it out and set the metadata fields
         if self.data:
-            field_data = self._parse_video_xml(etree.fromstring(self.data))
+            field_data = self._parse_video_xml(parse_xml_data(self.data, read_only=True))
             self._field_data.set_many(self, field_data)
             del self.data
 
@@ -1,8 +1,11 @@
 import copy
+import hashlib
 import json
 import logging
 import os
 import sys
+import threading
+from collections import OrderedDict
 
 from lxml import etree
 from lxml.etree import Element, ElementTree, XMLParser
@@ -22,6 +25,12 @@ EDX_XML_PARSER = XMLParser(dtd_validation=False, load_dtd=False,
                            remove_comments=True, remove_blank_text=True,
                            encoding='utf-8')
 
+# Trees parsed from descriptors' XML `data` fields, keyed by a hash of the XML
+# text, so that the same problem or video XML is parsed once per process.
+XML_DATA_CACHE_SIZE = 500
+_parsed_xml_data = OrderedDict()
+_parsed_xml_data_lock = threading.Lock()
+
 
 def name_to_pathname(name):
     """
@@ -55,6 +64,35 @@ def is_pointer_tag(xml_obj):
     return len(xml_obj) == 0 and actual_attr == expected_attr and not has_text
 
 
+def parse_xml_data(data, read_only=False):
+    """
+    Return the root element of the XML string `data`, as `etree.fromstring` would.
+
+    Parsed trees are kept in a bounded, least-recently-used cache keyed by the
+    hash of `data`. By default the caller gets its own copy of the cached tree,
+    which it is free to modify. Callers which only read the tree can pass
+    `read_only=True` to share the cached tree instead; they must not modify it.
+
+    Raises etree.XMLSyntaxError if `data` is not well-formed; errors are not cached.
+    """
+    encoded = data.encode('utf-8') if isinstance(data, unicode) else data
+    key = (isinstance(data, unicode), hashlib.sha1(encoded).hexdigest())
+
+    with _parsed_xml_data_lock:
+        root = _parsed_xml_data.pop(key, None)
+        if root is not None:
+            _parsed_xml_data[key] = root
+
+    if root is None:
+        root = etree.fromstring(data)
+        with _parsed_xml_data_lock:
+            _parsed_xml_data[key] = root
+            while len(_parsed_xml_data) > XML_DATA_CACHE_SIZE:
+                _parsed_xml_data.popitem(last=False)
+
+    return root if read_only else copy.deepcopy(root)
+
+
 def serialize_field(value):
     """
     Return a string version of the value (where value is the JSON-formatted, internally stored value).
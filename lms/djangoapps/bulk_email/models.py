@@ -2,6 +2,8 @@
 Models for bulk email
 """
 import logging
+import re
+from string import Formatter
 
 import markupsafe
 from config_models.models import ConfigurationModel
@@ -404,6 +406,100 @@ class CourseEmailTemplate(models.Model):
                 context[key] = markupsafe.escape(value)
         return CourseEmailTemplate._render(self.html_template, htmltext, context)
 
+    def get_renderer(self, global_context, recipient_keys):
+        """
+        Returns a CourseEmailRenderer for this template, that formats the
+        values of `global_context` into the templates once.
+        """
+        return CourseEmailRenderer(self, global_context, recipient_keys)
+
+
+class CourseEmailRenderer(object):
+    """
+    Renders the same messages as CourseEmailTemplate.render_plaintext and
+    render_htmltext, for the contexts made of a `global_context` that is
+    shared by all the recipients and of the values of the `recipient_keys`.
+
+    The templates are parsed, and the fields that only depend on
+    `global_context` are formatted, once.
+    """
+
+    def __init__(self, template, global_context, recipient_keys):
+        self.global_context = dict(global_context)
+        self.html_global_context = _escape_context(self.global_context)
+        self.recipient_keys = frozenset(recipient_keys)
+        self._plain_template = self._compile(template.plain_template, self.global_context)
+        self._html_template = self._compile(template.html_template, self.html_global_context)
+
+    def _compile(self, format_string, global_context):
+        """
+        Returns the parts of `format_string`: the literal text and the formatted
+        fields of `global_context`, and the fields, in format string syntax,
+        that depend on the recipient.
+        """
+        formatter = Formatter()
+        parts = []
+        text = u''
+        for literal_text, field_name, format_spec, conversion in formatter.parse(format_string):
+            text += literal_text
+            if field_name is None:
+                continue
+            field = u'{{{name}{conversion}{format_spec}}}'.format(
+                name=field_name,
+                conversion='!' + conversion if conversion else '',
+                format_spec=':' + format_spec if format_spec else '',
+            )
+            if re.match(r'[^.[]*', field_name).group() in self.recipient_keys or '{' in format_spec:
+                parts.append((text, field))
+                text = u''
+            else:
+                text += formatter.vformat(field, (), global_context)
+        parts.append((text, None))
+        return parts
+
+    def render_plaintext(self, plaintext, recipient_context):
+        """
+        Create plain text message for the recipient with the values in
+        `recipient_context`.
+        """
+        context = dict(self.global_context, **recipient_context)
+        return self._render(self._plain_template, plaintext, context)
+
+    def render_htmltext(self, htmltext, recipient_context):
+        """
+        Create HTML text message for the recipient with the values in
+        `recipient_context`.
+        """
+        context = dict(self.html_global_context, **_escape_context(recipient_context))
+        return self._render(self._html_template, htmltext, context)
+
+    @staticmethod
+    def _render(template_parts, message_body, context):
+        """
+        Same as CourseEmailTemplate._render, for a compiled template.
+        """
+        if 'user_id' in context and 'course_id' in context:
+            message_body = substitute_keywords_with_data(message_body, context)
+
+        result = u''.join(
+            text + (field.format(**context) if field else u'')
+            for text, field in template_parts
+        )
+
+        message_body_tag = COURSE_EMAIL_MESSAGE_BODY_TAG.format()
+        result = result.replace(message_body_tag, message_body, 1)
+        return wrap_message(result)
+
+
+def _escape_context(context):
+    """
+    Returns a copy of `context` with its string values HTML-escaped.
+    """
+    return {
+        key: markupsafe.escape(value) if isinstance(value, basestring) else value
+        for key, value in context.iteritems()
+    }
+
 
 class CourseAuthorization(models.Model):
     """
@@ -470,6 +566,22 @@ class BulkEmailFlag(ConfigurationModel):
         else:  # implies enabled == True and require_course_email == False, so email is globally enabled
             return True
 
+    @classmethod
+    def courses_with_feature_enabled(cls, course_ids):
+        """
+        Returns the set of the given course ids for which feature_enabled is True,
+        with a single query for the course-specific authorizations.
+        """
+        if not BulkEmailFlag.is_enabled():
+            return set()
+        elif BulkEmailFlag.current().require_course_email_auth:
+            return {
+                authorization.course_id
+                for authorization in CourseAuthorization.objects.filter(course_id__in=course_ids, email_enabled=True)
+            }
+        else:
+            return set(course_ids)
+
     class Meta(object):
         app_label = "bulk_email"
 
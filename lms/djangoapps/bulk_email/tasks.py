@@ -7,10 +7,13 @@ import json
 import logging
 import random
 import re
+import sys
+import threading
 from collections import Counter
 from smtplib import SMTPConnectError, SMTPDataError, SMTPException, SMTPServerDisconnected
-from time import sleep
+from time import sleep, time
 
+import six
 from boto.exception import AWSConnectionError
 from boto.ses.exceptions import (
     SESAddressBlacklistedError,
@@ -93,6 +96,13 @@ BULK_EMAIL_FAILURE_ERRORS = (
 )
 
 
+# Fields of the (id, email, name) tuples that are passed to subtasks for each recipient.
+RECIPIENT_FIELDS = ('pk', 'email', 'profile__name')
+
+# Number of messages rendered at once for each of the connections of a subtask.
+SEND_BATCH_SIZE = 20
+
+
 def _get_course_email_context(course):
     """
     Returns context arguments to apply to all emails, independent of recipient.
@@ -173,15 +183,16 @@ def perform_delegate_email_batches(entry_id, course_id, task_input, action_name)
     targets = email_obj.targets.all()
     global_email_context = _get_course_email_context(course)
 
+    # Users who opted out of the course's email are excluded from each target's query.
+    optout_user_ids = Optout.objects.filter(course_id=course_id, user__isnull=False).values('user_id')
     recipient_qsets = [
-        target.get_users(course_id, user_id)
+        target.get_users(course_id, user_id).exclude(id__in=optout_user_ids)
         for target in targets
     ]
     combined_set = User.objects.none()
     for qset in recipient_qsets:
         combined_set |= qset
     combined_set = combined_set.distinct()
-    recipient_fields = ['profile__name', 'email']
 
     log.info(u"Task %s: Preparing to queue subtasks for sending emails for course %s, email %s",
              task_id, course_id, email_id)
@@ -221,8 +232,8 @@ def perform_delegate_email_batches(entry_id, course_id, task_input, action_name)
         entry,
         action_name,
         _create_send_email_subtask,
-        [combined_set],
-        recipient_fields,
+        recipient_qsets,
+        RECIPIENT_FIELDS[1:],
         settings.BULK_EMAIL_EMAILS_PER_TASK,
         total_recipients,
     )
@@ -243,7 +254,8 @@ def send_course_email(entry_id, email_id, to_list, global_email_context, subtask
     Inputs are:
       * `entry_id`: id of the InstructorTask object to which progress should be recorded.
       * `email_id`: id of the CourseEmail model that is to be emailed.
-      * `to_list`: list of recipients.  Each is represented as a dict with the following keys:
+      * `to_list`: list of recipients.  Each is represented as an (id, email, name) tuple, as queued
+        by perform_delegate_email_batches, or as a dict with the following keys:
         - 'profile__name': full name of User.
         - 'email': email address of User.
         - 'pk': primary key of User model.
@@ -340,14 +352,14 @@ def _filter_optouts_from_recipients(to_list, course_id):
     """
     optouts = Optout.objects.filter(
         course_id=course_id,
-        user__in=[i['pk'] for i in to_list]
-    ).values_list('user__email', flat=True)
+        user_id__in=[i['pk'] for i in to_list]
+    ).values_list('user_id', flat=True)
     optouts = set(optouts)
     # Only count the num_optout for the first time the optouts are calculated.
     # We assume that the number will not change on retries, and so we don't need
     # to calculate it each time.
     num_optout = len(optouts)
-    to_list = [recipient for recipient in to_list if recipient['email'] not in optouts]
+    to_list = [recipient for recipient in to_list if recipient['pk'] not in optouts]
     return to_list, num_optout
 
 
@@ -428,7 +440,8 @@ def _send_course_email(entry_id, email_id, to_list, global_email_context, subtas
     Inputs are:
       * `entry_id`: id of the InstructorTask object to which progress should be recorded.
       * `email_id`: id of the CourseEmail model that is to be emailed.
-      * `to_list`: list of recipients.  Each is represented as a dict with the following keys:
+      * `to_list`: list of recipients.  Each is represented as an (id, email, name) tuple, as queued
+        by perform_delegate_email_batches, or as a dict with the following keys:
         - 'profile__name': full name of User.
         - 'email': email address of User.
         - 'pk': primary key of User model.
@@ -438,7 +451,9 @@ def _send_course_email(entry_id, email_id, to_list, global_email_context, subtas
       * `subtask_status` : object of class SubtaskStatus representing current status.
 
     Sends to all addresses contained in to_list that are not also in the Optout table.
-    Emails are sent multi-part, in both plain text and html.
+    Emails are sent multi-part, in both plain text and html.  They are rendered in batches and
+    sent in parallel over settings.BULK_EMAIL_SEND_CONNECTIONS SMTP connections, and the send
+    rate and the errors of each connection are recorded in `subtask_status`.
 
     Returns a tuple of two values:
       * First value is a SubtaskStatus object which represents current progress at the end of this call.
@@ -475,12 +490,18 @@ def _send_course_email(entry_id, email_id, to_list, global_email_context, subtas
         )
         raise
 
+    to_list = [
+        recipient if isinstance(recipient, dict) else dict(zip(RECIPIENT_FIELDS, recipient))
+        for recipient in to_list
+    ]
+
     # Exclude optouts (if not a retry):
     # Note that we don't have to do the optout logic at all if this is a retry,
     # because we have presumably already performed the optout logic on the first
     # attempt.  Anyone on the to_list on a retry has already passed the filter
     # that existed at that time, and we don't need to keep checking for changes
-    # in the Optout list.
+    # in the Optout list.  The users who had opted out when the subtasks were
+    # queued are already excluded; this catches those who opted out since.
     if subtask_status.get_retry_count() == 0:
         to_list, num_optout = _filter_optouts_from_recipients(to_list, course_email.course_id)
         subtask_status.increment(skipped=num_optout)
@@ -494,50 +515,28 @@ def _send_course_email(entry_id, email_id, to_list, global_email_context, subtas
 
     # use the CourseEmailTemplate that was associated with the CourseEmail
     course_email_template = course_email.get_template()
+    connections = []
+    # Counters updated by the threads sending over each connection.
+    counters_lock = threading.Lock()
+    counters = Counter()
     try:
-        connection = get_connection()
-        connection.open()
+        for __ in xrange(max(1, settings.BULK_EMAIL_SEND_CONNECTIONS)):
+            connection = get_connection()
+            connection.open()
+            connections.append(connection)
 
-        # Define context values to use in all course emails:
-        email_context = {'name': '', 'email': ''}
-        email_context.update(global_email_context)
+        # Define context values to use in all course emails, and compile the templates with them:
+        email_context = dict(global_email_context, course_id=course_email.course_id)
+        renderer = course_email_template.get_renderer(email_context, ['name', 'email', 'user_id'])
 
-        while to_list:
-            # Update context with user-specific values from the user at the end of the list.
-            # At the end of processing this user, they will be popped off of the to_list.
-            # That way, the to_list will always contain the recipients remaining to be emailed.
-            # This is convenient for retries, which will need to send to those who haven't
-            # yet been emailed, but not send to those who have already been sent to.
-            recipient_num += 1
-            current_recipient = to_list[-1]
-            email = current_recipient['email']
-            email_context['email'] = email
-            email_context['name'] = current_recipient['profile__name']
-            email_context['user_id'] = current_recipient['pk']
-            email_context['course_id'] = course_email.course_id
-
-            # Construct message content using templates and context:
-            plaintext_msg = course_email_template.render_plaintext(course_email.text_message, email_context)
-            html_msg = course_email_template.render_htmltext(course_email.html_message, email_context)
-
-            # Create email:
-            email_msg = EmailMultiAlternatives(
-                course_email.subject,
-                plaintext_msg,
-                from_addr,
-                [email],
-                connection=connection
-            )
-            email_msg.attach_alternative(html_msg, 'text/html')
-
-            # Throttle if we have gotten the rate limiter.  This is not very high-tech,
-            # but if a task has been retried for rate-limiting reasons, then we sleep
-            # for a period of time between all emails within this task.  Choice of
-            # the value depends on the number of workers that might be sending email in
-            # parallel, and what the SES throttle rate is.
-            if subtask_status.retried_nomax > 0:
-                sleep(settings.BULK_EMAIL_RETRY_DELAY_BETWEEN_SENDS)
+        def send_message(connection_num, recipient_num, current_recipient, email_msg):
+            """
+            Sends `email_msg` to `current_recipient` over connection `connection_num`.
 
+            Errors of a single email are counted as failures, other errors are raised.
+            """
+            email = current_recipient['email']
+            email_msg.connection = connections[connection_num]
             try:
                 log.info(
                     "BulkEmail ==> Task: %s, SubTask: %s, EmailId: %s, Recipient num: %s/%s, \
@@ -551,11 +550,13 @@ def _send_course_email(entry_id, email_id, to_list, global_email_context, subtas
                     email
                 )
                 with dog_stats_api.timer('course_email.single_send.time.overall', tags=[_statsd_tag(course_title)]):
-                    connection.send_messages([email_msg])
+                    connections[connection_num].send_messages([email_msg])
 
             except SMTPDataError as exc:
                 # According to SMTP spec, we'll retry error codes in the 4xx range.  5xx range indicates hard failure.
-                total_recipients_failed += 1
+                with counters_lock:
+                    counters['failed'] += 1
+                    subtask_status.increment_connection_errors(connection_num)
                 log.error(
                     "BulkEmail ==> Status: Failed(SMTPDataError), Task: %s, SubTask: %s, EmailId: %s, \
                     Recipient num: %s/%s, Email address: %s",
@@ -583,11 +584,14 @@ def _send_course_email(entry_id, email_id, to_list, global_email_context, subtas
                         exc.smtp_error
                     )
                     dog_stats_api.increment('course_email.error', tags=[_statsd_tag(course_title)])
-                    subtask_status.increment(failed=1)
+                    with counters_lock:
+                        subtask_status.increment(failed=1)
 
             except SINGLE_EMAIL_FAILURE_ERRORS as exc:
                 # This will fall through and not retry the message.
-                total_recipients_failed += 1
+                with counters_lock:
+                    counters['failed'] += 1
+                    subtask_status.increment_connection_errors(connection_num)
                 log.error(
                     "BulkEmail ==> Status: Failed(SINGLE_EMAIL_FAILURE_ERRORS), Task: %s, SubTask: %s, \
                     EmailId: %s, Recipient num: %s/%s, Email address: %s, Exception: %s",
@@ -600,10 +604,17 @@ def _send_course_email(entry_id, email_id, to_list, global_email_context, subtas
                     exc
                 )
                 dog_stats_api.increment('course_email.error', tags=[_statsd_tag(course_title)])
-                subtask_status.increment(failed=1)
+                with counters_lock:
+                    subtask_status.increment(failed=1)
+
+            except Exception:  # pylint: disable=broad-except
+                with counters_lock:
+                    subtask_status.increment_connection_errors(connection_num)
+                raise
 
             else:
-                total_recipients_successful += 1
+                with counters_lock:
+                    counters['successful'] += 1
                 log.info(
                     "BulkEmail ==> Status: Success, Task: %s, SubTask: %s, EmailId: %s, \
                     Recipient num: %s/%s, Email address: %s,",
@@ -619,13 +630,111 @@ def _send_course_email(entry_id, email_id, to_list, global_email_context, subtas
                     log.info('Email with id %s sent to %s', email_id, email)
                 else:
                     log.debug('Email with id %s sent to %s', email_id, email)
-                subtask_status.increment(succeeded=1)
+                with counters_lock:
+                    subtask_status.increment(succeeded=1)
+
+        def send_messages(connection_num, messages, processed, stop, errors):
+            """
+            Sends `messages` over connection `connection_num`, recording the index in to_list
+            of each recipient that was processed, until `stop` is set by an error.
+            """
+            min_interval = None
+            if settings.BULK_EMAIL_MAX_SENDS_PER_SECOND_PER_CONNECTION:
+                min_interval = 1.0 / settings.BULK_EMAIL_MAX_SENDS_PER_SECOND_PER_CONNECTION
+            last_send = None
+            for index, recipient_num, current_recipient, email_msg in messages:
+                if stop.is_set():
+                    return
+
+                # Throttle if we have gotten the rate limiter.  This is not very high-tech,
+                # but if a task has been retried for rate-limiting reasons, then we sleep
+                # for a period of time between all emails within this task.  Choice of
+                # the value depends on the number of workers that might be sending email in
+                # parallel, and what the SES throttle rate is.
+                if subtask_status.retried_nomax > 0:
+                    sleep(settings.BULK_EMAIL_RETRY_DELAY_BETWEEN_SENDS)
+                if min_interval is not None and last_send is not None:
+                    sleep(max(0, last_send + min_interval - time()))
+                last_send = time()
+
+                try:
+                    send_message(connection_num, recipient_num, current_recipient, email_msg)
+                except Exception:  # pylint: disable=broad-except
+                    errors.append(sys.exc_info())
+                    stop.set()
+                    return
+                processed.append(index)
+
+        send_start = time()
+        while to_list:
+            # Render the messages of the recipients at the end of the list.  At the end of
+            # processing the batch, the recipients that were processed are removed from the to_list.
+            # That way, the to_list will always contain the recipients remaining to be emailed.
+            # This is convenient for retries, which will need to send to those who haven't
+            # yet been emailed, but not send to those who have already been sent to.
+            messages = []
+            for index in reversed(xrange(max(0, len(to_list) - SEND_BATCH_SIZE * len(connections)), len(to_list))):
+                recipient_num += 1
+                current_recipient = to_list[index]
+                recipient_context = {
+                    'email': current_recipient['email'],
+                    'name': current_recipient['profile__name'],
+                    'user_id': current_recipient['pk'],
+                }
+
+                # Construct message content using templates and context:
+                plaintext_msg = renderer.render_plaintext(course_email.text_message, recipient_context)
+                html_msg = renderer.render_htmltext(course_email.html_message, recipient_context)
+
+                # Create email:
+                email_msg = EmailMultiAlternatives(
+                    course_email.subject,
+                    plaintext_msg,
+                    from_addr,
+                    [current_recipient['email']],
+                )
+                email_msg.attach_alternative(html_msg, 'text/html')
+                messages.append((index, recipient_num, current_recipient, email_msg))
+
+            # Send the batch over the connections, round-robin.  Over a single connection,
+            # the messages are sent from this thread.
+            processed = []
+            stop = threading.Event()
+            errors = []
+            try:
+                if len(connections) == 1:
+                    send_messages(0, messages, processed, stop, errors)
+                else:
+                    threads = [
+                        threading.Thread(
+                            target=send_messages,
+                            args=(connection_num, messages[connection_num::len(connections)], processed, stop, errors),
+                            name='bulk-email-connection-{}'.format(connection_num),
+                        )
+                        for connection_num in xrange(len(connections))
+                    ]
+                    for thread in threads:
+                        thread.start()
+                    for thread in threads:
+                        thread.join()
+            finally:
+                # Remove the users that were emailed from the list only once they have
+                # been processed.  (That way, if there were a failure that
+                # needed to be retried, the user is still on the list.)
+                for index in sorted(processed, reverse=True):
+                    recipients_info[to_list[index]['email']] += 1
+                    del to_list[index]
+                elapsed = time() - send_start
+                if elapsed > 0:
+                    subtask_status.items_per_second = round(
+                        (counters['successful'] + counters['failed']) / elapsed, 2
+                    )
+
+            if errors:
+                six.reraise(*errors[0])
 
-            # Pop the user that was emailed off the end of the list only once they have
-            # successfully been processed.  (That way, if there were a failure that
-            # needed to be retried, the user is still on the list.)
-            recipients_info[email] += 1
-            to_list.pop()
+        total_recipients_successful = counters['successful']
+        total_recipients_failed = counters['failed']
 
         log.info(
             "BulkEmail ==> Task: %s, SubTask: %s, EmailId: %s, Total Successful Recipients: %s/%s, \
@@ -706,7 +815,8 @@ def _send_course_email(entry_id, email_id, to_list, global_email_context, subtas
         return subtask_status, None
     finally:
         # Clean up at the end.
-        connection.close()
+        for connection in connections:
+            connection.close()
 
 
 def _get_current_task():
@@ -223,6 +223,22 @@ class CourseEmailTemplateTest(TestCase):
         self.assertIn(context['course_title'], message)
         self.assertIn(context['name'], message)
 
+    def test_renderer(self):
+        # The compiled templates render the same messages as the template.
+        template = CourseEmailTemplate.get_template()
+        context = self._add_xss_fields(self._get_sample_html_context())
+        recipient_context = {key: context.pop(key) for key in ('name', 'email', 'user_id')}
+        renderer = template.get_renderer(context, recipient_context.keys())
+        message = "Dear %%USER_FULLNAME%%, thanks for enrolling in %%COURSE_DISPLAY_NAME%%."
+        self.assertEqual(
+            renderer.render_plaintext(message, recipient_context),
+            template.render_plaintext(message, dict(context, **recipient_context))
+        )
+        self.assertEqual(
+            renderer.render_htmltext(message, recipient_context),
+            template.render_htmltext(message, dict(context, **recipient_context))
+        )
+
 
 @attr(shard=1)
 class CourseAuthorizationTest(TestCase):
@@ -26,17 +26,19 @@ from boto.ses.exceptions import (
 from celery.states import FAILURE, SUCCESS  # pylint: disable=no-name-in-module, import-error
 from django.conf import settings
 from django.core.management import call_command
+from django.test.utils import override_settings
 from mock import Mock, patch
 from nose.plugins.attrib import attr
 from opaque_keys.edx.locator import CourseLocator
 
 from bulk_email.models import SEND_TO_LEARNERS, SEND_TO_MYSELF, SEND_TO_STAFF, CourseEmail, Optout
-from bulk_email.tasks import _get_course_email_context
+from bulk_email.tasks import _filter_optouts_from_recipients, _get_course_email_context
 from lms.djangoapps.instructor_task.models import InstructorTask
 from lms.djangoapps.instructor_task.subtasks import SubtaskStatus, update_subtask_status
 from lms.djangoapps.instructor_task.tasks import send_bulk_course_email
 from lms.djangoapps.instructor_task.tests.factories import InstructorTaskFactory
 from lms.djangoapps.instructor_task.tests.test_base import InstructorTaskCourseTestCase
+from terrain.stubs.smtp import StubSmtpService
 from xmodule.modulestore.tests.factories import CourseFactory
 
 
@@ -237,12 +239,52 @@ class TestBulkEmailInstructorTask(InstructorTaskCourseTestCase):
         expected_succeeds = num_emails - expected_skipped
         for index in range(0, num_emails, 4):
             Optout.objects.create(user=students[index], course_id=self.course.id)
-        # mark some students as opting out
+        # students who opted out are excluded when the subtasks are queued
         with patch('bulk_email.tasks.get_connection', autospec=True) as get_conn:
             get_conn.return_value.send_messages.side_effect = cycle([None])
-            self._test_run_with_task(
-                send_bulk_course_email, 'emailed', num_emails, expected_succeeds, skipped=expected_skipped
-            )
+            self._test_run_with_task(send_bulk_course_email, 'emailed', expected_succeeds, expected_succeeds)
+
+    def test_skipped_after_queueing(self):
+        # Select number of emails to fit into a single subtask.
+        num_emails = settings.BULK_EMAIL_EMAILS_PER_TASK
+        # We also send email to the instructor:
+        students = self._create_students(num_emails - 1)
+
+        def opt_out_and_filter(to_list, course_id):
+            """Have a student opt out once the subtasks are queued."""
+            Optout.objects.create(user=students[0], course_id=course_id)
+            return _filter_optouts_from_recipients(to_list, course_id)
+
+        with patch('bulk_email.tasks.get_connection', autospec=True) as get_conn:
+            get_conn.return_value.send_messages.side_effect = cycle([None])
+            with patch('bulk_email.tasks._filter_optouts_from_recipients', side_effect=opt_out_and_filter):
+                self._test_run_with_task(
+                    send_bulk_course_email, 'emailed', num_emails, num_emails - 1, skipped=1
+                )
+
+    def test_connection_pool(self):
+        # Select number of emails to fit into a single subtask.
+        num_emails = settings.BULK_EMAIL_EMAILS_PER_TASK
+        # We also send email to the instructor:
+        students = self._create_students(num_emails - 1)
+        server = StubSmtpService()
+        self.addCleanup(server.shutdown)
+        # have the stub SMTP server refuse one of the recipients:
+        server.config['rejected_addresses'] = [students[0].email]
+        with override_settings(
+            EMAIL_BACKEND='django.core.mail.backends.smtp.EmailBackend',
+            EMAIL_HOST='127.0.0.1',
+            EMAIL_PORT=server.port,
+            BULK_EMAIL_SEND_CONNECTIONS=3,
+        ):
+            entry = self._test_run_with_task(send_bulk_course_email, 'emailed', num_emails, num_emails - 1, failed=1)
+
+        self.assertEquals(server.connection_count, 3)
+        self.assertEquals(len(server.messages), num_emails - 1)
+        self.assertNotIn(students[0].email, [message['rcpttos'][0] for message in server.messages])
+        subtask_status = json.loads(entry.subtasks)['status'].values()[0]
+        self.assertGreater(subtask_status['items_per_second'], 0)
+        self.assertEquals(sum(subtask_status['connection_errors'].values()), 1)
 
     def _test_email_address_failures(self, exception):
         """Test that celery handles bad address errors by failing and not retrying."""
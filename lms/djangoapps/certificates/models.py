@@ -61,6 +61,7 @@ from django.utils.translation import ugettext_lazy as _
 from django_extensions.db.fields import CreationDateTimeField
 from model_utils import Choices
 from model_utils.models import TimeStampedModel
+from request_cache import get_cache
 
 from badges.events.course_complete import course_badge_check
 from badges.events.course_meta import completion_check, course_group_check
@@ -259,6 +260,27 @@ class GeneratedCertificate(models.Model):
 
         return None
 
+    CACHE_NAMESPACE = u"certificates.models.GeneratedCertificate"
+
+    @classmethod
+    def prefetch_for_student(cls, student, course_ids):
+        """
+        Prefetches the certificates of the student for the given courses
+        with a single query, for later retrieval by
+        certificate_status_for_student for the rest of the request.
+        """
+        certificates = {
+            certificate.course_id: certificate
+            for certificate in cls.objects.filter(user=student, course_id__in=course_ids)
+        }
+        cache = get_cache(cls.CACHE_NAMESPACE)
+        for course_id in course_ids:
+            cache[cls._cache_key(student.id, course_id)] = certificates.get(course_id)
+
+    @classmethod
+    def _cache_key(cls, user_id, course_id):
+        return u"{}.{}".format(user_id, course_id)
+
     @classmethod
     def course_ids_with_certs_for_user(cls, user):
         """
@@ -491,11 +513,29 @@ def handle_course_cert_awarded(sender, user, course_key, **kwargs):  # pylint: d
         fulfill_course_milestone(course_key, user)
 
 
+@receiver(models.signals.post_save, sender=GeneratedCertificate)
+@receiver(models.signals.post_delete, sender=GeneratedCertificate)
+def invalidate_prefetched_certificate(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """
+    Remove a saved or deleted certificate from the certificates prefetched for the request.
+    """
+    get_cache(GeneratedCertificate.CACHE_NAMESPACE).pop(
+        GeneratedCertificate._cache_key(instance.user_id, instance.course_id), None  # pylint: disable=protected-access
+    )
+
+
 def certificate_status_for_student(student, course_id):
     """
     This returns a dictionary with a key for status, and other information.
     See certificate_status for more information.
+
+    The certificates prefetched by GeneratedCertificate.prefetch_for_student are used when available.
     """
+    prefetched_certificates = get_cache(GeneratedCertificate.CACHE_NAMESPACE)
+    cache_key = GeneratedCertificate._cache_key(student.id, course_id)  # pylint: disable=protected-access
+    if cache_key in prefetched_certificates:
+        return certificate_status(prefetched_certificates[cache_key])
+
     try:
         generated_certificate = GeneratedCertificate.objects.get(user=student, course_id=course_id)
     except GeneratedCertificate.DoesNotExist:
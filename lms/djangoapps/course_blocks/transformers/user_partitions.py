@@ -5,7 +5,7 @@ from openedx.core.djangoapps.content.block_structure.transformer import (
     BlockStructureTransformer,
     FilteringTransformerMixin
 )
-from xmodule.partitions.partitions_service import get_all_partitions_for_course
+from xmodule.partitions.partitions_service import get_all_partitions_for_course, get_groups_for_users
 
 from .split_test import SplitTestTransformer
 from .utils import get_field_on_block
@@ -252,13 +252,8 @@ def _get_user_partition_groups(course_key, user_partitions, user):
             in a group for a particular partition, then that partition's
             ID will not be in the dict.
     """
-    partition_groups = {}
-    for partition in user_partitions:
-        group = partition.scheme.get_group_for_user(
-            course_key,
-            user,
-            partition,
-        )
-        if group is not None:
-            partition_groups[partition.id] = group
-    return partition_groups
+    return {
+        partition_id: groups_by_user[user.id]
+        for partition_id, groups_by_user in get_groups_for_users(course_key, user_partitions, [user]).iteritems()
+        if user.id in groups_by_user
+    }
@@ -11,19 +11,22 @@ Note: The access control logic in this file does NOT check for enrollment in
   It is a wrapper around has_access that additionally checks for enrollment.
 """
 import logging
-from datetime import datetime
+from datetime import datetime, timedelta
 
 import pytz
 from ccx_keys.locator import CCXLocator
 from django.conf import settings
 from django.contrib.auth.models import AnonymousUser
 from django.utils.timezone import UTC
+from lazy import lazy
 from opaque_keys.edx.keys import CourseKey, UsageKey
 from xblock.core import XBlock
 
+import request_cache
 from courseware.access_response import (
     MilestoneAccessError,
     MobileAvailabilityError,
+    StartDateError,
     VisibilityError,
 )
 from courseware.access_utils import (
@@ -66,6 +69,8 @@ from xmodule.x_module import XModule
 
 log = logging.getLogger(__name__)
 
+CCX_COACH_REQUEST_CACHE = 'courseware.access.has_ccx_coach_role'
+
 
 def has_ccx_coach_role(user, course_key):
     """
@@ -83,13 +88,16 @@ def has_ccx_coach_role(user, course_key):
         role = CourseCcxCoachRole(course_key)
 
         if role.has_user(user):
-            list_ccx = CustomCourseForEdX.objects.filter(
-                course_id=course_key.to_course_locator(),
-                coach=user
-            )
-            if list_ccx.exists():
-                coach_ccx = list_ccx[0]
-                return str(coach_ccx.id) == ccx_id
+            # The user's coached ccx is looked up once per request.
+            cache = request_cache.get_cache(CCX_COACH_REQUEST_CACHE) if request_cache.get_request() else {}
+            cache_key = (user.id, unicode(course_key))
+            if cache_key not in cache:
+                list_ccx = CustomCourseForEdX.objects.filter(
+                    course_id=course_key.to_course_locator(),
+                    coach=user
+                )
+                cache[cache_key] = list_ccx.exists() and str(list_ccx[0].id) == ccx_id
+            return cache[cache_key]
     else:
         raise CCXLocatorValidationException("Invalid CCX key. To verify that "
                                             "user is a coach on CCX, you must provide key to CCX")
@@ -168,6 +176,174 @@ def has_access(user, action, obj, course_key=None):
                     .format(type(obj)))
 
 
+def has_access_many(user, action, blocks, course_key):
+    """
+    Check whether a user has the access to do action on each of blocks, the
+    descriptors or modules of the course with course_key.
+
+    Returns the same AccessResponse objects as calling has_access on each block,
+    in the order of blocks. The facts about the user that don't depend on the
+    block (roles, masquerade, partition groups, milestones, beta testing) are
+    only looked up once per request.
+
+    Valid actions: 'load', 'staff' and 'instructor'.
+    """
+    if not user:
+        user = AnonymousUser()
+
+    facts = _CourseAccessFacts.get(user, course_key)
+    results = []
+    for block in blocks:
+        if isinstance(block, XModule):
+            block = block.descriptor
+        if isinstance(block, (CourseDescriptor, ErrorDescriptor)) or not isinstance(block, XBlock):
+            # These have their own policies, see has_access.
+            results.append(has_access(user, action, block, course_key))
+        else:
+            results.append(facts.has_access_descriptor(action, block))
+    return results
+
+
+class _CourseAccessFacts(object):
+    """
+    The facts about a user that _has_access_descriptor looks up for every
+    descriptor of a course, looked up once.
+    """
+    REQUEST_CACHE_NAME = 'courseware.access.course_access_facts'
+
+    def __init__(self, user, course_key):
+        self.user = user
+        self.course_key = course_key
+        self._user_groups = {}
+
+    @classmethod
+    def get(cls, user, course_key):
+        """
+        Returns the facts about user in the course, cached for the current request.
+        """
+        if request_cache.get_request() is None:
+            return cls(user, course_key)
+        cache = request_cache.get_cache(cls.REQUEST_CACHE_NAME)
+        key = (user.id, unicode(course_key))
+        if key not in cache:
+            cache[key] = cls(user, course_key)
+        return cache[key]
+
+    @lazy
+    def denied_by_preview_mode(self):
+        """
+        Whether the course is in preview mode and the user may not preview it.
+        """
+        return in_preview_mode() and not has_staff_access_to_preview_mode(self.user, self.course_key)
+
+    @lazy
+    def staff_access(self):
+        """
+        Whether the user has staff access to the course.
+        """
+        return _has_access_to_course(self.user, 'staff', self.course_key)
+
+    @lazy
+    def instructor_access(self):
+        """
+        Whether the user has instructor access to the course.
+        """
+        return _has_access_to_course(self.user, 'instructor', self.course_key)
+
+    @lazy
+    def bypasses_group_access(self):
+        """
+        Whether the user's role gives them access to all groups.
+        """
+        return get_user_role(self.user, self.course_key) in ['staff', 'instructor']
+
+    @lazy
+    def content_ids_with_milestones(self):
+        """
+        The ids of the course content that the user has milestones to complete before accessing.
+        """
+        return milestones_helpers.get_course_content_ids_with_milestones(self.course_key, 'requires', self.user.id)
+
+    @lazy
+    def start_dates_disabled(self):
+        """
+        Whether start dates are ignored for the user, see check_start_date.
+        """
+        return (
+            (settings.FEATURES['DISABLE_START_DATES'] and not is_masquerading_as_student(self.user, self.course_key))
+            or in_preview_mode()
+        )
+
+    @lazy
+    def is_beta_tester(self):
+        """
+        Whether the user is a beta tester of the course.
+        """
+        return CourseBetaTesterRole(self.course_key).has_user(self.user)
+
+    def get_user_group(self, partition):
+        """
+        Returns the user's group in partition.
+        """
+        if partition.id not in self._user_groups:
+            self._user_groups[partition.id] = partition.scheme.get_group_for_user(
+                self.course_key, self.user, partition
+            )
+        return self._user_groups[partition.id]
+
+    def has_access_descriptor(self, action, descriptor):
+        """
+        Same as has_access(user, action, descriptor, course_key), for a descriptor
+        handled by _has_access_descriptor.
+        """
+        if self.denied_by_preview_mode:
+            return ACCESS_DENIED
+        if action == 'staff':
+            return self.staff_access
+        if action == 'instructor':
+            return self.instructor_access
+        if action != 'load':
+            raise ValueError(u"Unknown action for object type '{0}': '{1}'".format(type(descriptor), action))
+
+        if not (self.bypasses_group_access or _check_group_access(descriptor, self.course_key, self.get_user_group)):
+            return ACCESS_DENIED
+
+        if self.staff_access:
+            return ACCESS_GRANTED
+
+        return (
+            _visible_to_nonstaff_users(descriptor) and
+            self.check_milestones(descriptor) and
+            (
+                _has_detached_class_tag(descriptor) or
+                self.check_start_date(descriptor)
+            )
+        )
+
+    def check_milestones(self, descriptor):
+        """
+        Same as _can_access_descriptor_with_milestones.
+        """
+        if unicode(descriptor.location) in self.content_ids_with_milestones:
+            debug("Deny: user has not completed all milestones for content")
+            return ACCESS_DENIED
+        return ACCESS_GRANTED
+
+    def check_start_date(self, descriptor):
+        """
+        Same as check_start_date, for the start date of descriptor.
+        """
+        start = descriptor.start
+        if self.start_dates_disabled or start is None:
+            return ACCESS_GRANTED
+
+        if descriptor.days_early_for_beta is not None and self.is_beta_tester:
+            start = start - timedelta(descriptor.days_early_for_beta)
+        if datetime.now(UTC()) > start:
+            return ACCESS_GRANTED
+        return StartDateError(descriptor.start)
+
+
 def has_staff_access_to_preview_mode(user, course_key):
     """
     Checks if given user can access course in preview mode.
@@ -401,6 +577,18 @@ def _has_group_access(descriptor, user, course_key):
     if get_user_role(user, course_key) in ['staff', 'instructor']:
         return ACCESS_GRANTED
 
+    return _check_group_access(
+        descriptor,
+        course_key,
+        lambda partition: partition.scheme.get_group_for_user(course_key, user, partition),
+    )
+
+
+def _check_group_access(descriptor, course_key, get_user_group):
+    """
+    Returns whether the groups that `get_user_group` returns for each
+    user partition, satisfy the group access of `descriptor`.
+    """
     # use merged_group_access which takes group access on the block's
     # parents / ancestors into account
     merged_access = descriptor.merged_group_access
@@ -448,11 +636,7 @@ def _has_group_access(descriptor, user, course_key):
     # look up the user's group for each partition
     user_groups = {}
     for partition, groups in partition_groups:
-        user_groups[partition.id] = partition.scheme.get_group_for_user(
-            course_key,
-            user,
-            partition,
-        )
+        user_groups[partition.id] = get_user_group(partition)
 
     # finally: check that the user has a satisfactory group assignment
     # for each partition.
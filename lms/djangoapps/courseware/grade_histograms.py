@@ -0,0 +1,65 @@
+"""
+Cached grade histograms for the staff debug view of problems.
+
+Computing a histogram aggregates over every StudentModule of the problem, so the
+staff view only ever reads a cached histogram.  Missing histograms are computed
+in the background, and scores changing refresh them at most once per
+GRADE_HISTOGRAM_REFRESH_DELAY.
+"""
+from django.core.cache import cache
+from django.dispatch import receiver
+from opaque_keys.edx.keys import UsageKey
+
+from lms.djangoapps.grades.signals.signals import PROBLEM_WEIGHTED_SCORE_CHANGED
+from openedx.core.lib import xblock_utils
+
+# Bump this when the format of cached histograms changes.
+GRADE_HISTOGRAM_CACHE_VERSION = 1
+GRADE_HISTOGRAM_CACHE_TIMEOUT = 60 * 60
+GRADE_HISTOGRAM_REFRESH_DELAY = 60
+
+
+def _cache_key(usage_key):
+    """
+    Returns the cache key of the histogram of `usage_key`.
+    """
+    return u'courseware.grade_histogram.{}.{}'.format(GRADE_HISTOGRAM_CACHE_VERSION, usage_key)
+
+
+def get_cached_grade_histogram(usage_key):
+    """
+    Returns the cached grade histogram of the problem `usage_key`, as
+    `xblock_utils.grade_histogram` would, or None if it is being computed.
+    """
+    histogram = cache.get(_cache_key(usage_key))
+    if histogram is None:
+        schedule_grade_histogram_refresh(usage_key, countdown=0)
+    return histogram
+
+
+def update_cached_grade_histogram(usage_key):
+    """
+    Computes the grade histogram of the problem `usage_key` and caches it.
+    """
+    histogram = xblock_utils.grade_histogram(usage_key)
+    cache.set(_cache_key(usage_key), histogram, GRADE_HISTOGRAM_CACHE_TIMEOUT)
+    return histogram
+
+
+def schedule_grade_histogram_refresh(usage_key, countdown=GRADE_HISTOGRAM_REFRESH_DELAY):
+    """
+    Schedules the histogram of `usage_key` to be recomputed, unless that is already scheduled.
+    """
+    if cache.add(_cache_key(usage_key) + u'.scheduled', True, max(countdown, GRADE_HISTOGRAM_REFRESH_DELAY)):
+        from courseware.tasks import compute_grade_histogram
+        compute_grade_histogram.apply_async((unicode(usage_key),), countdown=countdown)
+
+
+@receiver(PROBLEM_WEIGHTED_SCORE_CHANGED)
+def refresh_grade_histogram(sender, usage_id, **kwargs):  # pylint: disable=unused-argument
+    """
+    Refreshes a problem's cached histogram, if there is one, once its scores have changed.
+    """
+    usage_key = UsageKey.from_string(usage_id)
+    if cache.get(_cache_key(usage_key)) is not None:
+        schedule_grade_histogram_refresh(usage_key)
@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+import openedx.core.djangoapps.xmodule_django.models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('courseware', '0003_auto_20170825_0935'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProblemAnswersRefresh',
+            fields=[
+                ('id', models.AutoField(verbose_name='ID', serialize=False, auto_created=True, primary_key=True)),
+                ('module_state_key', openedx.core.djangoapps.xmodule_django.models.LocationKeyField(unique=True, max_length=255)),
+                ('version', models.CharField(max_length=255)),
+                ('refreshed_at', models.DateTimeField(null=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='StudentModuleAnswer',
+            fields=[
+                ('id', models.AutoField(verbose_name='ID', serialize=False, auto_created=True, primary_key=True)),
+                ('module_state_key', openedx.core.djangoapps.xmodule_django.models.LocationKeyField(max_length=255, db_index=True)),
+                ('answer_id', models.CharField(max_length=255)),
+                ('answer', models.TextField()),
+                ('student_module', models.ForeignKey(to='courseware.StudentModule')),
+            ],
+        ),
+    ]
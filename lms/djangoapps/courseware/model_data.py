@@ -37,6 +37,7 @@ from xblock.fields import Scope, UserScope
 from xblock.runtime import KeyValueStore
 
 from courseware.user_state_client import DjangoXBlockUserStateClient
+from openedx.core.djangoapps import monitoring_utils
 from xmodule.modulestore.django import modulestore
 
 from .models import StudentModule, XModuleStudentInfoField, XModuleStudentPrefsField, XModuleUserStateSummaryField
@@ -682,7 +683,7 @@ class FieldDataCache(object):
     A cache of django model objects needed to supply the data
     for a module and its descendants
     """
-    def __init__(self, descriptors, course_id, user, asides=None, read_only=False):
+    def __init__(self, descriptors, course_id, user, asides=None, read_only=False, lazy=False):
         """
         Find any courseware.models objects that are needed by any descriptor
         in descriptors. Attempts to minimize the number of queries to the database.
@@ -695,6 +696,8 @@ class FieldDataCache(object):
         user: The user for which to cache data
         asides: The list of aside types to load, or None to prefetch no asides.
         read_only: We should not perform writes (they become a no-op).
+        lazy: Load the data of a descriptor that wasn't added to the cache, and of its
+            descendants, when a module is bound to it (see `add_descriptor_on_demand`).
         """
         if asides is None:
             self.asides = []
@@ -705,6 +708,8 @@ class FieldDataCache(object):
         self.course_id = course_id
         self.user = user
         self.read_only = read_only
+        self.lazy = lazy
+        self._cached_locations = set()
 
         self.cache = {
             Scope.user_state: UserStateCache(
@@ -728,7 +733,9 @@ class FieldDataCache(object):
         """
         Add all `descriptors` to this FieldDataCache.
         """
+        self._cached_locations.update(desc.location for desc in descriptors)
         if self.user.is_authenticated():
+            rows_before = len(self)
             self.scorable_locations.update(desc.location for desc in descriptors if desc.has_score)
             for scope, fields in self._fields_to_cache(descriptors).items():
                 if scope not in self.cache:
@@ -736,6 +743,21 @@ class FieldDataCache(object):
 
                 self.cache[scope].cache_fields(fields, descriptors, self.asides)
 
+            monitoring_utils.accumulate('field_data_cache.blocks_requested', len(descriptors))
+            monitoring_utils.accumulate('field_data_cache.rows_loaded', len(self) - rows_before)
+
+    def add_descriptor_on_demand(self, descriptor):
+        """
+        If this FieldDataCache is lazy and `descriptor` wasn't added to it yet,
+        add `descriptor` and all of its descendants.
+
+        This lets a page prefetch only the blocks that it is sure to render,
+        and load the data of the others (e.g. the active unit of a sequence)
+        with one query per scope when they are first bound.
+        """
+        if self.lazy and descriptor.location not in self._cached_locations:
+            self.add_descriptor_descendents(descriptor)
+
     def add_descriptor_descendents(self, descriptor, depth=None, descriptor_filter=lambda descriptor: True):
         """
         Add all descendants of `descriptor` to this FieldDataCache.
@@ -779,7 +801,7 @@ class FieldDataCache(object):
     @classmethod
     def cache_for_descriptor_descendents(cls, course_id, user, descriptor, depth=None,
                                          descriptor_filter=lambda descriptor: True,
-                                         asides=None, read_only=False):
+                                         asides=None, read_only=False, lazy=False):
         """
         course_id: the course in the context of which we want StudentModules.
         user: the django user for whom to load modules.
@@ -788,8 +810,9 @@ class FieldDataCache(object):
             the supplied descriptor. If depth is None, load all descendant StudentModules
         descriptor_filter is a function that accepts a descriptor and return whether the field data
             should be cached
+        lazy: whether descriptors that aren't cached should be added when they are bound
         """
-        cache = FieldDataCache([], course_id, user, asides=asides, read_only=read_only)
+        cache = FieldDataCache([], course_id, user, asides=asides, read_only=read_only, lazy=lazy)
         cache.add_descriptor_descendents(descriptor, depth, descriptor_filter)
         return cache
 
@@ -237,6 +237,37 @@ class StudentModuleHistory(BaseStudentModuleHistory):
         post_save.connect(save_history, sender=StudentModule)
 
 
+class StudentModuleAnswer(models.Model):
+    """
+    An answer found in the state of a learner's StudentModule for a problem.
+
+    These are kept by instructor_analytics.basic.problem_answer_distribution, so that
+    the answer distribution of a problem is counted in the database, and refreshed from
+    the StudentModules modified since it was last computed rather than from every
+    learner's state.
+    """
+    class Meta(object):
+        app_label = "courseware"
+
+    student_module = models.ForeignKey(StudentModule, db_index=True)
+    module_state_key = LocationKeyField(max_length=255, db_index=True)
+    answer_id = models.CharField(max_length=255)
+    answer = models.TextField()
+
+
+class ProblemAnswersRefresh(models.Model):
+    """
+    The version of a problem, and the time up to which its StudentModuleAnswers
+    reflect the state of its StudentModules.
+    """
+    class Meta(object):
+        app_label = "courseware"
+
+    module_state_key = LocationKeyField(max_length=255, unique=True)
+    version = models.CharField(max_length=255)
+    refreshed_at = models.DateTimeField(null=True)
+
+
 class XBlockFieldBase(models.Model):
     """
     Base class for all XBlock field storage.
@@ -5,7 +5,7 @@ Module rendering
 import hashlib
 import json
 import logging
-from collections import OrderedDict
+from collections import OrderedDict, namedtuple
 from functools import partial
 
 from django.conf import settings
@@ -30,6 +30,7 @@ import static_replace
 from capa.xqueue_interface import XQueueInterface
 from courseware.access import get_user_role, has_access
 from courseware.entrance_exams import user_can_skip_entrance_exam, user_has_passed_entrance_exam
+from courseware.grade_histograms import get_cached_grade_histogram
 from courseware.masquerade import (
     MasqueradingKeyValueStore,
     filter_displayed_blocks,
@@ -54,9 +55,7 @@ from openedx.core.lib.url_utils import quote_slashes, unquote_slashes
 from openedx.core.lib.xblock_utils import request_token as xblock_request_token
 from openedx.core.lib.xblock_utils import (
     add_staff_markup,
-    replace_course_urls,
-    replace_jump_to_id_urls,
-    replace_static_urls,
+    replace_urls,
     wrap_xblock
 )
 from student.models import anonymous_id_for_user, user_by_anonymous_id
@@ -67,6 +66,7 @@ from util.json_request import JsonResponse
 from util.model_utils import slugify
 from util.sandboxing import can_execute_unsafe_code, get_python_lib_zip
 from xblock_django.user_service import DjangoXBlockUserService
+from xmodule.block_metadata_utils import display_name_with_default_escaped, url_name_for_block
 from xmodule.contentstore.django import contentstore
 from xmodule.error_module import ErrorDescriptor, NonStaffErrorDescriptor
 from xmodule.exceptions import NotFoundError, ProcessingError
@@ -114,7 +114,37 @@ def make_track_function(request):
     return function
 
 
-def toc_for_course(user, request, course, active_chapter, active_section, field_data_cache):
+class _TocBlock(namedtuple('_TocBlock', ['location', 'display_name', 'hide_from_toc', 'format', 'due', 'graded'])):
+    """
+    The fields of a chapter or section that toc_for_course reads, taken from a block structure.
+    """
+    @property
+    def url_name(self):
+        return url_name_for_block(self)
+
+    @property
+    def display_name_with_default_escaped(self):
+        return display_name_with_default_escaped(self)
+
+
+def _toc_blocks(block_structure, parent_key):
+    """
+    Returns the children of `parent_key` in `block_structure` as `_TocBlock`s.
+    """
+    return [
+        _TocBlock(
+            location=block_key,
+            display_name=block_structure.get_xblock_field(block_key, 'display_name'),
+            hide_from_toc=block_structure.get_xblock_field(block_key, 'hide_from_toc', False),
+            format=block_structure.get_xblock_field(block_key, 'format'),
+            due=block_structure.get_xblock_field(block_key, 'due'),
+            graded=block_structure.get_xblock_field(block_key, 'graded', False),
+        )
+        for block_key in block_structure.get_children(parent_key)
+    ]
+
+
+def toc_for_course(user, request, course, active_chapter, active_section, field_data_cache, block_structure=None):
     '''
     Create a table of contents from the module store
 
@@ -143,17 +173,27 @@ def toc_for_course(user, request, course, active_chapter, active_section, field_
     None if this is not the case.
 
     field_data_cache must include data from the course module and 2 levels of its descendants
+
+    If block_structure, the user's course blocks, is given, the chapters and
+    sections are read from it instead of being bound to the user; this doesn't
+    include per-user field overrides or timed exam information.
     '''
 
     with modulestore().bulk_operations(course.id):
-        course_module = get_module_for_descriptor(
-            user, request, course, field_data_cache, course.id, course=course
-        )
-        if course_module is None:
-            return None, None, None
+        if block_structure is not None:
+            chapters = _toc_blocks(block_structure, course.location)
+            get_sections = lambda chapter: _toc_blocks(block_structure, chapter.location)
+        else:
+            course_module = get_module_for_descriptor(
+                user, request, course, field_data_cache, course.id, course=course
+            )
+            if course_module is None:
+                return None, None, None
+
+            chapters = course_module.get_display_items()
+            get_sections = lambda chapter: chapter.get_display_items()
 
         toc_chapters = list()
-        chapters = course_module.get_display_items()
 
         # Check for content which needs to be completed
         # before the rest of the content is made available
@@ -180,7 +220,7 @@ def toc_for_course(user, request, course, active_chapter, active_section, field_
                 continue
 
             sections = list()
-            for section in chapter.get_display_items():
+            for section in get_sections(chapter):
                 # skip the section if it is hidden from the user
                 if section.hide_from_toc:
                     continue
@@ -380,7 +420,8 @@ def get_module_for_descriptor(user, request, descriptor, field_data_cache, cours
         user_location=user_location,
         request_token=xblock_request_token(request),
         disable_staff_debug_info=disable_staff_debug_info,
-        course=course
+        course=course,
+        field_data_cache=field_data_cache,
     )
 
 
@@ -389,7 +430,7 @@ def get_module_system_for_user(user, student_data,  # TODO  # pylint: disable=to
                                descriptor, course_id, track_function, xqueue_callback_url_prefix,
                                request_token, position=None, wrap_xmodule_display=True, grade_bucket_type=None,
                                static_asset_path='', user_location=None, disable_staff_debug_info=False,
-                               course=None):
+                               course=None, field_data_cache=None):
     """
     Helper function that returns a module system and student_data bound to a user and a descriptor.
 
@@ -405,6 +446,8 @@ def get_module_system_for_user(user, student_data,  # TODO  # pylint: disable=to
     Arguments:
         see arguments for get_module()
         request_token (str): A token unique to the request use by xblock initialization
+        field_data_cache (FieldDataCache): The cache behind student_data, if children should be added to it
+            on demand when they are bound
 
     Returns:
         (LmsModuleSystem, KvsFieldData):  (module system, student_data) bound to, primarily, the user and descriptor
@@ -458,7 +501,8 @@ def get_module_system_for_user(user, student_data,  # TODO  # pylint: disable=to
             static_asset_path=static_asset_path,
             user_location=user_location,
             request_token=request_token,
-            course=course
+            course=course,
+            field_data_cache=field_data_cache,
         )
 
     def publish(block, event_type, event):
@@ -570,27 +614,20 @@ def get_module_system_for_user(user, student_data,  # TODO  # pylint: disable=to
     # prefix is going to have to be specific to the module, not the directory
     # that the xml was loaded from
 
-    # Rewrite urls beginning in /static to point to course-specific content
-    block_wrappers.append(partial(
-        replace_static_urls,
-        getattr(descriptor, 'data_dir', None),
-        course_id=course_id,
-        static_asset_path=static_asset_path or descriptor.static_asset_path
-    ))
-
-    # Allow URLs of the form '/course/' refer to the root of multicourse directory
-    #   hierarchy of this course
-    block_wrappers.append(partial(replace_course_urls, course_id))
-
-    # this will rewrite intra-courseware links (/jump_to_id/<id>). This format
-    # is an improvement over the /course/... format for studio authored courses,
-    # because it is agnostic to course-hierarchy.
+    # Rewrite urls beginning in /static to point to course-specific content,
+    # allow URLs of the form '/course/' to refer to the root of multicourse
+    # directory hierarchy of this course, and rewrite intra-courseware links
+    # (/jump_to_id/<id>). The jump_to_id format is an improvement over the
+    # /course/... format for studio authored courses, because it is agnostic
+    # to course-hierarchy.
     # NOTE: module_id is empty string here. The 'module_id' will get assigned in the replacement
     # function, we just need to specify something to get the reverse() to work.
     block_wrappers.append(partial(
-        replace_jump_to_id_urls,
+        replace_urls,
         course_id,
         reverse('jump_to_id', kwargs={'course_id': course_id.to_deprecated_string(), 'module_id': ''}),
+        getattr(descriptor, 'data_dir', None),
+        static_asset_path=static_asset_path or descriptor.static_asset_path
     ))
 
     if settings.FEATURES.get('DISPLAY_DEBUG_INFO_TO_STAFF'):
@@ -610,7 +647,10 @@ def get_module_system_for_user(user, student_data,  # TODO  # pylint: disable=to
             staff_access = has_access(user, 'staff', descriptor, course_id)
             instructor_access = bool(has_access(user, 'instructor', descriptor, course_id))
         if staff_access:
-            block_wrappers.append(partial(add_staff_markup, user, instructor_access, disable_staff_debug_info))
+            block_wrappers.append(partial(
+                add_staff_markup, user, instructor_access, disable_staff_debug_info,
+                get_histogram=get_cached_grade_histogram
+            ))
 
     # These modules store data using the anonymous_student_id as a key.
     # To prevent loss of data, we will continue to provide old modules with
@@ -717,7 +757,7 @@ def get_module_for_descriptor_internal(user, descriptor, student_data, course_id
                                        track_function, xqueue_callback_url_prefix, request_token,
                                        position=None, wrap_xmodule_display=True, grade_bucket_type=None,
                                        static_asset_path='', user_location=None, disable_staff_debug_info=False,
-                                       course=None):
+                                       course=None, field_data_cache=None):
     """
     Actually implement get_module, without requiring a request.
 
@@ -725,7 +765,11 @@ def get_module_for_descriptor_internal(user, descriptor, student_data, course_id
 
     Arguments:
         request_token (str): A unique token for this request, used to isolate xblock rendering
+        field_data_cache (FieldDataCache): The cache behind student_data, which lazy caches
+            load the descriptor's data from
     """
+    if field_data_cache is not None:
+        field_data_cache.add_descriptor_on_demand(descriptor)
 
     (system, student_data) = get_module_system_for_user(
         user=user,
@@ -741,7 +785,8 @@ def get_module_for_descriptor_internal(user, descriptor, student_data, course_id
         user_location=user_location,
         request_token=request_token,
         disable_staff_debug_info=disable_staff_debug_info,
-        course=course
+        course=course,
+        field_data_cache=field_data_cache,
     )
 
     descriptor.bind_for_student(
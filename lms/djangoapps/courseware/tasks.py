@@ -0,0 +1,17 @@
+"""
+Asynchronous tasks for the courseware app.
+"""
+from celery import task
+from django.conf import settings
+from opaque_keys.edx.keys import UsageKey
+
+from courseware import grade_histograms
+
+
+@task(routing_key=settings.RECALCULATE_GRADES_ROUTING_KEY)
+def compute_grade_histogram(usage_key):
+    """
+    Computes the staff grade histogram of the problem `usage_key` (a string)
+    and caches it for the staff debug view.
+    """
+    grade_histograms.update_cached_grade_histogram(UsageKey.from_string(usage_key))
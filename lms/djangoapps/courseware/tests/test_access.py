@@ -31,6 +31,7 @@ from courseware.tests.helpers import LoginEnrollmentTestCase, masquerade_as_grou
 from lms.djangoapps.ccx.models import CustomCourseForEdX
 from openedx.core.djangoapps.content.course_overviews.models import CourseOverview
 from openedx.core.djangoapps.waffle_utils.testutils import WAFFLE_TABLES
+from request_cache.middleware import RequestCache
 from student.models import CourseEnrollment
 from student.roles import CourseCcxCoachRole, CourseStaffRole
 from student.tests.factories import (
@@ -672,6 +673,50 @@ class AccessTestCase(LoginEnrollmentTestCase, ModuleStoreTestCase, MilestonesTes
         self.assertEqual(response.status_code, 200)
 
 
+@attr(shard=1)
+@ddt.ddt
+class HasAccessManyTestCase(ModuleStoreTestCase):
+    """
+    Tests that has_access_many returns the same responses as has_access.
+    """
+    def setUp(self):
+        super(HasAccessManyTestCase, self).setUp()
+        yesterday = datetime.datetime.now(pytz.utc) - datetime.timedelta(days=1)
+        tomorrow = datetime.datetime.now(pytz.utc) + datetime.timedelta(days=1)
+        self.course = CourseFactory.create(org='edX', course='many', run='test_run')
+        chapter = ItemFactory.create(parent=self.course, category='chapter', start=yesterday)
+        self.blocks = [
+            chapter,
+            ItemFactory.create(parent=chapter, category='sequential', start=tomorrow),
+            ItemFactory.create(parent=chapter, category='sequential', start=tomorrow, days_early_for_beta=2),
+            ItemFactory.create(parent=chapter, category='sequential', visible_to_staff_only=True),
+        ]
+        self.users = {
+            'anonymous': AnonymousUserFactory(),
+            'student': UserFactory(),
+            'beta': BetaTesterFactory(course_key=self.course.id),
+            'staff': StaffFactory(course_key=self.course.id),
+            'instructor': InstructorFactory(course_key=self.course.id),
+        }
+
+    @ddt.data(*itertools.product(['anonymous', 'student', 'beta', 'staff', 'instructor'], ['load', 'staff']))
+    @ddt.unpack
+    @patch.dict('django.conf.settings.FEATURES', {'DISABLE_START_DATES': False})
+    def test_has_access_many(self, user_name, action):
+        user = self.users[user_name]
+        self.assertEqual(
+            [bool(response) for response in access.has_access_many(user, action, self.blocks, self.course.id)],
+            [bool(access.has_access(user, action, block, self.course.id)) for block in self.blocks],
+        )
+
+    @patch('request_cache.get_request', Mock(return_value=RequestFactory().get('/')))
+    def test_facts_cached_per_request(self):
+        RequestCache.clear_request_cache()
+        access.has_access_many(self.users['student'], 'load', self.blocks, self.course.id)
+        with self.assertNumQueries(0):
+            access.has_access_many(self.users['student'], 'load', self.blocks, self.course.id)
+
+
 @attr(shard=1)
 class UserRoleTestCase(TestCase):
     """
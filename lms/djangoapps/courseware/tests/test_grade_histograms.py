@@ -0,0 +1,65 @@
+"""
+Tests for the cached staff grade histograms.
+"""
+from django.core.cache import cache
+from opaque_keys.edx.locator import BlockUsageLocator, CourseLocator
+
+from courseware import grade_histograms
+from courseware.tests.factories import StudentModuleFactory
+from lms.djangoapps.grades.signals.signals import PROBLEM_WEIGHTED_SCORE_CHANGED
+from openedx.core.djangolib.testing.utils import CacheIsolationTestCase
+from student.tests.factories import UserFactory
+
+
+class GradeHistogramTest(CacheIsolationTestCase):
+    """
+    Tests for get_cached_grade_histogram and its refreshing.
+    """
+    ENABLED_CACHES = ['default']
+
+    def setUp(self):
+        super(GradeHistogramTest, self).setUp()
+        self.course_key = CourseLocator('edX', 'histograms', 'run')
+        self.usage_key = BlockUsageLocator(self.course_key, 'problem', 'problem')
+        self.add_score(1)
+
+    def add_score(self, grade):
+        """
+        Adds a learner's `grade` for the problem.
+        """
+        StudentModuleFactory.create(
+            course_id=self.course_key,
+            module_state_key=self.usage_key,
+            student=UserFactory(),
+            grade=grade,
+            max_grade=1,
+        )
+
+    def send_score_changed(self):
+        """
+        Sends the signal of a score of the problem changing.
+        """
+        PROBLEM_WEIGHTED_SCORE_CHANGED.send(
+            sender=None, user_id=1, course_id=unicode(self.course_key), usage_id=unicode(self.usage_key)
+        )
+
+    def test_computed_in_background(self):
+        # Nothing is cached yet, so the (eager) task computes the histogram.
+        self.assertIsNone(grade_histograms.get_cached_grade_histogram(self.usage_key))
+        self.assertEqual(grade_histograms.get_cached_grade_histogram(self.usage_key), [(1, 1)])
+
+    def test_refreshed_on_score_change(self):
+        grade_histograms.update_cached_grade_histogram(self.usage_key)
+        self.add_score(0)
+
+        self.send_score_changed()
+        self.assertEqual(grade_histograms.get_cached_grade_histogram(self.usage_key), [(0, 1), (1, 1)])
+
+        # Further refreshes wait until the scheduled one has run.
+        self.add_score(0)
+        self.send_score_changed()
+        self.assertEqual(grade_histograms.get_cached_grade_histogram(self.usage_key), [(0, 1), (1, 1)])
+
+    def test_not_refreshed_if_not_cached(self):
+        self.send_score_changed()
+        self.assertIsNone(cache.get(grade_histograms._cache_key(self.usage_key)))  # pylint: disable=protected-access
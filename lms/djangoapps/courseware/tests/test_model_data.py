@@ -291,6 +291,42 @@ class TestMissingStudentModule(TestCase):
             self.assertFalse(self.kvs.has(user_state_key('a_field')))
 
 
+class TestLazyFieldDataCache(TestCase):
+    """
+    Tests of adding descriptors to a lazy FieldDataCache when they are bound.
+    """
+    # Tell Django to clean out all databases, not just default
+    multi_db = True
+
+    def setUp(self):
+        super(TestLazyFieldDataCache, self).setUp()
+        student_module = StudentModuleFactory(state=json.dumps({'a_field': 'a_value'}))
+        self.user = student_module.student
+        self.descriptor = mock_descriptor([mock_field(Scope.user_state, 'a_field')])
+        self.descriptor.location = location('usage_id')
+        self.descriptor.get_children.return_value = []
+        self.descriptor.get_required_module_descriptors.return_value = []
+
+    def test_add_descriptor_on_demand(self):
+        field_data_cache = FieldDataCache([], course_id, self.user, lazy=True)
+        kvs = DjangoKeyValueStore(field_data_cache)
+        key = partial(DjangoKeyValueStore.Key, Scope.user_state, self.user.id, location('usage_id'))
+        self.assertFalse(kvs.has(key('a_field')))
+
+        field_data_cache.add_descriptor_on_demand(self.descriptor)
+        self.assertEquals('a_value', kvs.get(key('a_field')))
+
+        # The descriptor was added, it isn't loaded again
+        with self.assertNumQueries(0):
+            field_data_cache.add_descriptor_on_demand(self.descriptor)
+
+    def test_not_lazy(self):
+        field_data_cache = FieldDataCache([], course_id, self.user)
+        with self.assertNumQueries(0):
+            field_data_cache.add_descriptor_on_demand(self.descriptor)
+        self.assertEquals(0, len(field_data_cache))
+
+
 @attr(shard=1)
 class StorageTestBase(object):
     """
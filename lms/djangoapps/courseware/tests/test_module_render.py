@@ -42,6 +42,7 @@ from courseware.module_render import get_module_for_descriptor, hash_resource
 from courseware.tests.factories import GlobalStaffFactory, StudentModuleFactory, UserFactory
 from courseware.tests.test_submitting_problems import TestSubmittingProblems
 from courseware.tests.tests import LoginEnrollmentTestCase
+from lms.djangoapps.course_blocks.api import get_course_blocks
 from lms.djangoapps.lms_xblock.field_data import LmsFieldData
 from openedx.core.djangoapps.credit.api import set_credit_requirement_status, set_credit_requirements
 from openedx.core.djangoapps.credit.models import CreditCourse
@@ -703,6 +704,21 @@ class TestTOC(ModuleStoreTestCase):
             self.assertEquals(actual['previous_of_active_section']['url_name'], 'Toy_Videos')
             self.assertEquals(actual['next_of_active_section']['url_name'], 'video_123456789012')
 
+    @ddt.data((ModuleStoreEnum.Type.mongo, 3, 0), (ModuleStoreEnum.Type.split, 6, 0))
+    @ddt.unpack
+    def test_toc_from_course_blocks(self, default_ms, setup_finds, setup_sends):
+        with self.store.default_store(default_ms):
+            self.setup_request_and_course(setup_finds, setup_sends)
+            block_structure = get_course_blocks(self.request.user, self.toy_course.location)
+            expected = render.toc_for_course(
+                self.request.user, self.request, self.toy_course, self.chapter, 'Welcome', self.field_data_cache
+            )
+            actual = render.toc_for_course(
+                self.request.user, self.request, self.toy_course, self.chapter, 'Welcome', self.field_data_cache,
+                block_structure=block_structure,
+            )
+        self.assertEqual(actual, expected)
+
 
 @attr(shard=1)
 @ddt.ddt
@@ -1268,6 +1284,87 @@ class TestHtmlModifiers(ModuleStoreTestCase):
         )
 
 
+@attr(shard=1)
+class TestRenderCache(ModuleStoreTestCase):
+    """
+    Tests that the student view of blocks supporting the render cache is only rendered once.
+    """
+    def setUp(self):
+        super(TestRenderCache, self).setUp()
+        self.course = CourseFactory.create()
+        self.request = RequestFactory().get('/')
+        self.request.user = self.user
+        self.request.session = {}
+        self.descriptor = ItemFactory.create(
+            category='html',
+            parent_location=self.course.location,
+            data='<a href="/static/foo/content">Test rewrite</a>',
+        )
+
+    def render_student_view(self, static_asset_path=''):
+        """
+        Render the student view of the html block.
+        """
+        field_data_cache = FieldDataCache.cache_for_descriptor_descendents(
+            self.course.id, self.user, self.descriptor
+        )
+        module = render.get_module(
+            self.user, self.request, self.descriptor.location, field_data_cache, static_asset_path=static_asset_path
+        )
+        return module.render(STUDENT_VIEW)
+
+    def test_cached_fragment(self):
+        fragment = self.render_student_view()
+        with patch('xmodule.html_module.HtmlModule.get_html') as mock_get_html:
+            cached_fragment = self.render_student_view()
+
+        self.assertFalse(mock_get_html.called)
+        self.assertEqual(fragment.content, cached_fragment.content)
+        self.assertIn('/c4x/{org}/{course}/asset/foo_content'.format(
+            org=self.course.location.org,
+            course=self.course.location.course,
+        ), cached_fragment.content)
+
+    def test_urls_rewritten_on_cache_hit(self):
+        self.render_student_view()
+        with patch('courseware.module_render.replace_urls') as mock_replace_urls:
+            mock_replace_urls.side_effect = lambda *args, **kwargs: Fragment('<a href="/rewritten"></a>')
+            content = self.render_student_view().content
+
+        # The rewritten asset urls change with the assets, so they aren't cached.
+        self.assertIn('/rewritten', content)
+
+    def test_static_asset_path_not_shared(self):
+        self.render_student_view()
+        self.assertIn('href="/static/toy_course_dir', self.render_student_view("toy_course_dir").content)
+
+    def test_display_wrapper_urls_rewritten(self):
+        self.descriptor.data = '<p>%%USER_ID%%</p>'
+        self.descriptor = self.store.update_item(self.descriptor, self.user.id)
+        with patch('courseware.module_render.wrap_xblock') as mock_wrap_xblock:
+            mock_wrap_xblock.side_effect = lambda *args, **kwargs: Fragment('<a href="/static/foo/content"></a>')
+            content = self.render_student_view().content
+
+        # Urls are rewritten after the display wrapper.
+        self.assertNotIn('/static/foo/content', content)
+
+    def test_edit_invalidates_cache(self):
+        self.render_student_view()
+        self.descriptor.data = '<p>Edited</p>'
+        self.descriptor = self.store.update_item(self.descriptor, self.user.id)
+
+        self.assertIn('<p>Edited</p>', self.render_student_view().content)
+
+    def test_user_specific_content_not_cached(self):
+        self.descriptor.data = '<p>%%USER_ID%%</p>'
+        self.descriptor = self.store.update_item(self.descriptor, self.user.id)
+        self.render_student_view()
+        with patch('xmodule.html_module.HtmlModule.get_html', return_value='') as mock_get_html:
+            self.render_student_view()
+
+        self.assertTrue(mock_get_html.called)
+
+
 class XBlockWithJsonInitData(XBlock):
     """
     Pure XBlock to use in tests, with JSON init data.
@@ -344,6 +344,7 @@ class TestTranscriptDownloadDispatch(TestVideo):
         self.assertEqual(response.body, 'Subs!')
         self.assertEqual(response.headers['Content-Type'], 'application/x-subrip; charset=utf-8')
         self.assertEqual(response.headers['Content-Language'], 'en')
+        self.assertEqual(response.headers['Cache-Control'], 'private, max-age=300')
 
     @patch('xmodule.video_module.VideoModule.get_transcript', return_value=('Subs!', 'txt', 'text/plain; charset=utf-8'))
     def test_download_txt_exist(self, __):
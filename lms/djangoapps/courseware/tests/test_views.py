@@ -27,6 +27,7 @@ from courseware.tests.factories import GlobalStaffFactory, StudentModuleFactory
 from courseware.testutils import RenderXBlockTestMixin
 from courseware.url_helpers import get_redirect_url
 from courseware.user_state_client import DjangoXBlockUserStateClient
+from courseware.views.index import SEQUENCE_NAVIGATION_FLAG
 from django.conf import settings
 from django.contrib.auth.models import AnonymousUser
 from django.core.urlresolvers import reverse
@@ -2297,6 +2298,41 @@ class TestIndexView(ModuleStoreTestCase):
         )
         self.assertIn("Activate Block ID: test_block_id", response.content)
 
+    @override_waffle_flag(SEQUENCE_NAVIGATION_FLAG, active=True)
+    def test_sequence_navigation(self):
+        user = UserFactory()
+
+        course = CourseFactory.create()
+        with self.store.bulk_operations(course.id):
+            chapter = ItemFactory.create(parent=course, category='chapter')
+            section = ItemFactory.create(parent=chapter, category='sequential', display_name="Sequence")
+            verticals = [
+                ItemFactory.create(parent=section, category='vertical', display_name="Vertical {}".format(index))
+                for index in range(3)
+            ]
+            ItemFactory.create(parent=verticals[0], category='html', data="<p>First unit content</p>")
+            ItemFactory.create(parent=verticals[1], category='problem')
+            ItemFactory.create(parent=verticals[2], category='html', data="<p>Last unit content</p>")
+
+        CourseEnrollmentFactory(user=user, course_id=course.id)
+
+        self.assertTrue(self.client.login(username=user.username, password='test'))
+        response = self.client.get(
+            reverse(
+                'courseware_position',
+                args=[unicode(course.id), chapter.url_name, section.url_name, 3],
+            )
+        )
+        self.assertIn("Last unit content", response.content)
+        self.assertNotIn("First unit content", response.content)
+        self.assertIn("seq_problem", response.content)
+        for position in (1, 2):
+            unit_url = reverse(
+                'courseware_position',
+                args=[unicode(course.id), chapter.url_name, section.url_name, position],
+            )
+            self.assertIn(unit_url, response.content)
+
 
 @ddt.ddt
 class TestIndexViewWithVerticalPositions(ModuleStoreTestCase):
@@ -21,15 +21,17 @@ from opaque_keys.edx.keys import CourseKey
 from web_fragments.fragment import Fragment
 
 from edxmako.shortcuts import render_to_response, render_to_string
+from lms.djangoapps.course_blocks.api import get_course_blocks
 from lms.djangoapps.courseware.exceptions import CourseAccessRedirect
 from lms.djangoapps.experiments.utils import get_experiment_user_metadata_context
 from lms.djangoapps.gating.api import get_entrance_exam_score_ratio, get_entrance_exam_usage_key
 from lms.djangoapps.grades.new.course_grade_factory import CourseGradeFactory
+from openedx.core.djangoapps.bookmarks.services import BookmarksService
 from openedx.core.djangoapps.crawlers.models import CrawlersConfig
 from openedx.core.djangoapps.lang_pref import LANGUAGE_KEY
 from openedx.core.djangoapps.monitoring_utils import set_custom_metrics_for_course_key
 from openedx.core.djangoapps.user_api.preferences.api import get_user_preference
-from openedx.core.djangoapps.waffle_utils import WaffleSwitchNamespace
+from openedx.core.djangoapps.waffle_utils import CourseWaffleFlag, WaffleFlagNamespace, WaffleSwitchNamespace
 from openedx.features.course_experience import COURSE_OUTLINE_PAGE_FLAG, default_course_url_name
 from openedx.features.course_experience.views.course_sock import CourseSockFragmentView
 from openedx.features.enterprise_support.api import data_sharing_consent_required
@@ -38,6 +40,7 @@ from student.views import is_course_blocked
 from student.models import CourseEnrollment
 from util.views import ensure_valid_course_key
 from xmodule.modulestore.django import modulestore
+from xmodule.vertical_block import CLASS_PRIORITY
 from xmodule.x_module import STUDENT_VIEW
 
 from ..access import has_access
@@ -61,6 +64,15 @@ log = logging.getLogger("edx.courseware.views.index")
 TEMPLATE_IMPORTS = {'urllib': urllib}
 CONTENT_DEPTH = 2
 
+# Namespace for courseware waffle flags.
+WAFFLE_FLAG_NAMESPACE = WaffleFlagNamespace(name='courseware')
+
+# Waffle flag to build the sequence's unit tabs from the course blocks and render only the active unit.
+SEQUENCE_NAVIGATION_FLAG = CourseWaffleFlag(WAFFLE_FLAG_NAMESPACE, 'precomputed_sequence_navigation')
+
+# Waffle flag to build the table of contents from the course blocks instead of binding every chapter and section.
+COURSE_BLOCKS_TOC_FLAG = CourseWaffleFlag(WAFFLE_FLAG_NAMESPACE, 'course_blocks_toc')
+
 
 class CoursewareIndex(View):
     """
@@ -99,6 +111,7 @@ class CoursewareIndex(View):
         self.position = position
         self.chapter, self.section = None, None
         self.course = None
+        self._course_blocks = None
         self.url = request.path
 
         try:
@@ -235,6 +248,37 @@ class CoursewareIndex(View):
         """
         return self._is_masquerading_as_student() and self.masquerade.user_name
 
+    def _renders_active_unit_only(self):
+        """
+        Returns whether the section is rendered with its precomputed navigation,
+        instantiating only its active unit.
+        """
+        return SEQUENCE_NAVIGATION_FLAG.is_enabled(self.course_key) and not self.masquerade
+
+    def _uses_course_blocks_toc(self):
+        """
+        Returns whether the table of contents can be built from the course blocks:
+        they don't include per-user field overrides, timed exam information, or
+        the view of a masqueraded role.
+        """
+        return (
+            COURSE_BLOCKS_TOC_FLAG.is_enabled(self.course_key) and
+            not self.masquerade and
+            not settings.FIELD_OVERRIDE_PROVIDERS and
+            not (
+                settings.FEATURES.get('ENABLE_SPECIAL_EXAMS', False) and
+                (self.course.enable_proctored_exams or self.course.enable_timed_exams)
+            )
+        )
+
+    def _get_course_blocks(self):
+        """
+        Returns the effective user's course blocks, transformed once per request.
+        """
+        if self._course_blocks is None:
+            self._course_blocks = get_course_blocks(self.effective_user, self.course.location)
+        return self._course_blocks
+
     def _find_block(self, parent, url_name, block_type, min_depth=None):
         """
         Finds the block in the parent with the specified url_name.
@@ -280,6 +324,7 @@ class CoursewareIndex(View):
             self.course,
             depth=CONTENT_DEPTH,
             read_only=CrawlersConfig.is_crawler(request),
+            lazy=self._renders_active_unit_only(),
         )
 
         self.course = get_module_for_descriptor(
@@ -298,7 +343,10 @@ class CoursewareIndex(View):
         """
         # Pre-fetch all descendant data
         self.section = modulestore().get_item(self.section.location, depth=None, lazy=False)
-        self.field_data_cache.add_descriptor_descendents(self.section, depth=None)
+        if not self._renders_active_unit_only():
+            # Otherwise the lazy field data cache already has the section's data, and
+            # loads the data of the active unit when the section binds it.
+            self.field_data_cache.add_descriptor_descendents(self.section, depth=None)
 
         # Bind section to user
         self.section = get_module_for_descriptor(
@@ -359,6 +407,7 @@ class CoursewareIndex(View):
             self.chapter_url_name,
             self.section_url_name,
             self.field_data_cache,
+            block_structure=self._get_course_blocks() if self._uses_course_blocks_toc() else None,
         )
         courseware_context['accordion'] = render_accordion(
             self.request,
@@ -399,7 +448,10 @@ class CoursewareIndex(View):
                 table_of_contents['next_of_active_section'],
             )
             courseware_context['fragment'] = self.section.render(STUDENT_VIEW, section_context)
-            if self.section.position and self.section.has_children:
+            navigation = section_context.get('sequence_navigation')
+            if navigation and self.section.position and self.section.position <= len(navigation):
+                courseware_context['sequence_title'] = navigation[self.section.position - 1]['display_name']
+            elif self.section.position and self.section.has_children:
                 display_items = self.section.get_display_items()
                 if display_items:
                     try:
@@ -456,8 +508,45 @@ class CoursewareIndex(View):
             section_context['next_url'] = _compute_section_url(next_of_active_section, 'first')
         # sections can hide data that masquerading staff should see when debugging issues with specific students
         section_context['specific_masquerade'] = self._is_masquerading_as_specific_student()
+        if self._renders_active_unit_only():
+            section_context['sequence_navigation'] = self._create_sequence_navigation()
         return section_context
 
+    def _create_sequence_navigation(self):
+        """
+        Returns the tabs of the section's units, built from the user's
+        course blocks instead of instantiating every unit, for the section to
+        render only its active unit.
+        """
+        block_structure = self._get_course_blocks()
+        bookmarked = set(
+            bookmark['usage_id'] for bookmark in BookmarksService(self.effective_user).bookmarks(self.course_key)
+        )
+        navigation = []
+        for position, unit_key in enumerate(block_structure.get_children(self.section.location), start=1):
+            display_name = block_structure.get_xblock_field(unit_key, 'display_name')
+            if display_name is None:
+                display_name = unit_key.block_id.replace('_', ' ')
+            # Approximates VerticalBlock.get_icon_class with the block types of the unit's children.
+            block_types = set([unit_key.block_type])
+            block_types.update(child_key.block_type for child_key in block_structure.get_children(unit_key))
+            icon_class = 'other'
+            for higher_class in CLASS_PRIORITY:
+                if higher_class in block_types:
+                    icon_class = higher_class
+            navigation.append({
+                'id': unit_key.to_deprecated_string(),
+                'display_name': display_name,
+                'page_title': display_name,
+                'type': icon_class,
+                'bookmarked': unicode(unit_key) in bookmarked,
+                'url': reverse(
+                    'courseware_position',
+                    args=[unicode(self.course_key), self.chapter.url_name, self.section.url_name, position],
+                ),
+            })
+        return navigation
+
 
 def render_accordion(request, course, table_of_contents):
     """
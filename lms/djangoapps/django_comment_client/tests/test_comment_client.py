@@ -0,0 +1,77 @@
+"""
+Tests for the identity map of the comment client, against the stub comments service.
+"""
+import requests
+from django.test import RequestFactory, TestCase
+from mock import Mock, patch
+
+from django_comment_common.models import ForumsConfig
+from lms.lib.comment_client import Thread
+from lms.lib.comment_client.utils import perform_request
+from request_cache.middleware import RequestCache
+from terrain.stubs.comments import StubCommentsService
+
+
+@patch('request_cache.get_request', Mock(return_value=RequestFactory().get('/')))
+class CommentClientIdentityMapTestCase(TestCase):
+    """
+    Tests for the identity map and Thread.remember.
+    """
+
+    def setUp(self):
+        super(CommentClientIdentityMapTestCase, self).setUp()
+        ForumsConfig.objects.create(enabled=True)
+        RequestCache.clear_request_cache()
+
+        self.server = StubCommentsService()
+        self.addCleanup(self.server.shutdown)
+        self.server.config['threads'] = {
+            'thread1': {'id': 'thread1', 'title': 'One', 'type': 'thread', 'children': [{'id': 'comment1'}]},
+            'thread2': {'id': 'thread2', 'title': 'Two', 'type': 'thread'},
+        }
+
+        prefix = 'http://127.0.0.1:{}/api/v1'.format(self.server.port)
+        for patcher in (
+                patch('lms.lib.comment_client.settings.PREFIX', prefix),
+                patch.object(Thread, 'base_url', prefix + '/threads'),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        request_patcher = patch('requests.request', wraps=requests.request)
+        self.mock_request = request_patcher.start()
+        self.addCleanup(request_patcher.stop)
+
+    def test_remember(self):
+        thread = Thread.remember(self.server.config['threads']['thread1'])
+        self.assertEqual(thread['title'], 'One')
+        self.assertNotIn('children', thread.attributes)
+
+        # The thread is in the identity map, without its responses.
+        retrieved = Thread(id='thread1').retrieve()
+        self.assertEqual(retrieved['title'], 'One')
+        self.assertNotIn('children', retrieved.attributes)
+        self.assertEqual(self.mock_request.call_count, 0)
+
+    def test_identity_map(self):
+        thread = Thread(id='thread2').retrieve()
+        thread['title'] = 'Changed'
+        self.assertEqual(Thread(id='thread2').retrieve()['title'], 'Two')
+        self.assertEqual(self.mock_request.call_count, 1)
+
+        # Retrieving with other arguments isn't deduplicated.
+        Thread(id='thread2').retrieve(with_responses=True)
+        self.assertEqual(self.mock_request.call_count, 2)
+
+    def test_identity_map_cleared_by_update(self):
+        Thread(id='thread2').retrieve()
+        with patch('requests.request', return_value=Mock(status_code=200, json=lambda: {})):
+            perform_request('post', 'http://127.0.0.1:{}/api/v1/users/1/read'.format(self.server.port))
+        Thread(id='thread2').retrieve()
+        self.assertEqual(self.mock_request.call_count, 2)
+
+    @patch('request_cache.get_request', Mock(return_value=None))
+    def test_identity_map_outside_request(self):
+        Thread(id='thread2').retrieve()
+        Thread(id='thread2').retrieve()
+        self.assertEqual(self.mock_request.call_count, 2)
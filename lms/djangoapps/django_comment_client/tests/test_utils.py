@@ -7,6 +7,7 @@ import mock
 from django.core.management import call_command
 from django.core.urlresolvers import reverse
 from django.test import RequestFactory, TestCase
+from django.test.utils import override_settings
 from django.utils.timezone import UTC as django_utc
 from mock import Mock, patch
 from nose.plugins.attrib import attr
@@ -35,7 +36,8 @@ from django_comment_common.utils import (
 )
 from edxmako import add_lookup
 from lms.djangoapps.teams.tests.factories import CourseTeamFactory, CourseTeamMembershipFactory
-from lms.lib.comment_client.utils import CommentClientMaintenanceError, perform_request
+from lms.lib.comment_client import utils as comment_client_utils
+from lms.lib.comment_client.utils import CommentClientMaintenanceError, get_session, perform_request
 from openedx.core.djangoapps.content.course_structures.models import CourseStructure
 from openedx.core.djangoapps.course_groups import cohorts
 from openedx.core.djangoapps.course_groups.cohorts import set_course_cohorted
@@ -1227,6 +1229,49 @@ class ContentGroupCategoryMapTestCase(CategoryMapTestMixin, ContentGroupTestCase
         )
 
 
+class DiscussionIndexTestMixin(object):
+    """
+    Runs the tests of a `get_discussion_category_map` testcase with the
+    discussion index of the course blocks.
+    """
+    ENABLED_SIGNALS = ['course_published']
+
+    def setUp(self):
+        super(DiscussionIndexTestMixin, self).setUp()
+        patcher = patch.object(utils.DISCUSSION_INDEX_FLAG, 'is_enabled', return_value=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_does_not_load_discussion_xblocks(self):
+        with patch.object(type(modulestore()), 'get_items') as mock_get_items:
+            utils.get_discussion_category_map(self.course, self.user)
+        self.assertFalse(mock_get_items.called)
+
+
+@attr(shard=1)
+class DiscussionIndexCategoryMapTestCase(DiscussionIndexTestMixin, CategoryMapTestCase):
+    """
+    Tests `get_discussion_category_map` with the discussion index.
+    """
+    def test_discussion_id_map(self):
+        discussion = self.create_discussion("Chapter", "Discussion")
+        self.assertEqual(
+            utils.get_cached_discussion_id_map(self.course, [discussion.discussion_id, 'missing'], self.instructor),
+            {discussion.discussion_id: {'location': discussion.location, 'title': 'Chapter / Discussion'}}
+        )
+        self.assertTrue(utils.discussion_category_id_access(self.course, self.instructor, discussion.discussion_id))
+        self.assertFalse(utils.discussion_category_id_access(self.course, self.instructor, 'missing'))
+
+
+@attr(shard=1)
+class DiscussionIndexContentGroupCategoryMapTestCase(DiscussionIndexTestMixin, ContentGroupCategoryMapTestCase):
+    """
+    Tests `get_discussion_category_map` with the discussion index, on
+    discussion xblocks which are only visible to some content groups.
+    """
+    pass
+
+
 class JsonResponseTestCase(TestCase, UnicodeTestMixin):
     def _test_unicode_data(self, text):
         response = utils.JsonResponse(text)
@@ -1850,6 +1895,53 @@ class ClientConfigurationTestCase(TestCase):
         result = perform_request('GET', 'http://www.google.com')
         self.assertEqual(result, {})
 
+    @patch('request_cache.get_request', Mock(return_value=RequestFactory().get('/')))
+    def test_config_memoized(self):
+        """Ensures that the ForumsConfig is memoized for the request, until it changes."""
+        ForumsConfig.objects.create(enabled=True)
+        with patch.object(ForumsConfig, 'current', wraps=ForumsConfig.current) as mock_current:
+            self.assertTrue(comment_client_utils.get_forums_config().enabled)
+            self.assertTrue(comment_client_utils.get_forums_config().enabled)
+            self.assertEqual(mock_current.call_count, 1)
+
+            ForumsConfig.objects.create(enabled=False)
+            self.assertFalse(comment_client_utils.get_forums_config().enabled)
+            self.assertEqual(mock_current.call_count, 2)
+
+
+@override_settings(COMMENTS_SERVICE_CONNECTION_POOL={'ENABLED': True, 'POOL_MAXSIZE': 4, 'MAX_RETRIES': 2})
+@patch.dict(comment_client_utils._SESSIONS, clear=True)  # pylint: disable=protected-access
+class PooledSessionTestCase(TestCase):
+    """Tests for the pooled sessions used to connect to the comments service."""
+
+    def setUp(self):
+        super(PooledSessionTestCase, self).setUp()
+        ForumsConfig.objects.create(enabled=True)
+
+    @patch('requests.Session.request')
+    @patch('requests.request')
+    def test_uses_pooled_session(self, mock_request, mock_session_request):
+        response = Mock(status_code=200, json=lambda: {})
+        mock_session_request.return_value = response
+
+        self.assertEqual(perform_request('GET', 'http://localhost:4567/api/v1/threads'), {})
+        self.assertEqual(perform_request('GET', 'http://localhost:4567/api/v1/threads'), {})
+        self.assertEqual(mock_session_request.call_count, 2)
+        self.assertFalse(mock_request.called)
+
+    def test_session_reused(self):
+        self.assertIs(get_session(True), get_session(True))
+        self.assertIsNot(get_session(True), get_session(False))
+
+    def test_retries(self):
+        get_adapter = get_session(True).get_adapter('http://localhost:4567/')
+        self.assertEqual(get_adapter._pool_maxsize, 4)  # pylint: disable=protected-access
+        self.assertEqual(get_adapter.max_retries.read, 2)
+
+        post_adapter = get_session(False).get_adapter('http://localhost:4567/')
+        self.assertEqual(post_adapter.max_retries.connect, 2)
+        self.assertFalse(post_adapter.max_retries.read)
+
 
 def set_discussion_division_settings(
         course_key, enable_cohorts=False, always_divide_inline_discussions=False,
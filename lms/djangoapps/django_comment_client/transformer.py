@@ -0,0 +1,73 @@
+"""
+Discussion Index Transformer
+"""
+from collections import namedtuple
+
+from openedx.core.djangoapps.content.block_structure.transformer import BlockStructureTransformer
+
+# The fields of a discussion xblock that are used to list the course's
+# discussion topics, see django_comment_client.utils.get_discussion_index.
+DiscussionIndexEntry = namedtuple(
+    'DiscussionIndexEntry',
+    ['location', 'discussion_id', 'discussion_category', 'discussion_target', 'sort_key', 'start'],
+)
+
+
+class DiscussionIndexTransformer(BlockStructureTransformer):
+    """
+    The DiscussionIndexTransformer collects the fields of the discussion
+    xblocks that are needed to list the course's discussion topics, so
+    that they can be listed without loading the xblocks.
+
+    No runtime transformations are performed: the blocks that a user can't
+    access are removed by the course block access transformers.
+
+    The following value is stored as a transformer_block_field on each
+    discussion block:
+
+        discussion: (dict) the fields of DiscussionIndexEntry, but location.
+    """
+    WRITE_VERSION = 1
+    READ_VERSION = 1
+    DISCUSSION = 'discussion'
+
+    @classmethod
+    def name(cls):
+        """
+        Unique identifier for the transformer's class;
+        same identifier used in setup.py.
+        """
+        return u'discussion_index'
+
+    @classmethod
+    def collect(cls, block_structure):
+        """
+        Collects the fields of the discussion xblocks.
+        """
+        for block_key in block_structure.topological_traversal():
+            if block_key.block_type != 'discussion':
+                continue
+            xblock = block_structure.get_xblock(block_key)
+            block_structure.set_transformer_block_field(block_key, cls, cls.DISCUSSION, {
+                field: getattr(xblock, field, None)
+                for field in DiscussionIndexEntry._fields if field != 'location'
+            })
+
+    def transform(self, usage_info, block_structure):
+        """
+        Perform no transformations.
+        """
+        pass
+
+    @classmethod
+    def get_entries(cls, block_structure):
+        """
+        Returns the DiscussionIndexEntry of each discussion block in
+        block_structure.
+        """
+        entries = []
+        for block_key in block_structure.topological_traversal():
+            discussion = block_structure.get_transformer_block_field(block_key, cls, cls.DISCUSSION)
+            if discussion is not None:
+                entries.append(DiscussionIndexEntry(location=block_key, **discussion))
+        return entries
@@ -15,24 +15,39 @@ from opaque_keys.edx.locations import i4xEncoder
 
 import pystache_custom as pystache
 from courseware import courses
-from courseware.access import has_access
+from courseware.access import has_access, has_access_many
 from django_comment_client.constants import TYPE_ENTRY, TYPE_SUBCATEGORY
 from django_comment_client.permissions import check_permissions_by_view, get_team, has_permission
 from django_comment_client.settings import MAX_COMMENT_DEPTH
 from django_comment_common.models import FORUM_ROLE_STUDENT, CourseDiscussionSettings, Role
 from django_comment_common.utils import get_course_discussion_settings
 from edxmako import lookup_template
+from lms.djangoapps.course_blocks.api import COURSE_BLOCK_ACCESS_TRANSFORMERS, get_course_blocks
+from lms.djangoapps.django_comment_client.transformer import DiscussionIndexTransformer
+from lms.lib.comment_client import Thread
+from openedx.core.djangoapps.content.block_structure.transformers import BlockStructureTransformers
 from openedx.core.djangoapps.content.course_structures.models import CourseStructure
-from openedx.core.djangoapps.course_groups.cohorts import get_cohort_id, get_cohort_names, is_course_cohorted
+from openedx.core.djangoapps.course_groups.cohorts import (
+    get_cohort_id,
+    get_cohort_names,
+    get_cohorts_for_users,
+    is_course_cohorted
+)
+from openedx.core.djangoapps.waffle_utils import CourseWaffleFlag, WaffleFlagNamespace
 from request_cache.middleware import request_cached
 from student.models import get_user_by_username_or_email
 from student.roles import GlobalStaff
 from xmodule.modulestore.django import modulestore
 from xmodule.partitions.partitions import ENROLLMENT_TRACK_PARTITION_ID
-from xmodule.partitions.partitions_service import PartitionService
+from xmodule.partitions.partitions_service import PartitionService, get_groups_for_users
 
 log = logging.getLogger(__name__)
 
+WAFFLE_FLAG_NAMESPACE = WaffleFlagNamespace(name='django_comment_client')
+
+# Lists the discussion xblocks from the course blocks, see get_discussion_index.
+DISCUSSION_INDEX_FLAG = CourseWaffleFlag(WAFFLE_FLAG_NAMESPACE, 'discussion_index')
+
 
 def extract(dic, keys):
     """
@@ -138,14 +153,40 @@ def get_accessible_discussion_xblocks_by_course_id(course_id, user, include_all=
     Return a list of all valid discussion xblocks in this course that
     are accessible to the given user.
     """
+    if DISCUSSION_INDEX_FLAG.is_enabled(course_id):
+        return [entry for entry in get_discussion_index(course_id, user, include_all) if has_required_keys(entry)]
+
     all_xblocks = modulestore().get_items(course_id, qualifiers={'category': 'discussion'}, include_orphans=False)
+    xblocks = [xblock for xblock in all_xblocks if has_required_keys(xblock)]
+    if include_all:
+        return xblocks
 
     return [
-        xblock for xblock in all_xblocks
-        if has_required_keys(xblock) and (include_all or has_access(user, 'load', xblock, course_id))
+        xblock for xblock, access in zip(xblocks, has_access_many(user, 'load', xblocks, course_id)) if access
     ]
 
 
+@request_cached
+def get_discussion_index(course_id, user, include_all=False):
+    """
+    Return the DiscussionIndexEntry of each discussion xblock in this course
+    that is accessible to the given user, from the course blocks collected
+    by the DiscussionIndexTransformer.
+
+    The entries have the xblock fields that are used to list discussion
+    topics, so they can be used in place of the xblocks.
+    """
+    transformers = [DiscussionIndexTransformer()]
+    if not include_all:
+        transformers = COURSE_BLOCK_ACCESS_TRANSFORMERS + transformers
+    course_blocks = get_course_blocks(
+        user,
+        modulestore().make_course_usage_key(course_id),
+        transformers=BlockStructureTransformers(transformers),
+    )
+    return DiscussionIndexTransformer.get_entries(course_blocks)
+
+
 def get_discussion_id_map_entry(xblock):
     """
     Returns a tuple of (discussion_id, metadata) suitable for inclusion in the results of get_discussion_id_map().
@@ -194,17 +235,26 @@ def get_cached_discussion_id_map_by_course_id(course_id, discussion_ids, user):
     Returns a dict mapping discussion_ids to respective discussion xblock metadata if it is cached and visible to the
     user. If not, returns the result of get_discussion_id_map
     """
+    if DISCUSSION_INDEX_FLAG.is_enabled(course_id):
+        discussion_id_map = get_discussion_id_map_by_course_id(course_id, user)
+        return {
+            discussion_id: discussion_id_map[discussion_id]
+            for discussion_id in discussion_ids if discussion_id in discussion_id_map
+        }
+
     try:
-        entries = []
+        xblocks = []
         for discussion_id in discussion_ids:
             key = get_cached_discussion_key(course_id, discussion_id)
             if not key:
                 continue
             xblock = modulestore().get_item(key)
-            if not (has_required_keys(xblock) and has_access(user, 'load', xblock, course_id)):
-                continue
-            entries.append(get_discussion_id_map_entry(xblock))
-        return dict(entries)
+            if has_required_keys(xblock):
+                xblocks.append(xblock)
+        return dict(
+            get_discussion_id_map_entry(xblock)
+            for xblock, access in zip(xblocks, has_access_many(user, 'load', xblocks, course_id)) if access
+        )
     except DiscussionIdMapIsNotCached:
         return get_discussion_id_map_by_course_id(course_id, user)
 
@@ -431,6 +481,8 @@ def discussion_category_id_access(course, user, discussion_id, xblock=None):
     """
     if discussion_id in course.top_level_discussion_topic_ids:
         return True
+    if xblock is None and DISCUSSION_INDEX_FLAG.is_enabled(course.id):
+        return discussion_id in get_discussion_categories_ids(course, user)
     try:
         if not xblock:
             key = get_cached_discussion_key(course.id, discussion_id)
@@ -538,11 +590,11 @@ class QueryCountDebugMiddleware(object):
         return response
 
 
-def get_ability(course_id, content, user):
+def get_ability(course_id, content, user, group_ids_by_username=None):
     """
     Return a dictionary of forums-oriented actions and the user's permission to perform them
     """
-    (user_group_id, content_user_group_id) = get_user_group_ids(course_id, content, user)
+    (user_group_id, content_user_group_id) = get_user_group_ids(course_id, content, user, group_ids_by_username)
     return {
         'editable': check_permissions_by_view(
             user,
@@ -586,14 +638,19 @@ def get_ability(course_id, content, user):
 # TODO: RENAME
 
 
-def get_user_group_ids(course_id, content, user=None):
+def get_user_group_ids(course_id, content, user=None, group_ids_by_username=None):
     """
     Given a user, course ID, and the content of the thread or comment, returns the group ID for the current user
     and the user that posted the thread/comment.
+
+    The group IDs are looked up in group_ids_by_username when given, see _get_group_ids_by_username.
     """
     content_user_group_id = None
     user_group_id = None
-    if course_id is not None:
+    if group_ids_by_username is not None:
+        content_user_group_id = group_ids_by_username.get(content.get('username'))
+        user_group_id = group_ids_by_username.get(user.username) if user else None
+    elif course_id is not None:
         course_discussion_settings = get_course_discussion_settings(course_id)
         if content.get('username'):
             try:
@@ -606,7 +663,7 @@ def get_user_group_ids(course_id, content, user=None):
     return user_group_id, content_user_group_id
 
 
-def get_annotated_content_info(course_id, content, user, user_info):
+def get_annotated_content_info(course_id, content, user, user_info, group_ids_by_username=None):
     """
     Get metadata for an individual content (thread or comment)
     """
@@ -618,37 +675,80 @@ def get_annotated_content_info(course_id, content, user, user_info):
     return {
         'voted': voted,
         'subscribed': content['id'] in user_info['subscribed_thread_ids'],
-        'ability': get_ability(course_id, content, user),
+        'ability': get_ability(course_id, content, user, group_ids_by_username),
     }
 
 # TODO: RENAME
 
 
-def get_annotated_content_infos(course_id, thread, user, user_info):
+def get_annotated_content_infos(course_id, thread, user, user_info, group_ids_by_username=None):
     """
     Get metadata for a thread and its children
     """
+    if group_ids_by_username is None:
+        group_ids_by_username = _get_group_ids_by_username(course_id, [thread], user)
+
     infos = {}
 
+    has_responses = any(thread.get(field) for field in Thread.response_fields)
+    if has_responses and thread.get('user_id') and thread.get('thread_type'):
+        # The permission checks on the responses look up their thread, see check_question_author.
+        Thread.remember(thread)
+
     def annotate(content):
-        infos[str(content['id'])] = get_annotated_content_info(course_id, content, user, user_info)
-        for child in (
-                content.get('children', []) +
-                content.get('endorsed_responses', []) +
-                content.get('non_endorsed_responses', [])
-        ):
+        infos[str(content['id'])] = get_annotated_content_info(
+            course_id, content, user, user_info, group_ids_by_username
+        )
+        for child in _get_content_children(content):
             annotate(child)
     annotate(thread)
     return infos
 
 
+def _get_content_children(content):
+    """
+    Returns the responses and comments of the given thread or comment.
+    """
+    return (
+        content.get('children', []) +
+        content.get('endorsed_responses', []) +
+        content.get('non_endorsed_responses', [])
+    )
+
+
+def _get_group_ids_by_username(course_id, threads, user):
+    """
+    Returns the group IDs of the given user and of the authors of the given
+    threads and of their responses and comments, as a dict of
+    {username: group_id}, with a few queries for all of them.
+    """
+    if course_id is None:
+        return {}
+    course_discussion_settings = get_course_discussion_settings(course_id)
+    if _get_course_division_scheme(course_discussion_settings) == CourseDiscussionSettings.NONE:
+        return {}
+
+    usernames = set([user.username]) if user else set()
+    contents = list(threads)
+    while contents:
+        content = contents.pop()
+        if content.get('username'):
+            usernames.add(content['username'])
+        contents.extend(_get_content_children(content))
+
+    content_users = list(User.objects.filter(username__in=usernames))
+    group_ids = get_group_ids_for_users(content_users, course_discussion_settings)
+    return {content_user.username: group_ids[content_user.id] for content_user in content_users}
+
+
 def get_metadata_for_threads(course_id, threads, user, user_info):
     """
     Returns annotated content information for the specified course, threads, and user information
     """
+    group_ids_by_username = _get_group_ids_by_username(course_id, threads, user)
 
     def infogetter(thread):
-        return get_annotated_content_infos(course_id, thread, user, user_info)
+        return get_annotated_content_infos(course_id, thread, user, user_info, group_ids_by_username)
 
     metadata = reduce(merge_dict, map(infogetter, threads), {})
     return metadata
@@ -848,6 +948,33 @@ def get_group_id_for_user(user, course_discussion_settings):
         return None
 
 
+def get_group_ids_for_users(users, course_discussion_settings):
+    """
+    Given users, return the group_id of each user according to the course_discussion_settings,
+    as a dict of {user_id: group_id}, like get_group_id_for_user but with a few queries for all of them.
+    """
+    division_scheme = _get_course_division_scheme(course_discussion_settings)
+    course_key = course_discussion_settings.course_id
+    if division_scheme == CourseDiscussionSettings.COHORT:
+        return {
+            user_id: cohort.id if cohort else None
+            for user_id, cohort in get_cohorts_for_users(course_key, users).iteritems()
+        }
+    elif division_scheme == CourseDiscussionSettings.ENROLLMENT_TRACK:
+        partition = PartitionService(course_key).get_user_partition(ENROLLMENT_TRACK_PARTITION_ID)
+        if partition is None:
+            raise ValueError(
+                "Configuration problem!  No user_partition with id {0} "
+                "in course {1}".format(ENROLLMENT_TRACK_PARTITION_ID, course_key)
+            )
+        groups = get_groups_for_users(course_key, [partition], users)[partition.id]
+        # We negate the group_ids from dynamic partitions so that they will not conflict
+        # with cohort IDs (which are an auto-incrementing integer field, starting at 1).
+        return {user.id: -1 * groups[user.id].id if user.id in groups else None for user in users}
+    else:
+        return {user.id: None for user in users}
+
+
 def is_comment_too_deep(parent):
     """
     Determine whether a comment with the given parent violates MAX_COMMENT_DEPTH
@@ -21,7 +21,7 @@ def edxnotes(cls):
         Returns raw html for the component.
         """
         is_studio = getattr(self.system, "is_author_mode", False)
-        course = self.descriptor.runtime.modulestore.get_course(self.runtime.course_id)
+        course = _get_course(self)
 
         # Must be disabled:
         # - in Studio;
@@ -48,5 +48,30 @@ def edxnotes(cls):
                 },
             })
 
+    original_has_support = getattr(cls, 'has_support', None)
+
+    def has_support(self, view, functionality):
+        """
+        Annotatable components render a wrapper with the learner's token, so they
+        can't share a cached rendering.
+        """
+        if functionality == "render_cache" and is_feature_enabled(_get_course(self)):
+            return False
+        if original_has_support is None:
+            return False
+        return original_has_support(self, view, functionality)
+
     cls.get_html = get_html
+    cls.has_support = has_support
     return cls
+
+
+def _get_course(block):
+    """
+    Returns the course of the block, loading it once per runtime.
+    """
+    # pylint: disable=protected-access
+    runtime = block.runtime
+    if '_edxnotes_course' not in vars(runtime):
+        runtime._edxnotes_course = block.descriptor.runtime.modulestore.get_course(runtime.course_id)
+    return runtime._edxnotes_course
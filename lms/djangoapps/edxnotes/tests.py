@@ -170,6 +170,15 @@ class EdxNotesDecoratorTest(ModuleStoreTestCase):
         enable_edxnotes_for_the_course(self.course, self.user.id)
         self.assertEqual("original_get_html", self.problem.get_html())
 
+    @patch.dict("django.conf.settings.FEATURES", {"ENABLE_EDXNOTES": True})
+    def test_edxnotes_render_cache_not_supported(self):
+        """
+        Tests that annotatable components don't support the render cache.
+        """
+        enable_edxnotes_for_the_course(self.course, self.user.id)
+        self.assertFalse(self.problem.has_support(self.problem.get_html, "render_cache"))
+        self.assertEqual(self.problem.descriptor.runtime.modulestore.get_course.call_count, 1)
+
 
 @attr(shard=3)
 @skipUnless(settings.FEATURES["ENABLE_EDXNOTES"], "EdxNotes feature needs to be enabled.")
@@ -11,13 +11,15 @@ from django.contrib.auth.models import User
 from django.core.exceptions import ObjectDoesNotExist
 from django.core.serializers.json import DjangoJSONEncoder
 from django.core.urlresolvers import reverse
+from django.db import transaction
 from django.db.models import Count, Q
+from django.utils import timezone
 from edx_proctoring.api import get_exam_violation_report
 from opaque_keys.edx.keys import UsageKey
 
 import xmodule.graders as xmgraders
 from certificates.models import CertificateStatuses, GeneratedCertificate
-from courseware.models import StudentModule
+from courseware.models import ProblemAnswersRefresh, StudentModule, StudentModuleAnswer
 from lms.djangoapps.grades.context import grading_context_for_course
 from lms.djangoapps.verify_student.models import SoftwareSecurePhotoVerification
 from openedx.core.djangoapps.site_configuration import helpers as configuration_helpers
@@ -52,6 +54,9 @@ CERTIFICATE_FEATURES = ('course_id', 'mode', 'status', 'grade', 'created_date',
 
 UNAVAILABLE = "[unavailable]"
 
+# Number of StudentModule rows read per query when aggregating problem state.
+PROBLEM_STATE_CHUNK_SIZE = 1000
+
 
 def sale_order_record_features(course_id, features):
     """
@@ -440,6 +445,111 @@ def list_problem_responses(course_key, problem_location):
     ]
 
 
+def _iter_problem_states(course_key, problem_key, modified_since=None, chunk_size=PROBLEM_STATE_CHUNK_SIZE):
+    """
+    Yield lists of (id, state) of the learners' StudentModule rows for `problem_key`,
+    optionally only of the rows modified at or after `modified_since`.
+
+    Rows are read in chunks using keyset pagination on the id, so deep pages cost
+    no more than the first one and only the needed columns are loaded.
+    """
+    queryset = StudentModule.objects.filter(course_id=course_key, module_state_key=problem_key)
+    if modified_since is not None:
+        queryset = queryset.filter(modified__gte=modified_since)
+
+    last_id = 0
+    while True:
+        rows = list(queryset.filter(id__gt=last_id).order_by('id').values_list('id', 'state')[:chunk_size])
+        if rows:
+            yield rows
+        if len(rows) < chunk_size:
+            return
+        last_id = rows[-1][0]
+
+
+def _answers_from_state(state):
+    """
+    Return the submitted answers in a StudentModule `state` as a tuple of
+    (answer_id, answer) pairs, with non-string answers (e.g. checkbox
+    selections) serialized to JSON.
+    """
+    try:
+        student_answers = json.loads(state or '{}').get('student_answers') or {}
+    except (ValueError, AttributeError):
+        return ()
+    return tuple(
+        (answer_id, answer if isinstance(answer, basestring) else json.dumps(answer, sort_keys=True))
+        for answer_id, answer in sorted(student_answers.items())
+    )
+
+
+def _refresh_problem_answers(course_key, problem_key, version):
+    """
+    Bring the StudentModuleAnswers of `problem_key` up to date with the state of
+    its StudentModules, reading only the StudentModules modified since the last
+    refresh of the same problem `version`.
+    """
+    refresh, __ = ProblemAnswersRefresh.objects.get_or_create(
+        module_state_key=problem_key, defaults={'version': version}
+    )
+    if refresh.version != version:
+        refresh.version = version
+        refresh.refreshed_at = None
+
+    # Rows saved while the states are read are read again by the next refresh.
+    refreshed_at = timezone.now()
+    for rows in _iter_problem_states(course_key, problem_key, modified_since=refresh.refreshed_at):
+        with transaction.atomic():
+            StudentModuleAnswer.objects.filter(student_module_id__in=[row[0] for row in rows]).delete()
+            StudentModuleAnswer.objects.bulk_create([
+                StudentModuleAnswer(
+                    student_module_id=student_module_id,
+                    module_state_key=problem_key,
+                    answer_id=answer_id,
+                    answer=answer,
+                )
+                for student_module_id, state in rows
+                for answer_id, answer in _answers_from_state(state)
+            ])
+
+    refresh.refreshed_at = refreshed_at
+    refresh.save()
+
+
+def problem_answer_distribution(course_key, problem_location, version):
+    """
+    Return how many learners currently have each answer to a problem.
+
+    problem_answer_distribution(course_key, problem_location, version)
+
+    would return {
+        u'i4x-robot-course-problem-p1_2_1': {u'choice_0': 12, u'choice_2': 3},
+        u'i4x-robot-course-problem-p1_3_1': {u'42': 7},
+    }
+
+    The answers in the learners' states are kept as StudentModuleAnswers, which
+    are refreshed from the StudentModules modified since the previous call, and
+    counted in the database. `version` identifies the content of the problem
+    (for instance its edited_on timestamp): a new version reads every learner's
+    state again.
+    """
+    problem_key = UsageKey.from_string(problem_location)
+    if not problem_key.run:
+        problem_key = problem_key.map_into_course(course_key)
+    if problem_key.course_key != course_key:
+        return {}
+
+    _refresh_problem_answers(course_key, problem_key, unicode(version))
+
+    distribution = {}
+    answer_counts = StudentModuleAnswer.objects.filter(
+        module_state_key=problem_key
+    ).values_list('answer_id', 'answer').annotate(count=Count('id'))
+    for answer_id, answer, count in answer_counts:
+        distribution.setdefault(answer_id, {})[answer] = count
+    return distribution
+
+
 def course_registration_features(features, registration_codes, csv_type):
     """
     Return list of Course Registration Codes as dictionaries.
@@ -8,15 +8,17 @@ import json
 import pytz
 from django.core.urlresolvers import reverse
 from django.db.models import Q
+from django.test import TestCase
 from edx_proctoring.api import create_exam
 from edx_proctoring.models import ProctoredExamStudentAttempt
 from mock import MagicMock, Mock, patch
 from nose.plugins.attrib import attr
-from opaque_keys.edx.locator import UsageKey
+from opaque_keys.edx.locator import CourseLocator, UsageKey
 
 from course_modes.models import CourseMode
 from course_modes.tests.factories import CourseModeFactory
-from courseware.tests.factories import InstructorFactory
+from courseware.tests.factories import InstructorFactory, StudentModuleFactory
+from instructor_analytics import basic
 from instructor_analytics.basic import (
     AVAILABLE_FEATURES,
     PROFILE_FEATURES,
@@ -28,6 +30,7 @@ from instructor_analytics.basic import (
     get_proctored_exam_results,
     list_may_enroll,
     list_problem_responses,
+    problem_answer_distribution,
     sale_order_record_features,
     sale_record_features
 )
@@ -49,6 +52,59 @@ from xmodule.modulestore.tests.django_utils import ModuleStoreTestCase
 from xmodule.modulestore.tests.factories import CourseFactory
 
 
+@attr(shard=3)
+class TestProblemAnswerDistribution(TestCase):
+    """ Test the incrementally refreshed answer distribution of a problem. """
+
+    def setUp(self):
+        super(TestProblemAnswerDistribution, self).setUp()
+        self.course_key = CourseLocator('edX', 'analytics', '2017')
+        self.problem_key = self.course_key.make_usage_key('problem', 'p1')
+        self.answer_id = u'{}_2_1'.format(self.problem_key.html_id())
+        self.modules = [
+            StudentModuleFactory(
+                course_id=self.course_key,
+                module_state_key=self.problem_key,
+                state=json.dumps({'student_answers': {self.answer_id: answer}}),
+            )
+            for answer in (u'choice_0', u'choice_0', u'choice_1')
+        ]
+
+    def get_distribution(self, version=1):
+        """ Returns the answer distribution of the problem. """
+        return problem_answer_distribution(self.course_key, unicode(self.problem_key), version)
+
+    def test_distribution(self):
+        self.assertEqual(self.get_distribution(), {self.answer_id: {u'choice_0': 2, u'choice_1': 1}})
+
+    def test_incremental_refresh(self):
+        self.get_distribution()
+
+        self.modules[0].state = json.dumps({'student_answers': {self.answer_id: u'choice_1'}})
+        self.modules[0].save()
+        StudentModuleFactory(course_id=self.course_key, module_state_key=self.problem_key, state=None)
+
+        with patch('instructor_analytics.basic._iter_problem_states', wraps=basic._iter_problem_states) as iter_states:
+            distribution = self.get_distribution()
+            self.assertIsNotNone(iter_states.call_args[1]['modified_since'])
+        self.assertEqual(distribution, {self.answer_id: {u'choice_0': 1, u'choice_1': 2}})
+
+    def test_deleted_state(self):
+        self.get_distribution()
+        self.modules[2].delete()
+        self.assertEqual(self.get_distribution(), {self.answer_id: {u'choice_0': 2}})
+
+    def test_new_version(self):
+        self.get_distribution()
+        with patch('instructor_analytics.basic._iter_problem_states', wraps=basic._iter_problem_states) as iter_states:
+            self.assertEqual(self.get_distribution(version=2), {self.answer_id: {u'choice_0': 2, u'choice_1': 1}})
+            self.assertIsNone(iter_states.call_args[1]['modified_since'])
+
+    def test_other_course(self):
+        other_course_key = CourseLocator('edX', 'other', '2017')
+        self.assertEqual(problem_answer_distribution(other_course_key, unicode(self.problem_key), 1), {})
+
+
 @attr(shard=3)
 class TestAnalyticsBasic(ModuleStoreTestCase):
     """ Test basic analytics functions. """
@@ -1,6 +1,7 @@
 """
 This module contains celery task functions for handling the management of subtasks.
 """
+import heapq
 import json
 import logging
 from contextlib import contextmanager
@@ -25,6 +26,8 @@ SUBTASK_LOCK_EXPIRE = 60 * 10  # Lock expires in 10 minutes
 # Number of times to retry if a subtask update encounters a lock on the InstructorTask.
 # (These are recursive retries, so don't make this number too large.)
 MAX_DATABASE_LOCK_RETRIES = 5
+# Number of items read from the database at once when generating the items of subtasks.
+DEFAULT_ITEMS_PER_QUERY = 1000
 
 
 def _get_number_of_subtasks(total_num_items, items_per_task):
@@ -66,6 +69,25 @@ def track_memory_usage(metric, course_id):
         )
 
 
+def _iterate_items_by_pk(queryset, item_fields, items_per_query):
+    """
+    Yields the tuples of `queryset.values_list('pk', *item_fields)`, in order of pk.
+
+    The queryset is read in chunks of `items_per_query` items, each starting after the
+    last pk of the previous chunk, so that no query needs to skip over the items already read.
+    """
+    queryset = queryset.order_by('pk').values_list('pk', *item_fields)
+    last_pk = None
+    while True:
+        chunk_queryset = queryset if last_pk is None else queryset.filter(pk__gt=last_pk)
+        items = list(chunk_queryset[:items_per_query])
+        for item in items:
+            yield item
+        if len(items) < items_per_query:
+            return
+        last_pk = items[-1][0]
+
+
 def _generate_items_for_subtask(
     item_querysets,  # pylint: disable=bad-continuation
     item_fields,
@@ -73,39 +95,46 @@ def _generate_items_for_subtask(
     items_per_task,
     total_num_subtasks,
     course_id,
+    items_per_query=DEFAULT_ITEMS_PER_QUERY,
 ):
     """
     Generates a chunk of "items" that should be passed into a subtask.
 
     Arguments:
         `item_querysets` : a list of query sets, each of which defines the "items" that should be passed to subtasks.
-        `item_fields` : the fields that should be included in the dict that is returned.
-            These are in addition to the 'pk' field.
-        `total_num_items` : the result of summing the count of each queryset in `item_querysets`.
-        `items_per_query` : size of chunks to break the query operation into.
+        `item_fields` : the fields that should be included in the tuple that is returned.
+            These are in addition to the 'pk' field, which comes first.
+        `total_num_items` : the number of distinct items in `item_querysets`.
         `items_per_task` : maximum size of chunks to break each query chunk into for use by a subtask.
         `course_id` : course_id of the course. Only needed for the track_memory_usage context manager.
+        `items_per_query` : size of chunks to break the query operation into.
+
+    The querysets are each read in order of pk, and merged, so that an item that is in several
+    of them is only generated once.
 
-    Returns:  yields a list of dicts, where each dict contains the fields in `item_fields`, plus the 'pk' field.
+    Returns:  yields a list of tuples, where each tuple contains the 'pk' field, then the fields in `item_fields`.
 
     Warning:  if the algorithm here changes, the _get_number_of_subtasks() method should similarly be changed.
     """
     num_items_queued = 0
-    all_item_fields = list(item_fields)
-    all_item_fields.append('pk')
     num_subtasks = 0
 
     items_for_task = []
 
     with track_memory_usage('course_email.subtask_generation.memory', course_id):
-        for queryset in item_querysets:
-            for item in queryset.values(*all_item_fields).iterator():
-                if len(items_for_task) == items_per_task and num_subtasks < total_num_subtasks - 1:
-                    yield items_for_task
-                    num_items_queued += items_per_task
-                    items_for_task = []
-                    num_subtasks += 1
-                items_for_task.append(item)
+        last_pk = None
+        for item in heapq.merge(*[
+                _iterate_items_by_pk(queryset, item_fields, items_per_query) for queryset in item_querysets
+        ]):
+            if item[0] == last_pk:
+                continue
+            last_pk = item[0]
+            if len(items_for_task) == items_per_task and num_subtasks < total_num_subtasks - 1:
+                yield items_for_task
+                num_items_queued += items_per_task
+                items_for_task = []
+                num_subtasks += 1
+            items_for_task.append(item)
 
         # yield remainder items for task, if any
         if items_for_task:
@@ -138,6 +167,9 @@ class SubtaskStatus(object):
       'retried_withmax' : number of times the subtask has been retried for conditions that
           should have a maximum count applied
       'state' : celery state of the subtask (e.g. QUEUING, PROGRESS, RETRY, FAILURE, SUCCESS)
+      'items_per_second' : rate at which the last attempt of the subtask processed its items, if measured
+      'connection_errors' : number of errors of each connection used by the subtask, if any, keyed by
+          connection number.  These are not accumulated into the task's progress.
 
     Object is not JSON-serializable, so to_dict and from_dict methods are provided so that
     it can be passed as a serializable argument to tasks (and be reconstituted within such tasks).
@@ -147,7 +179,8 @@ class SubtaskStatus(object):
     Also, we should count up "not attempted" separately from attempted/failed.
     """
 
-    def __init__(self, task_id, attempted=None, succeeded=0, failed=0, skipped=0, retried_nomax=0, retried_withmax=0, state=None):
+    def __init__(self, task_id, attempted=None, succeeded=0, failed=0, skipped=0, retried_nomax=0, retried_withmax=0,
+                 state=None, items_per_second=None, connection_errors=None):
         """Construct a SubtaskStatus object."""
         self.task_id = task_id
         if attempted is not None:
@@ -160,6 +193,8 @@ class SubtaskStatus(object):
         self.retried_nomax = retried_nomax
         self.retried_withmax = retried_withmax
         self.state = state if state is not None else QUEUING
+        self.items_per_second = items_per_second
+        self.connection_errors = connection_errors if connection_errors is not None else {}
 
     @classmethod
     def from_dict(cls, d):
@@ -198,6 +233,15 @@ class SubtaskStatus(object):
         if state is not None:
             self.state = state
 
+    def increment_connection_errors(self, connection_num, errors=1):
+        """
+        Add `errors` to the count of errors of connection `connection_num`.
+
+        Keys are strings, so that the counts are the same once serialized to JSON.
+        """
+        key = unicode(connection_num)
+        self.connection_errors[key] = self.connection_errors.get(key, 0) + errors
+
     def get_retry_count(self):
         """Returns the number of retries of any kind."""
         return self.retried_nomax + self.retried_withmax
@@ -281,6 +325,7 @@ def queue_subtasks_for_query(
     item_fields,
     items_per_task,
     total_num_items,
+    items_per_query=DEFAULT_ITEMS_PER_QUERY,
 ):
     """
     Generates and queues subtasks to each execute a chunk of "items" generated by a queryset.
@@ -292,10 +337,12 @@ def queue_subtasks_for_query(
             Arguments are the list of items to be processed by this subtask, and a SubtaskStatus
             object reflecting initial status (and containing the subtask's id).
         `item_querysets` : a list of query sets that define the "items" that should be passed to subtasks.
-        `item_fields` : the fields that should be included in the dict that is returned.
-            These are in addition to the 'pk' field.
+            An item that is in several of them is only passed once.
+        `item_fields` : the fields that should be included in the tuple that is passed for each item.
+            These are in addition to the 'pk' field, which comes first.
         `items_per_task` : maximum size of chunks to break each query chunk into for use by a subtask.
         `total_num_items` : total amount of items that will be put into subtasks
+        `items_per_query` : number of items to read from the database at once.
 
     Returns:  the task progress as stored in the InstructorTask object.
 
@@ -327,6 +374,7 @@ def queue_subtasks_for_query(
         items_per_task,
         total_num_subtasks,
         entry.course_id,
+        items_per_query,
     )
 
     # Now create the subtasks, and start them running.
@@ -9,11 +9,13 @@ from itertools import chain, izip, izip_longest
 from time import time
 
 from lazy import lazy
+from opaque_keys import InvalidKeyError
+from opaque_keys.edx.keys import UsageKey
 from pytz import UTC
 
 from certificates.models import CertificateWhitelist, GeneratedCertificate, certificate_info_for_user
 from courseware.courses import get_course_by_id
-from instructor_analytics.basic import list_problem_responses
+from instructor_analytics.basic import list_problem_responses, problem_answer_distribution
 from instructor_analytics.csvs import format_dictlist
 from lms.djangoapps.grades.context import grading_context, grading_context_for_course
 from lms.djangoapps.grades.models import PersistentCourseGrade
@@ -26,7 +28,8 @@ from openedx.core.djangoapps.user_api.course_tag.api import BulkCourseTags
 from student.models import CourseEnrollment
 from student.roles import BulkRoleCache
 from xmodule.modulestore.django import modulestore
-from xmodule.partitions.partitions_service import PartitionService
+from xmodule.modulestore.exceptions import ItemNotFoundError
+from xmodule.partitions.partitions_service import get_groups_for_users
 from xmodule.split_test_module import get_split_user_partitions
 
 from .runner import TaskProgress
@@ -182,6 +185,9 @@ class _CourseGradeBulkContext(object):
         BulkRoleCache.prefetch(users)
         PersistentCourseGrade.prefetch(context.course_id, users)
         BulkCourseTags.prefetch(context.course_id, users)
+        self.experiment_groups = get_groups_for_users(
+            context.course_id, context.course_experiments, users, assign=False
+        )
 
 
 class CourseGradeReport(object):
@@ -333,14 +339,14 @@ class CourseGradeReport(object):
             cohort_group_names.append(group.name if group else '')
         return cohort_group_names
 
-    def _user_experiment_group_names(self, user, context):
+    def _user_experiment_group_names(self, user, context, experiment_groups):
         """
         Returns a list of names of course experiments in which the given user
         belongs.
         """
         experiment_group_names = []
         for partition in context.course_experiments:
-            group = PartitionService(context.course_id).get_group(user, partition, assign=False)
+            group = experiment_groups[partition.id].get(user.id)
             experiment_group_names.append(group.name if group else '')
         return experiment_group_names
 
@@ -415,7 +421,7 @@ class CourseGradeReport(object):
                         [user.id, user.email, user.username] +
                         self._user_grade_results(course_grade, context) +
                         self._user_cohort_group_names(user, context) +
-                        self._user_experiment_group_names(user, context) +
+                        self._user_experiment_group_names(user, context, bulk_context.experiment_groups) +
                         self._user_team_names(user, bulk_context.teams) +
                         self._user_verification_mode(user, context, bulk_context.enrollments) +
                         self._user_certificate_info(user, context, course_grade, bulk_context.certs) +
@@ -550,8 +556,33 @@ class ProblemResponses(object):
         task_progress.update_task_state(extra_meta=current_step)
 
         # Perform the upload
-        problem_location = re.sub(r'[:/]', '_', problem_location)
-        csv_name = 'student_state_from_{}'.format(problem_location)
+        csv_location = re.sub(r'[:/]', '_', problem_location)
+        csv_name = 'student_state_from_{}'.format(csv_location)
         upload_csv_to_report_store(rows, csv_name, course_id, start_date)
 
+        distribution_rows = cls._answer_distribution_rows(course_id, problem_location)
+        if distribution_rows is not None:
+            csv_name = 'answer_distribution_from_{}'.format(csv_location)
+            upload_csv_to_report_store(distribution_rows, csv_name, course_id, start_date)
+
         return task_progress.update_task_state(extra_meta=current_step)
+
+    @classmethod
+    def _answer_distribution_rows(cls, course_id, problem_location):
+        """
+        Returns the rows of a CSV file counting the learners with each answer
+        to the problem, or None if the location isn't a problem of the course.
+        """
+        try:
+            problem = modulestore().get_item(UsageKey.from_string(problem_location).map_into_course(course_id))
+        except (InvalidKeyError, ItemNotFoundError):
+            return None
+        if problem.location.block_type != 'problem':
+            return None
+
+        distribution = problem_answer_distribution(course_id, problem_location, problem.edited_on)
+        rows = [['Answer ID', 'Answer', 'Count']]
+        for answer_id, answer_counts in sorted(distribution.iteritems()):
+            for answer, count in sorted(answer_counts.iteritems()):
+                rows.append([answer_id, answer, count])
+        return rows
@@ -3,6 +3,7 @@ Unit tests for instructor_task subtasks.
 """
 from uuid import uuid4
 
+from django.contrib.auth.models import User
 from mock import Mock, patch
 
 from lms.djangoapps.instructor_task.subtasks import queue_subtasks_for_query
@@ -79,3 +80,32 @@ class TestSubtasks(InstructorTaskCourseTestCase):
         self.assertEqual(len(mock_create_subtask_fcn_args[0][0][0]), 3)
         self.assertEqual(len(mock_create_subtask_fcn_args[1][0][0]), 3)
         self.assertEqual(len(mock_create_subtask_fcn_args[2][0][0]), 5)
+
+    def test_queue_subtasks_for_query_merges_querysets(self):
+        """Test queue_subtasks_for_query() only queues the items that are in several querysets once."""
+
+        instructor_task = InstructorTaskFactory.create(
+            course_id=self.course.id,
+            task_id=str(uuid4()),
+            task_key='dummy_task_key',
+            task_type='bulk_course_email',
+        )
+        self._enroll_students_in_course(self.course.id, 5)
+        users = User.objects.filter(courseenrollment__course_id=self.course.id)
+        expected_items = list(users.order_by('pk').values_list('pk', 'email'))
+
+        mock_create_subtask_fcn = Mock()
+        queue_subtasks_for_query(
+            entry=instructor_task,
+            action_name='action_name',
+            create_subtask_fcn=mock_create_subtask_fcn,
+            item_querysets=[users.order_by('-pk'), users.filter(pk__in=[item[0] for item in expected_items[1:3]])],
+            item_fields=['email'],
+            items_per_task=10,
+            total_num_items=len(expected_items),
+            items_per_query=2,
+        )
+
+        # The items are read by chunks of 2, and queued once, in order of pk
+        self.assertEqual(mock_create_subtask_fcn.call_count, 1)
+        self.assertEqual(mock_create_subtask_fcn.call_args[0][0], expected_items)
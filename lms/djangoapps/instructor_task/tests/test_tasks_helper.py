@@ -8,6 +8,7 @@ Unit tests for LMS instructor-initiated background tasks helper functions.
 
 """
 
+import json
 import os
 import shutil
 import tempfile
@@ -30,7 +31,7 @@ from certificates.models import CertificateStatuses, GeneratedCertificate
 from certificates.tests.factories import CertificateWhitelistFactory, GeneratedCertificateFactory
 from course_modes.models import CourseMode
 from course_modes.tests.factories import CourseModeFactory
-from courseware.tests.factories import InstructorFactory
+from courseware.tests.factories import InstructorFactory, StudentModuleFactory
 from instructor_analytics.basic import UNAVAILABLE
 from lms.djangoapps.grades.models import PersistentCourseGrade
 from lms.djangoapps.grades.transformer import GradesTransformer
@@ -486,6 +487,32 @@ class TestProblemResponsesReport(TestReportMixin, InstructorTaskCourseTestCase):
         self.assertEquals(len(links), 1)
         self.assertDictContainsSubset({'attempted': 3, 'succeeded': 3, 'failed': 0}, result)
 
+    def test_answer_distribution(self):
+        problem = ItemFactory.create(parent_location=self.course.location, category='problem')
+        answer_id = u'{}_2_1'.format(problem.location.html_id())
+        for answer in (u'choice_0', u'choice_0', u'choice_1'):
+            StudentModuleFactory.create(
+                course_id=self.course.id,
+                module_state_key=problem.location,
+                state=json.dumps({'student_answers': {answer_id: answer}}),
+            )
+
+        task_input = {'problem_location': unicode(problem.location)}
+        with patch('lms.djangoapps.instructor_task.tasks_helper.runner._get_current_task'):
+            ProblemResponses.generate(None, None, self.course.id, task_input, 'calculated')
+        report_store = ReportStore.from_config(config_name='GRADES_DOWNLOAD')
+        links = report_store.links_for(self.course.id)
+
+        self.assertEquals(len(links), 2)
+        file_index = [index for index, link in enumerate(links) if 'answer_distribution_from_' in link[0]][0]
+        self.verify_rows_in_csv(
+            [
+                {'Answer ID': answer_id, 'Answer': u'choice_0', 'Count': u'2'},
+                {'Answer ID': answer_id, 'Answer': u'choice_1', 'Count': u'1'},
+            ],
+            file_index=file_index,
+        )
+
 
 @ddt.ddt
 @patch.dict('django.conf.settings.FEATURES', {'ENABLE_PAID_COURSE_REGISTRATION': True})
@@ -3,14 +3,17 @@ Module implementing `xblock.runtime.Runtime` functionality for the LMS
 """
 import xblock.reference.plugins
 from django.conf import settings
+from django.core.cache import cache
 from django.core.urlresolvers import reverse
+from xblock.fragment import Fragment
 
 from badges.service import BadgingService
 from badges.utils import badges_enabled
 from lms.djangoapps.lms_xblock.models import XBlockAsidesConfig
+from openedx.core.djangoapps import monitoring_utils
 from openedx.core.djangoapps.user_api.course_tag import api as user_course_tag_api
 from openedx.core.lib.url_utils import quote_slashes
-from openedx.core.lib.xblock_utils import xblock_local_resource_url
+from openedx.core.lib.xblock_utils import RENDER_CACHE_TIMEOUT, render_cache_key, xblock_local_resource_url
 from request_cache.middleware import RequestCache
 from xmodule.library_tools import LibraryToolsService
 from xmodule.modulestore.django import ModuleI18nService, modulestore
@@ -149,6 +152,33 @@ class LmsModuleSystem(ModuleSystem):  # pylint: disable=abstract-method
         self.request_token = kwargs.pop('request_token', None)
         super(LmsModuleSystem, self).__init__(**kwargs)
 
+    def render(self, block, view_name, context=None):
+        """
+        Render a block by invoking its view, or by using the fragment cached for it when
+        the view supports the render cache (see `openedx.core.lib.xblock_utils.RENDER_CACHE`).
+
+        The `wrappers`, including url rewriting, are applied to a cached fragment on every request.
+        """
+        cache_key = render_cache_key(block, view_name)
+        if cache_key is not None:
+            cached = cache.get(cache_key)
+            if cached is not None:
+                monitoring_utils.increment('xblock_render_cache.hits')
+                frag = super(LmsModuleSystem, self).wrap_xblock(block, view_name, Fragment.from_dict(cached), context)
+                return self.render_asides(block, view_name, frag, context)
+            monitoring_utils.increment('xblock_render_cache.misses')
+
+        return super(LmsModuleSystem, self).render(block, view_name, context)
+
+    def wrap_xblock(self, block, view, frag, context):
+        """
+        Apply the `wrappers` to `frag`, caching it beforehand if `view` supports the render cache.
+        """
+        cache_key = render_cache_key(block, view)
+        if cache_key is not None:
+            cache.set(cache_key, frag.to_dict(), RENDER_CACHE_TIMEOUT)
+        return super(LmsModuleSystem, self).wrap_xblock(block, view, frag, context)
+
     def handler_url(self, *args, **kwargs):
         """
         Implement the XBlock runtime handler_url interface.
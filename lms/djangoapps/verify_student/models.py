@@ -1006,6 +1006,14 @@ class SoftwareSecurePhotoVerification(PhotoVerification):
         return False
 
 
+@receiver(models.signals.post_save, sender=SoftwareSecurePhotoVerification)
+@receiver(models.signals.post_delete, sender=SoftwareSecurePhotoVerification)
+def invalidate_dashboard_course_data_cache(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """Invalidate the cached dashboard data of the user of a photo verification. """
+    from student.helpers import DashboardCourseDataCache  # Imported here, as student.helpers imports this module.
+    DashboardCourseDataCache.invalidate(instance.user_id)
+
+
 class VerificationDeadline(TimeStampedModel):
     """
     Represent a verification deadline for a particular course.
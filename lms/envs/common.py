@@ -58,6 +58,15 @@ DISCUSSION_SETTINGS = {
     'MAX_COMMENT_DEPTH': 2,
 }
 
+# Per-process pool of keep-alive connections to the comments service.
+# Connection errors are retried for all requests, read errors only for GET and HEAD.
+COMMENTS_SERVICE_CONNECTION_POOL = {
+    'ENABLED': True,
+    'POOL_MAXSIZE': 10,
+    'MAX_RETRIES': 2,
+    'BACKOFF_FACTOR': 0.1,
+}
+
 LMS_ROOT_URL = "http://localhost:8000"
 
 # Features
@@ -517,6 +526,10 @@ OAUTH2_PROVIDER_APPLICATION_MODEL = 'oauth2_provider.Application'
 # TODO: Move the Mako templating into a different engine in TEMPLATES below.
 import tempfile
 MAKO_MODULE_DIR = os.path.join(tempfile.gettempdir(), 'mako_lms')
+# (namespace, template name) pairs to load while the process starts. Run the
+# precompile_mako_templates management command during deployment so that these
+# are imported from MAKO_MODULE_DIR rather than compiled.
+MAKO_PRELOAD_TEMPLATES = []
 MAKO_TEMPLATES = {}
 MAKO_TEMPLATES['main'] = [
     PROJECT_ROOT / 'templates',
@@ -1922,6 +1935,14 @@ BULK_EMAIL_LOG_SENT_EMAILS = False
 # parallel, and what the SES rate is.
 BULK_EMAIL_RETRY_DELAY_BETWEEN_SENDS = 0.02
 
+# Number of SMTP connections over which each bulk email subtask sends its
+# messages in parallel.  With a single connection, messages are sent serially.
+BULK_EMAIL_SEND_CONNECTIONS = 1
+
+# Maximum number of messages sent per second over each of the SMTP connections
+# of a bulk email subtask, or None for no limit.
+BULK_EMAIL_MAX_SENDS_PER_SECOND_PER_CONNECTION = None
+
 ############################# Persistent Grades ####################################
 
 # Queue to use for updating persistent grades
@@ -2880,6 +2901,14 @@ COURSE_ABOUT_VISIBILITY_PERMISSION = 'see_exists'
 # Enrollment API Cache Timeout
 ENROLLMENT_COURSE_DETAILS_CACHE_TIMEOUT = 60
 
+# Seconds to cache the CourseAccessRoles of a user across requests, see student.roles.RoleCache.
+# Changes to the roles invalidate the cache.  0 only caches them for the rest of a request.
+COURSE_ACCESS_ROLE_CACHE_TIMEOUT = 0
+
+# Seconds to cache the course card data of a user's dashboard, see student.helpers.DashboardCourseDataCache.
+# Changes to the enrollments, certificates and verifications of the user invalidate the cache.  0 disables it.
+DASHBOARD_COURSE_DATA_CACHE_TIMEOUT = 0
+
 # Automatically clean up edx-django-oauth2-provider tokens on use
 OAUTH_DELETE_EXPIRED = True
 OAUTH_ID_TOKEN_EXPIRATION = 60 * 60
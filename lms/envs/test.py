@@ -305,6 +305,10 @@ OIDC_COURSE_HANDLER_CACHE_TIMEOUT = 0
 FEATURES['ENABLE_MOBILE_REST_API'] = True
 FEATURES['ENABLE_VIDEO_ABSTRACTION_LAYER_API'] = True
 
+########################### Comments service #################################
+# Tests mock requests.request for the comments service.
+COMMENTS_SERVICE_CONNECTION_POOL['ENABLED'] = False
+
 ########################### Grades #################################
 FEATURES['PERSISTENT_GRADES_ENABLED_FOR_ALL_TESTS'] = True
 
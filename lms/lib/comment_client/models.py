@@ -1,6 +1,7 @@
+import copy
 import logging
 
-from .utils import CommentClientRequestError, extract, perform_request
+from .utils import CommentClientRequestError, extract, get_identity_map, perform_request
 
 log = logging.getLogger(__name__)
 
@@ -60,11 +61,35 @@ class Model(object):
         return self.attributes
 
     def retrieve(self, *args, **kwargs):
+        """
+        Retrieves the model from the comments service, unless a model with the
+        same attributes was already retrieved with the same arguments during
+        the current request.
+        """
         if not self.retrieved:
-            self._retrieve(*args, **kwargs)
+            identity_map = get_identity_map()
+            key = self.identity_key(*args, **kwargs)
+            if identity_map is not None and key in identity_map:
+                self.attributes.update(copy.deepcopy(identity_map[key]))
+            else:
+                self._retrieve(*args, **kwargs)
+                if identity_map is not None:
+                    identity_map[key] = copy.deepcopy(self.attributes)
             self.retrieved = True
         return self
 
+    def identity_key(self, *args, **kwargs):
+        """
+        Returns the key of the model in the identity map, when it is retrieved
+        with the given arguments.
+        """
+        return (
+            self.__class__,
+            repr(sorted(self.attributes.items())),
+            repr(args),
+            repr(sorted(kwargs.items())),
+        )
+
     def _retrieve(self, *args, **kwargs):
         url = self.url(action='get', params=self.attributes)
         response = perform_request(
@@ -1,3 +1,4 @@
+import copy
 import logging
 
 import settings
@@ -39,10 +40,33 @@ class Thread(models.Model):
     # initializable_fields are sent in POST requests
     initializable_fields = updatable_fields + ['thread_type', 'context']
 
+    # response_fields hold the responses of threads retrieved with them
+    response_fields = ['children', 'endorsed_responses', 'non_endorsed_responses']
+
     base_url = "{prefix}/threads".format(prefix=settings.PREFIX)
     default_retrieve_params = {'recursive': False}
     type = 'thread'
 
+    @classmethod
+    def remember(cls, thread_data):
+        """
+        Returns a retrieved thread for thread_data, a thread from another
+        response, and adds it to the identity map without its responses.
+        """
+        thread_data = dict(
+            (key, value) for key, value in thread_data.items()
+            if key in cls.accessible_fields and key not in cls.response_fields
+        )
+        thread = cls(id=thread_data['id'])
+        key = thread.identity_key()
+        thread._update_from_response(thread_data)
+        thread.retrieved = True
+
+        identity_map = utils.get_identity_map()
+        if identity_map is not None:
+            identity_map[key] = copy.deepcopy(thread.attributes)
+        return thread
+
     @classmethod
     def search(cls, query_params):
 
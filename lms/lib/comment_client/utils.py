@@ -1,5 +1,6 @@
 """" Common utilities for comment client wrapper """
 import logging
+import os
 from contextlib import contextmanager
 from time import time
 from uuid import uuid4
@@ -7,11 +8,23 @@ from uuid import uuid4
 import requests
 from django.conf import settings
 from django.utils.translation import get_language
+from requests.adapters import HTTPAdapter
+from requests.packages.urllib3.util.retry import Retry
 
 import dogstats_wrapper as dog_stats_api
+import request_cache
 
 log = logging.getLogger(__name__)
 
+# Requests that can be retried after a read error.
+IDEMPOTENT_METHODS = frozenset(['get', 'head'])
+
+# Pooled sessions, keyed on (process id, idempotent).
+_SESSIONS = {}
+
+# Request cache of the models retrieved during the request, see get_identity_map.
+IDENTITY_MAP_REQUEST_CACHE = 'comment_client.identity_map'
+
 
 def strip_none(dic):
     return dict([(k, v) for k, v in dic.iteritems() if v is not None])
@@ -53,15 +66,90 @@ def request_timer(request_id, method, url, tags=None):
     )
 
 
+def get_forums_config():
+    """
+    Returns the current ForumsConfig, memoized for the request if there is one.
+    """
+    # To avoid dependency conflict
+    from django_comment_common.models import FORUMS_CONFIG_REQUEST_CACHE, ForumsConfig
+    if request_cache.get_request() is None:
+        return ForumsConfig.current()
+    cache = request_cache.get_cache(FORUMS_CONFIG_REQUEST_CACHE)
+    if 'current' not in cache:
+        cache['current'] = ForumsConfig.current()
+    return cache['current']
+
+
+def get_identity_map():
+    """
+    Returns the map of the models retrieved during the current request, keyed
+    on Model.identity_key, or None outside of a request.
+
+    The map is cleared by any request that modifies the comments service.
+    """
+    if request_cache.get_request() is None:
+        return None
+    return request_cache.get_cache(IDENTITY_MAP_REQUEST_CACHE)
+
+
+def get_session(idempotent):
+    """
+    Returns this process's pooled, keep-alive session for requests to the
+    comments service, configured by settings.COMMENTS_SERVICE_CONNECTION_POOL.
+
+    Connection errors are retried for all requests, read errors only for
+    idempotent ones.
+    """
+    key = (os.getpid(), idempotent)
+    session = _SESSIONS.get(key)
+    if session is None:
+        pool_settings = getattr(settings, 'COMMENTS_SERVICE_CONNECTION_POOL', {})
+        max_retries = pool_settings.get('MAX_RETRIES', 0)
+        adapter = HTTPAdapter(
+            pool_connections=pool_settings.get('POOL_CONNECTIONS', 1),
+            pool_maxsize=pool_settings.get('POOL_MAXSIZE', 10),
+            max_retries=Retry(
+                total=max_retries,
+                connect=max_retries,
+                read=max_retries if idempotent else False,
+                backoff_factor=pool_settings.get('BACKOFF_FACTOR', 0),
+            ),
+        )
+        session = requests.Session()
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        _SESSIONS[key] = session
+    return session
+
+
+def _pooled_request(method, url, metric_tags, **kwargs):
+    """
+    Performs the request with the pooled session, and reports whether it
+    needed a new connection and how many connections are left idle.
+    """
+    session = get_session(method.lower() in IDEMPOTENT_METHODS)
+    pool = session.get_adapter(url).poolmanager.connection_from_url(url)
+    connections_before = pool.num_connections
+
+    response = session.request(method, url, **kwargs)
+
+    if pool.num_connections > connections_before:
+        dog_stats_api.increment('comment_client.pool.connection_created', tags=metric_tags)
+    if pool.pool is not None:
+        dog_stats_api.histogram('comment_client.pool.idle_connections', value=pool.pool.qsize(), tags=metric_tags)
+    return response
+
+
 def perform_request(method, url, data_or_params=None, raw=False,
                     metric_action=None, metric_tags=None, paged_results=False):
-    # To avoid dependency conflict
-    from django_comment_common.models import ForumsConfig
-    config = ForumsConfig.current()
+    config = get_forums_config()
 
     if not config.enabled:
         raise CommentClientMaintenanceError('service disabled')
 
+    if method.lower() not in IDEMPOTENT_METHODS:
+        request_cache.clear_cache(IDENTITY_MAP_REQUEST_CACHE)
+
     if metric_tags is None:
         metric_tags = []
 
@@ -85,14 +173,25 @@ def perform_request(method, url, data_or_params=None, raw=False,
         data = None
         params = merge_dict(data_or_params, request_id_dict)
     with request_timer(request_id, method, url, metric_tags):
-        response = requests.request(
-            method,
-            url,
-            data=data,
-            params=params,
-            headers=headers,
-            timeout=config.connection_timeout
-        )
+        if getattr(settings, 'COMMENTS_SERVICE_CONNECTION_POOL', {}).get('ENABLED', False):
+            response = _pooled_request(
+                method,
+                url,
+                metric_tags,
+                data=data,
+                params=params,
+                headers=headers,
+                timeout=config.connection_timeout
+            )
+        else:
+            response = requests.request(
+                method,
+                url,
+                data=data,
+                params=params,
+                headers=headers,
+                timeout=config.connection_timeout
+            )
 
     metric_tags.append(u'status_code:{}'.format(response.status_code))
     if response.status_code > 200:
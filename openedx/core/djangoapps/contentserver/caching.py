@@ -1,6 +1,11 @@
 """
 Helper functions for caching course assets.
 """
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
 from django.core.cache import caches
 from django.core.cache.backends.base import InvalidCacheBackendError
 from opaque_keys import InvalidKeyError
@@ -15,18 +20,137 @@ except InvalidCacheBackendError:
     pass
 
 
+class HotContentCache(object):
+    """
+    A per-process LRU of in-memory course assets, bounded by their total size.
+
+    Assets can be replaced or locked from another process, which can only invalidate
+    the shared cache, so `get_hot_content` revalidates entries against the metadata
+    kept in the shared cache, and entries expire after `ttl` seconds.
+    """
+    def __init__(self, max_bytes, ttl):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.size = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, location):
+        """
+        Returns the content cached for `location`, or None.
+        """
+        key = unicode(location)
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                return None
+            content, expires_at = entry
+            if expires_at <= time.time():
+                self.size -= len(content.data)
+                return None
+            self._entries[key] = entry
+            return content
+
+    def set(self, content):
+        """
+        Caches the in-memory `content`, evicting the least recently used assets to make room.
+        """
+        length = len(content.data)
+        if length > self.max_bytes:
+            return
+        key = unicode(content.location)
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.size -= len(previous[0].data)
+            while self._entries and self.size + length > self.max_bytes:
+                __, (evicted, __) = self._entries.popitem(last=False)
+                self.size -= len(evicted.data)
+            self._entries[key] = (content, time.time() + self.ttl)
+            self.size += length
+
+    def delete(self, location):
+        """
+        Removes any content cached for `location`.
+        """
+        with self._lock:
+            entry = self._entries.pop(unicode(location), None)
+            if entry is not None:
+                self.size -= len(entry[0].data)
+
+    def clear(self):
+        """
+        Removes all cached content.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+
+HOT_CONTENT_CACHE = HotContentCache(
+    max_bytes=getattr(settings, 'CONTENTSERVER_HOT_CACHE_BYTES', 32 * 1024 * 1024),
+    ttl=getattr(settings, 'CONTENTSERVER_HOT_CACHE_TTL', 60),
+)
+
+
+def _cache_key(location):
+    """Force the location to a Unicode string."""
+    return unicode(location).encode("utf-8")
+
+
+def _metadata_cache_key(location):
+    """
+    Returns the shared cache key of the metadata of the content at `location`.
+    """
+    return _cache_key(location) + '.metadata'
+
+
+def _content_metadata(content):
+    """
+    Returns the metadata that decides how `content` is served: its digest, which
+    versioned urls are redirected to, and whether it is locked.
+    """
+    return (getattr(content, 'content_digest', None), getattr(content, 'locked', False))
+
+
+def get_hot_content(location):
+    """
+    Retrieves the given piece of content by its location if it is cached in this process,
+    and the shared cache still has the same metadata for it.
+    """
+    content = HOT_CONTENT_CACHE.get(location)
+    if content is None:
+        return None
+    metadata = CONTENT_CACHE.get(_metadata_cache_key(location), version=STATIC_CONTENT_VERSION)
+    if metadata != _content_metadata(content):
+        # The content was replaced, locked or evicted from the shared cache since.
+        HOT_CONTENT_CACHE.delete(location)
+        return None
+    return content
+
+
+def set_hot_content(content):
+    """
+    Stores the given in-memory piece of content in this process's cache.
+    """
+    HOT_CONTENT_CACHE.set(content)
+
+
 def set_cached_content(content):
     """
     Stores the given piece of content in the cache, using its location as the key.
     """
-    CONTENT_CACHE.set(unicode(content.location).encode("utf-8"), content, version=STATIC_CONTENT_VERSION)
+    CONTENT_CACHE.set_many({
+        _cache_key(content.location): content,
+        _metadata_cache_key(content.location): _content_metadata(content),
+    }, version=STATIC_CONTENT_VERSION)
 
 
 def get_cached_content(location):
     """
     Retrieves the given piece of content by its location if cached.
     """
-    return CONTENT_CACHE.get(unicode(location).encode("utf-8"), version=STATIC_CONTENT_VERSION)
+    return CONTENT_CACHE.get(_cache_key(location), version=STATIC_CONTENT_VERSION)
 
 
 def del_cached_content(location):
@@ -36,15 +160,16 @@ def del_cached_content(location):
     It's possible that the content could have been cached without knowing the course_key,
     and so without having the run.
     """
-    def location_str(loc):
-        """Force the location to a Unicode string."""
-        return unicode(loc).encode("utf-8")
-
-    locations = [location_str(location)]
+    locations = [location]
     try:
-        locations.append(location_str(location.replace(run=None)))
+        locations.append(location.replace(run=None))
     except InvalidKeyError:
         # although deprecated keys allowed run=None, new keys don't if there is no version.
         pass
 
-    CONTENT_CACHE.delete_many(locations, version=STATIC_CONTENT_VERSION)
+    for loc in locations:
+        HOT_CONTENT_CACHE.delete(loc)
+    CONTENT_CACHE.delete_many(
+        [_cache_key(loc) for loc in locations] + [_metadata_cache_key(loc) for loc in locations],
+        version=STATIC_CONTENT_VERSION
+    )
@@ -4,6 +4,7 @@ Middleware to serve assets.
 
 import logging
 import datetime
+from uuid import uuid4
 log = logging.getLogger(__name__)
 try:
     import newrelic.agent
@@ -11,16 +12,17 @@ except ImportError:
     newrelic = None  # pylint: disable=invalid-name
 from django.http import (
     HttpResponse, HttpResponseNotModified, HttpResponseForbidden,
-    HttpResponseBadRequest, HttpResponseNotFound, HttpResponsePermanentRedirect)
+    HttpResponseBadRequest, HttpResponseNotFound, HttpResponsePermanentRedirect,
+    StreamingHttpResponse)
 from student.models import CourseEnrollment
 
 from xmodule.assetstore.assetmgr import AssetManager
-from xmodule.contentstore.content import StaticContent, XASSET_LOCATION_TAG
+from xmodule.contentstore.content import StaticContent, StaticContentStream, XASSET_LOCATION_TAG
 from xmodule.modulestore import InvalidLocationError
 from opaque_keys import InvalidKeyError
 from opaque_keys.edx.locator import AssetLocator
 from openedx.core.djangoapps.header_control import force_header_for_response
-from .caching import get_cached_content, set_cached_content
+from .caching import get_cached_content, get_hot_content, set_cached_content, set_hot_content
 from xmodule.modulestore.exceptions import ItemNotFoundError
 from xmodule.exceptions import NotFoundError
 
@@ -31,6 +33,15 @@ from .models import CourseAssetCacheTtlConfig, CdnUserAgentsConfig
 
 HTTP_DATE_FORMAT = "%a, %d %b %Y %H:%M:%S GMT"
 
+# Assets smaller than this are held in memory and cached; larger ones are streamed.
+MAX_CACHED_CONTENT_LENGTH = 1048576
+
+# Read streamed assets a whole GridFS chunk (the pymongo default of 255KB) at a time.
+STREAM_CHUNK_SIZE = 255 * 1024
+
+# Requests for more ranges than this are served the full content.
+MAX_BYTE_RANGES = 16
+
 
 class StaticContentServer(object):
     """
@@ -108,8 +119,18 @@ class StaticContentServer(object):
 
             # Figure out if the client sent us a conditional request, and let them know
             # if this asset has changed since then.
+            etag = None
+            if actual_digest is not None:
+                etag = '"{}"'.format(actual_digest)
+                if_none_match = request.META.get('HTTP_IF_NONE_MATCH')
+                if if_none_match is not None:
+                    if if_none_match.strip() == '*' or etag in [tag.strip() for tag in if_none_match.split(',')]:
+                        response = HttpResponseNotModified()
+                        response['ETag'] = etag
+                        return response
+
             last_modified_at_str = content.last_modified_at.strftime(HTTP_DATE_FORMAT)
-            if 'HTTP_IF_MODIFIED_SINCE' in request.META:
+            if 'HTTP_IF_MODIFIED_SINCE' in request.META and 'HTTP_IF_NONE_MATCH' not in request.META:
                 if_modified_since = request.META['HTTP_IF_MODIFIED_SINCE']
                 if if_modified_since == last_modified_at_str:
                     return HttpResponseNotModified()
@@ -121,11 +142,9 @@ class StaticContentServer(object):
             # Response -> Content-Range attribute structure: "Content-Range: bytes first-last/totalLength"
             # http://www.w3.org/Protocols/rfc2616/rfc2616-sec14.html#sec14.35
             response = None
+            bytes_served = content.length
+            content_type = content.content_type
             if request.META.get('HTTP_RANGE'):
-                # If we have a StaticContent, get a StaticContentStream.  Can't manipulate the bytes otherwise.
-                if isinstance(content, StaticContent):
-                    content = AssetManager.find(loc, as_stream=True)
-
                 header_value = request.META['HTTP_RANGE']
                 try:
                     unit, ranges = parse_range_header(header_value, content.length)
@@ -135,48 +154,68 @@ class StaticContentServer(object):
                         u"%s in Range header: %s for content: %s", exception.message, header_value, unicode(loc)
                     )
                 else:
+                    # Unsatisfiable ranges are ignored, as long as at least one range can be served.
+                    ranges = [(first, last) for first, last in ranges if 0 <= first <= last < content.length]
                     if unit != 'bytes':
                         # Only accept ranges in bytes
                         log.warning(u"Unknown unit in Range header: %s for content: %s", header_value, unicode(loc))
-                    elif len(ranges) > 1:
-                        # According to Http/1.1 spec content for multiple ranges should be sent as a multipart message.
-                        # http://www.w3.org/Protocols/rfc2616/rfc2616-sec14.html#sec14.16
-                        # But we send back the full content.
+                    elif not ranges:
                         log.warning(
-                            u"More than 1 ranges in Range header: %s for content: %s", header_value, unicode(loc)
+                            u"Cannot satisfy ranges in Range header: %s for content: %s", header_value, unicode(loc)
+                        )
+                        return HttpResponse(status=416)  # Requested Range Not Satisfiable
+                    elif (len(ranges) > MAX_BYTE_RANGES or
+                          sum(last - first + 1 for first, last in ranges) > content.length):
+                        # Many or overlapping ranges could cost far more to serve than the
+                        # content itself (see CVE-2011-3192), so the full content is served.
+                        log.warning(
+                            u"Too many ranges in Range header: %s for content: %s", header_value, unicode(loc)
                         )
                     else:
-                        first, last = ranges[0]
-
-                        if 0 <= first <= last < content.length:
-                            # If the byte range is satisfiable
-                            response = HttpResponse(content.stream_data_in_range(first, last))
+                        # Overlapping and adjacent ranges are served as one.
+                        ranges = coalesce_byte_ranges(ranges)
+                        if len(ranges) == 1:
+                            first, last = ranges[0]
+                            response = self.make_response(content, content.stream_data_in_range(
+                                first, last, chunk_size=STREAM_CHUNK_SIZE
+                            ))
                             response['Content-Range'] = 'bytes {first}-{last}/{length}'.format(
                                 first=first, last=last, length=content.length
                             )
-                            response['Content-Length'] = str(last - first + 1)
+                            bytes_served = last - first + 1
+                            response['Content-Length'] = str(bytes_served)
                             response.status_code = 206  # Partial Content
 
                             if newrelic:
                                 newrelic.agent.add_custom_parameter('contentserver.ranged', True)
                         else:
-                            log.warning(
-                                u"Cannot satisfy ranges in Range header: %s for content: %s", header_value, unicode(loc)
-                            )
-                            return HttpResponse(status=416)  # Requested Range Not Satisfiable
+                            # Content for multiple ranges is sent as a multipart message.
+                            # http://www.w3.org/Protocols/rfc2616/rfc2616-sec14.html#sec14.16
+                            boundary = uuid4().hex
+                            body, bytes_served = multipart_byteranges(content, ranges, boundary)
+                            response = self.make_response(content, body)
+                            response['Content-Length'] = str(bytes_served)
+                            response.status_code = 206  # Partial Content
+                            content_type = 'multipart/byteranges; boundary={}'.format(boundary)
+
+                            if newrelic:
+                                newrelic.agent.add_custom_parameter('contentserver.ranged', True)
 
-            # If Range header is absent or syntactically invalid return a full content response.
+            # If Range header is absent, syntactically invalid or has too many ranges return a full content response.
             if response is None:
-                response = HttpResponse(content.stream_data())
+                response = self.make_response(content, content.stream_data(chunk_size=STREAM_CHUNK_SIZE))
                 response['Content-Length'] = content.length
 
             if newrelic:
                 newrelic.agent.add_custom_parameter('contentserver.content_len', content.length)
                 newrelic.agent.add_custom_parameter('contentserver.content_type', content.content_type)
+                newrelic.agent.add_custom_parameter('contentserver.bytes_served', bytes_served)
 
             # "Accept-Ranges: bytes" tells the user that only "bytes" ranges are allowed
             response['Accept-Ranges'] = 'bytes'
-            response['Content-Type'] = content.content_type
+            response['Content-Type'] = content_type
+            if etag is not None:
+                response['ETag'] = etag
 
             # Set any caching headers, and do any response cleanup needed.  Based on how much
             # middleware we have in place, there's no easy way to use the built-in Django
@@ -186,6 +225,17 @@ class StaticContentServer(object):
 
             return response
 
+    def make_response(self, content, data):
+        """
+        Returns a response for `data`, an iterable over the bytes of `content`.
+
+        Assets held in memory are sent as a single body; those read from the
+        contentstore are streamed instead of being buffered.
+        """
+        if isinstance(content, StaticContentStream):
+            return StreamingHttpResponse(data)
+        return HttpResponse(data)
+
     def set_caching_headers(self, content, response):
         """
         Sets caching headers based on whether or not the asset is locked.
@@ -271,9 +321,14 @@ class StaticContentServer(object):
         or loading it directly from the contentstore.
         """
 
-        # See if we can load this item from cache.
-        content = get_cached_content(location)
+        # See if we can load this item from this process, or from the shared cache.
+        content = get_hot_content(location)
+        cache_status = 'hot'
         if content is None:
+            content = get_cached_content(location)
+            cache_status = 'hit'
+        if content is None:
+            cache_status = 'miss'
             # Not in cache, so just try and load it from the asset manager.
             try:
                 content = AssetManager.find(location, as_stream=True)
@@ -283,10 +338,16 @@ class StaticContentServer(object):
             # Now that we fetched it, let's go ahead and try to cache it. We cap this at 1MB
             # because it's the default for memcached and also we don't want to do too much
             # buffering in memory when we're serving an actual request.
-            if content.length is not None and content.length < 1048576:
+            if content.length is not None and content.length < MAX_CACHED_CONTENT_LENGTH:
                 content = content.copy_to_in_mem()
                 set_cached_content(content)
 
+        if cache_status != 'hot' and not isinstance(content, StaticContentStream):
+            set_hot_content(content)
+
+        if newrelic:
+            newrelic.agent.add_custom_parameter('contentserver.cache', cache_status)
+
         return content
 
 
@@ -331,3 +392,49 @@ def parse_range_header(header_value, content_length):
         raise ValueError('Invalid syntax')
 
     return unit, ranges
+
+
+def coalesce_byte_ranges(ranges):
+    """
+    Returns the (first, last) `ranges` sorted, with the ranges that overlap or are
+    adjacent merged into one.
+    """
+    coalesced = []
+    for first, last in sorted(ranges):
+        if coalesced and first <= coalesced[-1][1] + 1:
+            coalesced[-1] = (coalesced[-1][0], max(last, coalesced[-1][1]))
+        else:
+            coalesced.append((first, last))
+    return coalesced
+
+
+def multipart_byteranges(content, ranges, boundary):
+    """
+    Returns an iterable over a multipart/byteranges body for the (first, last)
+    `ranges` of `content`, and the length of that body.
+
+    See spec for details: http://www.w3.org/Protocols/rfc2616/rfc2616-sec19.html#sec19.2
+    """
+    headers = [
+        '--{boundary}\r\nContent-Type: {content_type}\r\nContent-Range: bytes {first}-{last}/{length}\r\n\r\n'.format(
+            boundary=boundary, content_type=content.content_type, first=first, last=last, length=content.length
+        )
+        for first, last in ranges
+    ]
+    closing = '\r\n--{boundary}--\r\n'.format(boundary=boundary)
+
+    def parts():
+        """
+        Yields the body, streaming each range from the content.
+        """
+        for index, (header, (first, last)) in enumerate(zip(headers, ranges)):
+            yield header if index == 0 else '\r\n' + header
+            for chunk in content.stream_data_in_range(first, last, chunk_size=STREAM_CHUNK_SIZE):
+                yield chunk
+        yield closing
+
+    length = (
+        sum(len(header) for header in headers) + 2 * (len(ranges) - 1) +
+        sum(last - first + 1 for first, last in ranges) + len(closing)
+    )
+    return parts(), length
@@ -10,6 +10,7 @@ import unittest
 from uuid import uuid4
 
 from django.conf import settings
+from django.core.cache.backends.locmem import LocMemCache
 from django.test import RequestFactory
 from django.test.client import Client
 from django.test.utils import override_settings
@@ -22,12 +23,19 @@ from xmodule.modulestore.tests.django_utils import SharedModuleStoreTestCase
 from xmodule.modulestore.xml_importer import import_course_from_xml
 from xmodule.assetstore.assetmgr import AssetManager
 from opaque_keys import InvalidKeyError
+from opaque_keys.edx.locator import CourseLocator
 from xmodule.modulestore.exceptions import ItemNotFoundError
 
 from student.models import CourseEnrollment
 from student.tests.factories import UserFactory, AdminFactory
 
-from ..middleware import parse_range_header, HTTP_DATE_FORMAT, StaticContentServer
+from ..caching import (
+    HOT_CONTENT_CACHE, HotContentCache, del_cached_content, get_hot_content, set_cached_content, set_hot_content
+)
+from ..middleware import (
+    coalesce_byte_ranges, multipart_byteranges, parse_range_header, HTTP_DATE_FORMAT, MAX_BYTE_RANGES,
+    StaticContentServer
+)
 
 log = logging.getLogger(__name__)
 
@@ -106,6 +114,7 @@ class ContentStoreToyCourseTest(SharedModuleStoreTestCase):
         Create user and login.
         """
         super(ContentStoreToyCourseTest, self).setUp()
+        HOT_CONTENT_CACHE.clear()
         self.staff_usr = AdminFactory.create()
         self.non_staff_usr = UserFactory.create()
 
@@ -242,13 +251,61 @@ class ContentStoreToyCourseTest(SharedModuleStoreTestCase):
 
     def test_range_request_multiple_ranges(self):
         """
-        Test that multiple ranges in request outputs the full content.
+        Test that multiple ranges in request outputs a multipart/byteranges message.
         """
         first_byte = self.length_unlocked / 4
         last_byte = self.length_unlocked / 2
         resp = self.client.get(self.url_unlocked, HTTP_RANGE='bytes={first}-{last}, -100'.format(
             first=first_byte, last=last_byte))
 
+        self.assertEqual(resp.status_code, 206)  # HTTP_206_PARTIAL_CONTENT
+        self.assertNotIn('Content-Range', resp)
+        self.assertTrue(resp['Content-Type'].startswith('multipart/byteranges; boundary='))
+        self.assertEqual(resp['Content-Length'], str(len(resp.content)))
+        self.assertIn(
+            'Content-Range: bytes {first}-{last}/{length}'.format(
+                first=first_byte, last=last_byte, length=self.length_unlocked
+            ),
+            resp.content
+        )
+        self.assertIn(
+            'Content-Range: bytes {first}-{last}/{length}'.format(
+                first=self.length_unlocked - 100, last=self.length_unlocked - 1, length=self.length_unlocked
+            ),
+            resp.content
+        )
+
+    def test_range_request_multiple_ranges_one_satisfiable(self):
+        """
+        Test that unsatisfiable ranges are ignored when another range can be served.
+        """
+        resp = self.client.get(self.url_unlocked, HTTP_RANGE='bytes=0-9, {first}-'.format(
+            first=self.length_unlocked))
+
+        self.assertEqual(resp.status_code, 206)  # HTTP_206_PARTIAL_CONTENT
+        self.assertEqual(resp['Content-Range'], 'bytes 0-9/{length}'.format(length=self.length_unlocked))
+        self.assertEqual(resp['Content-Length'], '10')
+
+    def test_range_request_overlapping_ranges(self):
+        """
+        Test that overlapping and adjacent ranges are served as one range.
+        """
+        resp = self.client.get(self.url_unlocked, HTTP_RANGE='bytes=10-19, 0-9, 5-14')
+
+        self.assertEqual(resp.status_code, 206)  # HTTP_206_PARTIAL_CONTENT
+        self.assertEqual(resp['Content-Range'], 'bytes 0-19/{length}'.format(length=self.length_unlocked))
+        self.assertEqual(resp['Content-Length'], '20')
+
+    @ddt.data(
+        ', '.join(['0-'] * 2),
+        ', '.join('{0}-{0}'.format(index * 2) for index in range(MAX_BYTE_RANGES + 1)),
+    )
+    def test_range_request_too_many_ranges(self, byte_ranges):
+        """
+        Test that requests for more ranges, or more bytes, than the content
+        result in a 200 OK full content response.
+        """
+        resp = self.client.get(self.url_unlocked, HTTP_RANGE='bytes=' + byte_ranges)
         self.assertEqual(resp.status_code, 200)
         self.assertNotIn('Content-Range', resp)
         self.assertEqual(resp['Content-Length'], str(self.length_unlocked))
@@ -285,6 +342,22 @@ class ContentStoreToyCourseTest(SharedModuleStoreTestCase):
             first=(self.length_unlocked), last=(self.length_unlocked)))
         self.assertEqual(resp.status_code, 416)
 
+    def test_etag_not_modified(self):
+        """
+        Test that the asset's content digest is sent as its ETag, and that a request
+        for a matching ETag outputs 304 Not Modified.
+        """
+        resp = self.client.get(self.url_unlocked)
+        self.assertEqual(resp.status_code, 200)
+        etag = resp['ETag']
+
+        resp = self.client.get(self.url_unlocked, HTTP_IF_NONE_MATCH='"{}", {}'.format(FAKE_MD5_HASH, etag))
+        self.assertEqual(resp.status_code, 304)
+        self.assertEqual(resp['ETag'], etag)
+
+        resp = self.client.get(self.url_unlocked, HTTP_IF_NONE_MATCH='"{}"'.format(FAKE_MD5_HASH))
+        self.assertEqual(resp.status_code, 200)
+
     def test_vary_header_sent(self):
         """
         Tests that we're properly setting the Vary header to ensure browser requests don't get
@@ -447,3 +520,135 @@ class ParseRangeHeaderTestCase(unittest.TestCase):
         self.assertRaisesRegexp(
             exception_class, exception_message_regex, parse_range_header, header_value, self.content_length
         )
+
+
+@ddt.ddt
+class CoalesceByteRangesTestCase(unittest.TestCase):
+    """
+    Tests for the coalesce_byte_ranges function.
+    """
+    @ddt.data(
+        ([(0, 9)], [(0, 9)]),
+        ([(20, 29), (0, 9)], [(0, 9), (20, 29)]),
+        ([(0, 9), (10, 19)], [(0, 19)]),
+        ([(0, 9), (5, 14), (0, 3)], [(0, 14)]),
+        ([(0, 99), (10, 19), (200, 299)], [(0, 99), (200, 299)]),
+    )
+    @ddt.unpack
+    def test_coalesce(self, ranges, expected_ranges):
+        self.assertEqual(coalesce_byte_ranges(ranges), expected_ranges)
+
+
+class HotContentCacheTestCase(unittest.TestCase):
+    """
+    Tests for the per-process course asset cache.
+    """
+    def make_content(self, name, data):
+        """
+        Returns in-memory content named `name` holding `data`.
+        """
+        location = StaticContent.compute_location(CourseLocator('edX', 'toy', '2012_Fall'), name)
+        return StaticContent(location, name, 'text/plain', data, length=len(data))
+
+    def test_get_and_delete(self):
+        cache = HotContentCache(max_bytes=100, ttl=60)
+        content = self.make_content('a.txt', 'a' * 10)
+        cache.set(content)
+        self.assertIs(cache.get(content.location), content)
+        self.assertEqual(cache.size, 10)
+
+        cache.delete(content.location)
+        self.assertIsNone(cache.get(content.location))
+        self.assertEqual(cache.size, 0)
+
+    def test_evicts_least_recently_used(self):
+        cache = HotContentCache(max_bytes=25, ttl=60)
+        first = self.make_content('a.txt', 'a' * 10)
+        second = self.make_content('b.txt', 'b' * 10)
+        third = self.make_content('c.txt', 'c' * 10)
+        cache.set(first)
+        cache.set(second)
+        cache.get(first.location)
+        cache.set(third)
+
+        self.assertIs(cache.get(first.location), first)
+        self.assertIsNone(cache.get(second.location))
+        self.assertIs(cache.get(third.location), third)
+        self.assertEqual(cache.size, 20)
+
+    def test_too_large(self):
+        cache = HotContentCache(max_bytes=5, ttl=60)
+        content = self.make_content('a.txt', 'a' * 10)
+        cache.set(content)
+        self.assertIsNone(cache.get(content.location))
+
+    def test_expiry(self):
+        cache = HotContentCache(max_bytes=100, ttl=0)
+        content = self.make_content('a.txt', 'a' * 10)
+        cache.set(content)
+        self.assertIsNone(cache.get(content.location))
+        self.assertEqual(cache.size, 0)
+
+
+@patch('openedx.core.djangoapps.contentserver.caching.CONTENT_CACHE', LocMemCache('hot-content-test', {}))
+class HotContentRevalidationTestCase(unittest.TestCase):
+    """
+    Tests that content cached in this process is revalidated against the shared cache.
+    """
+    def setUp(self):
+        super(HotContentRevalidationTestCase, self).setUp()
+        HOT_CONTENT_CACHE.clear()
+        self.addCleanup(HOT_CONTENT_CACHE.clear)
+        self.location = StaticContent.compute_location(CourseLocator('edX', 'toy', '2012_Fall'), 'a.txt')
+
+    def make_content(self, content_digest, locked=False):
+        """
+        Returns in-memory content for the location with the given digest and lock.
+        """
+        return StaticContent(
+            self.location, 'a.txt', 'text/plain', 'a' * 10, length=10, locked=locked, content_digest=content_digest
+        )
+
+    def test_hot_content(self):
+        content = self.make_content('digest')
+        set_cached_content(content)
+        set_hot_content(content)
+        self.assertIs(get_hot_content(self.location), content)
+
+    def test_invalidated_by_other_process(self):
+        content = self.make_content('digest')
+        set_cached_content(content)
+        set_hot_content(content)
+
+        # Another process replaces the content: it only clears and refills the shared cache.
+        with patch.object(HOT_CONTENT_CACHE, 'delete'):
+            del_cached_content(self.location)
+        self.assertIsNone(get_hot_content(self.location))
+
+        set_hot_content(content)
+        set_cached_content(self.make_content('new-digest'))
+        self.assertIsNone(get_hot_content(self.location))
+
+    def test_locked_by_other_process(self):
+        content = self.make_content('digest')
+        set_cached_content(content)
+        set_hot_content(content)
+        set_cached_content(self.make_content('digest', locked=True))
+        self.assertIsNone(get_hot_content(self.location))
+
+
+class MultipartByterangesTestCase(unittest.TestCase):
+    """
+    Tests for the multipart_byteranges function.
+    """
+    def test_body(self):
+        content = StaticContent('loc', 'name', 'text/plain', '0123456789', length=10)
+        body, length = multipart_byteranges(content, [(0, 1), (8, 9)], 'BOUNDARY')
+        body = ''.join(body)
+        self.assertEqual(
+            body,
+            '--BOUNDARY\r\nContent-Type: text/plain\r\nContent-Range: bytes 0-1/10\r\n\r\n01'
+            '\r\n--BOUNDARY\r\nContent-Type: text/plain\r\nContent-Range: bytes 8-9/10\r\n\r\n89'
+            '\r\n--BOUNDARY--\r\n'
+        )
+        self.assertEqual(length, len(body))
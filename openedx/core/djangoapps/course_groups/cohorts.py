@@ -181,7 +181,9 @@ def bulk_cache_cohorts(course_key, users):
         cohorts_by_user = {
             membership.user: membership
             for membership in
-            CohortMembership.objects.filter(user__in=users, course_id=course_key).select_related('user__id')
+            CohortMembership.objects.filter(
+                user__in=users, course_id=course_key
+            ).select_related('user__id', 'course_user_group')
         }
         for user, membership in cohorts_by_user.iteritems():
             cache[_cohort_cache_key(user.id, course_key)] = membership.course_user_group
@@ -272,6 +274,48 @@ def get_cohort(user, course_key, assign=True, use_cached=False):
         return get_cohort(user, course_key, assign, use_cached)
 
 
+def get_cohorts_for_users(course_key, users, assign=True):
+    """
+    Returns the cohorts of the given users for the specified course, as a dict
+    of {user_id: CourseUserGroup or None}.
+
+    This is get_cohort with use_cached=True for many users: the cohorts that
+    aren't cached for the request are fetched with a single query and cached.
+    Users who don't have a cohort in a cohorted course are assigned one by
+    get_cohort, unless assign is False.
+    """
+    cache = request_cache.get_cache(COHORT_CACHE_NAMESPACE)
+    cohorts = {}
+    uncached_users = []
+    for user in users:
+        cache_key = _cohort_cache_key(user.id, course_key)
+        if cache_key in cache:
+            cohorts[user.id] = cache[cache_key]
+        else:
+            uncached_users.append(user)
+
+    if not uncached_users:
+        return cohorts
+
+    if not is_course_cohorted(course_key):
+        for user in uncached_users:
+            cohorts[user.id] = cache[_cohort_cache_key(user.id, course_key)] = None
+        return cohorts
+
+    memberships = CohortMembership.objects.filter(
+        course_id=course_key,
+        user_id__in=[user.id for user in uncached_users],
+    ).select_related('course_user_group')
+    for membership in memberships:
+        cohorts[membership.user_id] = membership.course_user_group
+        cache[_cohort_cache_key(membership.user_id, course_key)] = membership.course_user_group
+
+    for user in uncached_users:
+        if user.id not in cohorts:
+            cohorts[user.id] = get_cohort(user, course_key, assign=assign) if assign else None
+    return cohorts
+
+
 def get_random_cohort(course_key):
     """
     Helper method to get a cohort for random assignment.
@@ -499,6 +543,9 @@ def add_user_to_cohort(cohort, username_or_email):
                 raise ex
 
 
+COHORT_GROUP_INFO_CACHE_NAMESPACE = u"cohorts.get_group_info_for_cohort"
+
+
 def get_group_info_for_cohort(cohort, use_cached=False):
     """
     Get the ids of the group and partition to which this cohort has been linked
@@ -511,7 +558,7 @@ def get_group_info_for_cohort(cohort, use_cached=False):
     use_cached=True to use the cached value instead of fetching from the
     database.
     """
-    cache = request_cache.get_cache(u"cohorts.get_group_info_for_cohort")
+    cache = request_cache.get_cache(COHORT_GROUP_INFO_CACHE_NAMESPACE)
     cache_key = unicode(cohort.id)
 
     if use_cached and cache_key in cache:
@@ -528,6 +575,36 @@ def get_group_info_for_cohort(cohort, use_cached=False):
     return cache.setdefault(cache_key, (None, None))
 
 
+def get_group_info_for_cohorts(cohort_ids):
+    """
+    Returns the group and partition ids to which the given cohorts have been
+    linked, as a dict of {cohort_id: (group_id, partition_id)}.
+
+    This is get_group_info_for_cohort with use_cached=True for many cohorts:
+    the links that aren't cached for the request are fetched with a single
+    query and cached.
+    """
+    cache = request_cache.get_cache(COHORT_GROUP_INFO_CACHE_NAMESPACE)
+    group_info = {}
+    uncached_cohort_ids = []
+    for cohort_id in set(cohort_ids):
+        cache_key = unicode(cohort_id)
+        if cache_key in cache:
+            group_info[cohort_id] = cache[cache_key]
+        else:
+            uncached_cohort_ids.append(cohort_id)
+
+    if uncached_cohort_ids:
+        partition_groups = CourseUserGroupPartitionGroup.objects.filter(
+            course_user_group_id__in=uncached_cohort_ids,
+        ).values_list('course_user_group_id', 'group_id', 'partition_id')
+        for cohort_id, group_id, partition_id in partition_groups:
+            group_info[cohort_id] = (group_id, partition_id)
+        for cohort_id in uncached_cohort_ids:
+            group_info[cohort_id] = cache[unicode(cohort_id)] = group_info.get(cohort_id, (None, None))
+    return group_info
+
+
 def set_assignment_type(user_group, assignment_type):
     """
     Set assignment type for cohort.
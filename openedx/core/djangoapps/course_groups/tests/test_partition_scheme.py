@@ -7,6 +7,7 @@ from mock import patch
 from nose.plugins.attrib import attr
 
 from courseware.tests.test_masquerade import StaffMasqueradeTestCase
+from request_cache.middleware import RequestCache
 from student.tests.factories import UserFactory
 from xmodule.partitions.partitions import Group, UserPartition, UserPartitionError
 from xmodule.modulestore.django import modulestore
@@ -255,6 +256,40 @@ class TestCohortPartitionScheme(ModuleStoreTestCase):
             self.assertTrue(mock_log.warn.called)
             self.assertRegexpMatches(mock_log.warn.call_args[0][0], 'partition mismatch')
 
+    def test_get_groups_for_users(self):
+        """
+        Test that get_groups_for_users returns the groups that
+        get_group_for_user returns, and caches the cohorts for the request.
+        """
+        first_cohort, second_cohort, unlinked_cohort = [CohortFactory(course_id=self.course_key) for _ in range(3)]
+        link_cohort_to_partition_group(first_cohort, self.user_partition.id, self.groups[0].id)
+        link_cohort_to_partition_group(second_cohort, self.user_partition.id, self.groups[1].id)
+        other_partition = UserPartition(1, 'Other Partition', 'dummy', self.groups, scheme=CohortPartitionScheme)
+
+        students = [UserFactory.create() for _ in range(4)]
+        add_user_to_cohort(first_cohort, students[0].username)
+        add_user_to_cohort(second_cohort, students[1].username)
+        add_user_to_cohort(unlinked_cohort, students[2].username)
+        RequestCache.clear_request_cache()
+
+        groups = CohortPartitionScheme.get_groups_for_users(
+            self.course_key, students, [self.user_partition, other_partition], assign=False
+        )
+        self.assertEqual(groups, {
+            self.user_partition.id: {students[0].id: self.groups[0], students[1].id: self.groups[1]},
+            other_partition.id: {},
+        })
+        for student in students:
+            self.assertEqual(
+                CohortPartitionScheme.get_group_for_user(self.course_key, student, self.user_partition),
+                groups[self.user_partition.id].get(student.id),
+            )
+
+        # The student without a cohort was assigned one by get_group_for_user,
+        # the cohorts of the others are cached.
+        with self.assertNumQueries(0):
+            CohortPartitionScheme.get_groups_for_users(self.course_key, students, [self.user_partition])
+
 
 @attr(shard=2)
 class TestExtension(django.test.TestCase):
@@ -15,6 +15,16 @@ from request_cache.middleware import RequestCache
 
 logger = getLogger(__name__)  # pylint: disable=invalid-name
 
+# Whether each themed template exists, keyed by absolute path and shared by all themes.
+THEME_TEMPLATE_EXISTS_CACHE_SIZE = 2000
+_THEME_TEMPLATE_EXISTS = {}
+
+# Base directory of each theme, keyed by theme dir name and the configured theme dirs.
+_THEME_BASE_DIRS = {}
+
+# Dir names of all the themes, keyed by the configured theme dirs.
+_THEME_DIR_NAMES = {}
+
 
 def get_template_path(relative_path, **kwargs):
     """
@@ -73,12 +83,31 @@ def get_template_path_with_theme(relative_path):
 
     template_path = theme.template_path / template_name
     absolute_path = theme.path / "templates" / template_name
-    if absolute_path.exists():
+    if theme_template_exists(absolute_path):
         return str(template_path)
     else:
         return relative_path
 
 
+def theme_template_exists(absolute_path):
+    """
+    Returns whether the themed template at `absolute_path` exists.
+
+    Results are memoized for the life of the process, since themes are deployed
+    with the code; the filesystem is checked every time when DEBUG is on so that
+    templates added to a theme during development are picked up.
+    """
+    if settings.DEBUG:
+        return absolute_path.exists()
+
+    exists = _THEME_TEMPLATE_EXISTS.get(absolute_path)
+    if exists is None:
+        if len(_THEME_TEMPLATE_EXISTS) >= THEME_TEMPLATE_EXISTS_CACHE_SIZE:
+            _THEME_TEMPLATE_EXISTS.clear()
+        exists = _THEME_TEMPLATE_EXISTS[absolute_path] = absolute_path.exists()
+    return exists
+
+
 def get_all_theme_template_dirs():
     """
     Returns template directories for all the themes.
@@ -188,7 +217,7 @@ def get_current_theme():
         return Theme(
             name=site_theme.theme_dir_name,
             theme_dir_name=site_theme.theme_dir_name,
-            themes_base_dir=get_theme_base_dir(site_theme.theme_dir_name),
+            themes_base_dir=get_cached_theme_base_dir(site_theme.theme_dir_name),
         )
     except ValueError as error:
         # Log exception message and return None, so that open source theme is used instead
@@ -232,6 +261,50 @@ def get_theme_base_dir(theme_dir_name, suppress_error=False):
         ))
 
 
+def get_cached_theme_base_dir(theme_dir_name):
+    """
+    Returns absolute path to the directory that contains the given theme, like
+    `get_theme_base_dir`, but only lists the theme directories once per process
+    for every theme.
+    """
+    key = (
+        theme_dir_name,
+        getattr(settings, "COMPREHENSIVE_THEME_DIR", None),
+        tuple(getattr(settings, "COMPREHENSIVE_THEME_DIRS", None) or []),
+    )
+    base_dir = _THEME_BASE_DIRS.get(key)
+    if base_dir is None:
+        base_dir = _THEME_BASE_DIRS[key] = get_theme_base_dir(theme_dir_name)
+    return base_dir
+
+
+def get_cached_theme_dir_names():
+    """
+    Returns the dir names of all the themes known to the system, like `get_themes`,
+    but only lists the theme directories once per process.
+    """
+    if not is_comprehensive_theming_enabled():
+        return frozenset()
+
+    key = (
+        getattr(settings, "COMPREHENSIVE_THEME_DIR", None),
+        tuple(getattr(settings, "COMPREHENSIVE_THEME_DIRS", None) or []),
+    )
+    dir_names = _THEME_DIR_NAMES.get(key)
+    if dir_names is None:
+        dir_names = _THEME_DIR_NAMES[key] = frozenset(theme.theme_dir_name for theme in get_themes())
+    return dir_names
+
+
+def clear_theme_caches():
+    """
+    Forget the memoized theme directories and templates, e.g. when a site changes its theme.
+    """
+    _THEME_BASE_DIRS.clear()
+    _THEME_DIR_NAMES.clear()
+    _THEME_TEMPLATE_EXISTS.clear()
+
+
 def get_project_root_name():
     """
     Return root name for the current project
@@ -3,6 +3,8 @@ Django models supporting the Comprehensive Theming subsystem
 """
 from django.contrib.sites.models import Site
 from django.db import models
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 
 
 class SiteTheme(models.Model):
@@ -49,3 +51,17 @@ class SiteTheme(models.Model):
             True if given site has an associated site theme in database, returns False otherwise.
         """
         return site.themes.exists()
+
+
+@receiver(post_save, sender=SiteTheme)
+@receiver(post_delete, sender=SiteTheme)
+def invalidate_theme_caches(sender, **kwargs):  # pylint: disable=unused-argument
+    """
+    Rebuild the theme directory and themed asset indexes after a site changes its theme,
+    so that newly collected themes are picked up without a restart.
+    """
+    from openedx.core.djangoapps.theming.helpers import clear_theme_caches as clear_helper_caches
+    from openedx.core.djangoapps.theming.storage import clear_themed_assets
+
+    clear_helper_caches()
+    clear_themed_assets()
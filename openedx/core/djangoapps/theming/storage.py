@@ -12,7 +12,10 @@ from django.utils._os import safe_join
 from django.utils.six.moves.urllib.parse import unquote, urlsplit  # pylint: disable=no-name-in-module, import-error
 from pipeline.storage import PipelineMixin
 
+from openedx.core.djangoapps import monitoring_utils
 from openedx.core.djangoapps.theming.helpers import (
+    get_cached_theme_dir_names,
+    get_current_request,
     get_current_theme,
     get_project_root_name,
     get_theme_base_dir,
@@ -20,6 +23,36 @@ from openedx.core.djangoapps.theming.helpers import (
     is_comprehensive_theming_enabled
 )
 
+# Names of the collected assets of each theme, keyed by (storage location, theme dir name).
+_THEMED_ASSETS = {}
+
+
+def themed_assets(location, theme):
+    """
+    Returns the names of all the assets collected for `theme` under `location`
+    (usually STATIC_ROOT), e.g. frozenset(['images/logo.png', ...]).
+
+    The directory is walked once per process so that resolving the url of an asset
+    while rendering a page is a set lookup rather than a filesystem check.
+    """
+    key = (location, theme)
+    assets = _THEMED_ASSETS.get(key)
+    if assets is None:
+        theme_root = os.path.join(location, theme)
+        assets = _THEMED_ASSETS[key] = frozenset(
+            os.path.relpath(os.path.join(root, filename), theme_root).replace(os.sep, '/')
+            for root, __, filenames in os.walk(theme_root)
+            for filename in filenames
+        )
+    return assets
+
+
+def clear_themed_assets():
+    """
+    Forget the collected assets of every theme, e.g. when a site changes its theme.
+    """
+    _THEMED_ASSETS.clear()
+
 
 class ThemeStorage(StaticFilesStorage):
     """
@@ -101,8 +134,14 @@ class ThemeStorage(StaticFilesStorage):
             path = safe_join(themed_path, name)
             return os.path.exists(path)
         # in live mode check static asset in the static files dir defined by "STATIC_ROOT" setting
-        else:
+        elif get_current_request() is None:
+            # collectstatic and other management commands see the files as they are written
             return self.exists(os.path.join(theme, name))
+        else:
+            themed = name.lstrip("/") in themed_assets(self.location, theme)
+            if not themed:
+                monitoring_utils.increment('theming.static_url.unthemed')
+            return themed
 
 
 class ThemeCachedFilesMixin(CachedFilesMixin):
@@ -153,15 +192,29 @@ class ThemeCachedFilesMixin(CachedFilesMixin):
         parsed_name = urlsplit(unquote(name))
         clean_name = parsed_name.path.strip()
         asset_name = name
-        if not self.exists(clean_name):
+        if not self.collected(clean_name, theme):
             # if themed asset does not exists then use default asset
             theme = name.split("/", 1)[0]
             # verify that themed asset was accessed
-            if theme in [theme.theme_dir_name for theme in get_themes()]:
+            if theme in get_cached_theme_dir_names():
                 asset_name = "/".join(name.split("/")[1:])
 
         return super(ThemeCachedFilesMixin, self).url(asset_name, force)
 
+    def collected(self, name, theme=None):
+        """
+        Returns True if the asset `name` has been collected into this storage.
+
+        While serving a request, assets of the current `theme` are looked up in the
+        index built by `themed_assets` instead of checking the filesystem.
+        """
+        if theme and get_current_request() is not None and name.startswith(theme.theme_dir_name + "/"):
+            collected = name[len(theme.theme_dir_name) + 1:] in themed_assets(self.location, theme.theme_dir_name)
+            if not collected:
+                monitoring_utils.increment('theming.static_url.unthemed')
+            return collected
+        return self.exists(name)
+
     def url_converter(self, name, template=None):
         """
         This is an override of url_converter from CachedFilesMixin.
@@ -43,6 +43,22 @@ class TestHelpers(TestCase):
         actual_themes = get_themes()
         self.assertItemsEqual(expected_themes, actual_themes)
 
+    def test_get_cached_theme_dir_names(self):
+        """
+        Tests that the theme directories are only listed once, until the theme caches are cleared.
+        """
+        self.addCleanup(theming_helpers.clear_theme_caches)
+        theming_helpers.clear_theme_caches()
+        expected_dir_names = set(theme.theme_dir_name for theme in get_themes())
+        with patch('openedx.core.djangoapps.theming.helpers.get_themes', wraps=get_themes) as mock_get_themes:
+            self.assertEqual(theming_helpers.get_cached_theme_dir_names(), expected_dir_names)
+            self.assertEqual(theming_helpers.get_cached_theme_dir_names(), expected_dir_names)
+            self.assertEqual(mock_get_themes.call_count, 1)
+
+            theming_helpers.clear_theme_caches()
+            theming_helpers.get_cached_theme_dir_names()
+            self.assertEqual(mock_get_themes.call_count, 2)
+
     def test_get_value_returns_override(self):
         """
         Tests to make sure the get_value() operation returns a combined dictionary consisting
@@ -229,6 +245,17 @@ class TestHelpersLMS(TestCase):
         template_path = get_template_path_with_theme('header.html')
         self.assertEqual(template_path, 'header.html')
 
+    @with_comprehensive_theme('red-theme')
+    def test_get_template_path_with_theme_is_memoized(self):
+        """
+        Tests the filesystem is only checked the first time a themed template is looked up.
+        """
+        get_template_path_with_theme('header.html')
+        with patch('openedx.core.djangoapps.theming.helpers.Path.exists') as mock_exists:
+            template_path = get_template_path_with_theme('header.html')
+        self.assertEqual(template_path, 'red-theme/lms/templates/header.html')
+        self.assertFalse(mock_exists.called)
+
     @with_comprehensive_theme('red-theme')
     def test_strip_site_theme_templates_path_theme_enabled(self):
         """
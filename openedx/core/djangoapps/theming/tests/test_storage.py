@@ -2,15 +2,20 @@
 Tests for comprehensive theme static files storage classes.
 """
 import ddt
+import os
 import re
+import shutil
+import tempfile
 
-from mock import patch
+from mock import Mock, patch
 
 from django.test import TestCase, override_settings
 from django.conf import settings
+from django.contrib.sites.models import Site
 
 from openedx.core.djangoapps.theming.helpers import get_theme_base_dirs, Theme, get_theme_base_dir
-from openedx.core.djangoapps.theming.storage import ThemeStorage
+from openedx.core.djangoapps.theming.models import SiteTheme
+from openedx.core.djangoapps.theming.storage import ThemeStorage, clear_themed_assets
 from openedx.core.djangolib.testing.utils import skip_unless_lms
 
 
@@ -80,3 +85,49 @@ class TestStorageLMS(TestCase):
             expected_path = self.themes_dir / self.enabled_theme / "lms/static/" / asset
 
             self.assertEqual(expected_path, returned_path)
+
+
+@skip_unless_lms
+@override_settings(DEBUG=False)
+@patch('openedx.core.djangoapps.theming.storage.get_current_request', Mock(return_value=Mock()))
+class TestThemedAssetIndex(TestCase):
+    """
+    Test that collected themed assets are resolved from an index while serving requests.
+    """
+
+    def setUp(self):
+        super(TestThemedAssetIndex, self).setUp()
+        self.static_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.static_root)
+        self.addCleanup(clear_themed_assets)
+        self.add_asset('red-theme/images/logo.png')
+        self.storage = ThemeStorage(location=self.static_root)
+
+    def add_asset(self, name):
+        """
+        Collect an (empty) asset called `name` into the static root.
+        """
+        path = os.path.join(self.static_root, name)
+        if not os.path.isdir(os.path.dirname(path)):
+            os.makedirs(os.path.dirname(path))
+        open(path, 'w').close()
+
+    def test_themed(self):
+        self.assertTrue(self.storage.themed('images/logo.png', 'red-theme'))
+        self.assertTrue(self.storage.themed('/images/logo.png', 'red-theme'))
+        self.assertFalse(self.storage.themed('images/favicon.ico', 'red-theme'))
+        self.assertFalse(self.storage.themed('images/logo.png', 'stanford-style'))
+
+    def test_index_built_once(self):
+        self.assertFalse(self.storage.themed('images/favicon.ico', 'red-theme'))
+        self.add_asset('red-theme/images/favicon.ico')
+        with patch.object(self.storage, 'exists') as mock_exists:
+            self.assertFalse(self.storage.themed('images/favicon.ico', 'red-theme'))
+        self.assertFalse(mock_exists.called)
+
+    def test_site_theme_change_clears_index(self):
+        self.assertFalse(self.storage.themed('images/favicon.ico', 'red-theme'))
+        self.add_asset('red-theme/images/favicon.ico')
+        site = Site.objects.create(domain='red-theme.org', name='red-theme.org')
+        SiteTheme.objects.create(site=site, theme_dir_name='red-theme')
+        self.assertTrue(self.storage.themed('images/favicon.ico', 'red-theme'))
@@ -44,6 +44,10 @@ class BulkCourseTags(object):
     def get_course_tag(cls, user_id, course_id, key):
         return get_cache(cls.CACHE_NAMESPACE)[cls._cache_key(course_id)][user_id][key]
 
+    @classmethod
+    def get_course_tags(cls, course_id):
+        return get_cache(cls.CACHE_NAMESPACE)[cls._cache_key(course_id)]
+
     @classmethod
     def is_prefetched(cls, course_id):
         return cls._cache_key(course_id) in get_cache(cls.CACHE_NAMESPACE)
@@ -82,6 +86,37 @@ def get_course_tag(user, course_id, key):
         return None
 
 
+def get_course_tags_for_users(users, course_id, keys):
+    """
+    Gets the values of the course tags of the given users for the specified
+    keys in the specified course_id, with a single query.
+
+    Args:
+        users: iterable of User objects
+        course_id: course identifier (CourseKey)
+        keys: the keys of the course tags
+
+    Returns:
+        dict of {user_id: {key: value}}, holding only the saved values
+    """
+    if BulkCourseTags.is_prefetched(course_id):
+        course_tags = BulkCourseTags.get_course_tags(course_id)
+        return {
+            user.id: {key: course_tags[user.id][key] for key in keys if key in course_tags.get(user.id, {})}
+            for user in users
+        }
+
+    course_tags = defaultdict(dict)
+    records = UserCourseTag.objects.filter(
+        user_id__in=[user.id for user in users],
+        course_id=course_id,
+        key__in=keys,
+    ).values_list('user_id', 'key', 'value')
+    for user_id, key, value in records:
+        course_tags[user_id][key] = value
+    return course_tags
+
+
 def set_course_tag(user, course_id, key, value):
     """
     Sets the value of the user's course tag for the specified key in the specified
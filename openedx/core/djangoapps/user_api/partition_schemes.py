@@ -106,6 +106,37 @@ class RandomUserPartitionScheme(object):
 
         return group
 
+    @classmethod
+    def get_groups_for_users(cls, course_key, users, user_partitions, assign=True):
+        """
+        Returns the groups from the specified user partitions to which the
+        users are assigned, as a dict of {partition_id: {user_id: group}},
+        with a single query for all the users and partitions.
+
+        Users who aren't assigned to a group of a partition are assigned one
+        by get_group_for_user if assign flag is True, else they are absent
+        from its dict.
+        """
+        partition_keys = {
+            user_partition.id: cls.key_for_partition(user_partition) for user_partition in user_partitions
+        }
+        course_tags = course_tag_api.get_course_tags_for_users(users, course_key, partition_keys.values())
+
+        groups = {}
+        for user_partition in user_partitions:
+            partition_groups = groups[user_partition.id] = {}
+            groups_by_id = {group.id: group for group in user_partition.groups}
+            partition_key = partition_keys[user_partition.id]
+            for user in users:
+                group_id = course_tags.get(user.id, {}).get(partition_key)
+                group = groups_by_id.get(int(group_id)) if group_id is not None else None
+                if group is None and (group_id is not None or assign):
+                    # Let get_group_for_user log the missing group, or assign one.
+                    group = cls.get_group_for_user(course_key, user, user_partition, assign=assign)
+                if group is not None:
+                    partition_groups[user.id] = group
+        return groups
+
     @classmethod
     def key_for_partition(cls, user_partition):
         """
@@ -28,6 +28,11 @@ class MemoryCourseTagAPI(object):
         """Gets the value of ``key``"""
         self._tags[course_id][key] = value
 
+    def get_course_tags_for_users(self, users, course_id, keys):
+        """Gets the values of ``keys``, which are shared by all the users"""
+        tags = {key: value for key, value in self._tags[course_id].iteritems() if key in keys}
+        return {user.id: tags for user in users}
+
     class BulkCourseTags(object):
         @classmethod
         def is_prefetched(self, course_id):
@@ -86,6 +91,18 @@ class TestRandomUserPartitionScheme(PartitionTestCase):
 
         self.assertIsNotNone(group)
 
+    def test_get_groups_for_users(self):
+        groups = RandomUserPartitionScheme.get_groups_for_users(
+            self.MOCK_COURSE_ID, [self.user], [self.user_partition], assign=False
+        )
+        self.assertEqual(groups, {self.user_partition.id: {}})
+
+        group = RandomUserPartitionScheme.get_group_for_user(self.MOCK_COURSE_ID, self.user, self.user_partition)
+        groups = RandomUserPartitionScheme.get_groups_for_users(
+            self.MOCK_COURSE_ID, [self.user], [self.user_partition], assign=False
+        )
+        self.assertEqual(groups, {self.user_partition.id: {self.user.id: group}})
+
     def test_empty_partition(self):
         empty_partition = UserPartition(
             self.TEST_ID,
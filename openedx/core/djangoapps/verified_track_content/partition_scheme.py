@@ -83,19 +83,62 @@ class EnrollmentTrackPartitionScheme(object):
 
         mode_slug, is_active = CourseEnrollment.enrollment_mode_for_user(user, course_key)
         if mode_slug and is_active:
-            course_mode = CourseMode.mode_for_course(
-                course_key,
-                mode_slug,
-                modes=CourseMode.modes_for_course(course_key, include_expired=True, only_selectable=False),
-            )
-            if course_mode and CourseMode.is_credit_mode(course_mode):
-                course_mode = CourseMode.verified_mode_for_course(course_key)
-            if not course_mode:
-                course_mode = CourseMode.DEFAULT_MODE
-            return Group(ENROLLMENT_GROUP_IDS[course_mode.slug], unicode(course_mode.name))
+            return cls._get_group_for_mode(course_key, mode_slug)
         else:
             return None
 
+    @classmethod
+    def get_groups_for_users(cls, course_key, users, user_partitions, **kwargs):  # pylint: disable=unused-argument
+        """
+        Returns the Groups from the specified user partitions to which the
+        users are assigned via their enrollment modes, as a dict of
+        {partition_id: {user_id: Group}}, with the same rules as
+        get_group_for_user but with a single query for all the users.
+
+        Users who aren't in a group of a partition are absent from its dict.
+        """
+        groups = {user_partition.id: {} for user_partition in user_partitions}
+        if is_course_using_cohort_instead(course_key):
+            return groups
+
+        enrolled_users = []
+        for user in users:
+            if get_course_masquerade(user, course_key) and not is_masquerading_as_specific_student(user, course_key):
+                for user_partition in user_partitions:
+                    group = get_masquerading_user_group(course_key, user, user_partition)
+                    if group is not None:
+                        groups[user_partition.id][user.id] = group
+            else:
+                enrolled_users.append(user)
+
+        # The users of a mode share its Group.
+        groups_by_mode = {}
+        enrollment_states = CourseEnrollment.enrollment_states_for_users(enrolled_users, course_key)
+        for user_id, (mode_slug, is_active) in enrollment_states.iteritems():
+            if mode_slug and is_active:
+                if mode_slug not in groups_by_mode:
+                    groups_by_mode[mode_slug] = cls._get_group_for_mode(course_key, mode_slug)
+                for user_partition in user_partitions:
+                    groups[user_partition.id][user_id] = groups_by_mode[mode_slug]
+        return groups
+
+    @classmethod
+    def _get_group_for_mode(cls, course_key, mode_slug):
+        """
+        Returns the Group of the learners enrolled in the given mode. The
+        Credit mode is mapped to the Verified or Professional mode of the course.
+        """
+        course_mode = CourseMode.mode_for_course(
+            course_key,
+            mode_slug,
+            modes=CourseMode.modes_for_course(course_key, include_expired=True, only_selectable=False),
+        )
+        if course_mode and CourseMode.is_credit_mode(course_mode):
+            course_mode = CourseMode.verified_mode_for_course(course_key)
+        if not course_mode:
+            course_mode = CourseMode.DEFAULT_MODE
+        return Group(ENROLLMENT_GROUP_IDS[course_mode.slug], unicode(course_mode.name))
+
     @classmethod
     def create_user_partition(cls, id, name, description, groups=None, parameters=None, active=True):  # pylint: disable=redefined-builtin, invalid-name, unused-argument
         """
@@ -151,6 +151,25 @@ class EnrollmentTrackPartitionSchemeTest(SharedModuleStoreTestCase):
         CourseEnrollment.enroll(self.student, self.course.id)
         self.assertIsNone(self._get_user_group())
 
+    def test_get_groups_for_users(self):
+        create_mode(self.course, CourseMode.VERIFIED, "Verified Enrollment Track", min_price=1)
+        create_mode(self.course, CourseMode.CREDIT_MODE, "Credit Enrollment Track", min_price=1)
+        students = [UserFactory() for _ in range(4)]
+        CourseEnrollment.enroll(students[0], self.course.id)
+        CourseEnrollment.enroll(students[1], self.course.id, mode=CourseMode.VERIFIED)
+        CourseEnrollment.enroll(students[2], self.course.id, mode=CourseMode.CREDIT_MODE)
+
+        user_partition = create_enrollment_track_partition(self.course)
+        groups = user_partition.scheme.get_groups_for_users(self.course.id, students, [user_partition])
+        self.assertEqual(
+            {user_id: group.name for user_id, group in groups[user_partition.id].iteritems()},
+            {
+                students[0].id: "Audit",
+                students[1].id: "Verified Enrollment Track",
+                students[2].id: "Verified Enrollment Track",
+            }
+        )
+
     def _get_user_group(self):
         """
         Gets the group the user is assigned to.